@@ -1,21 +1,25 @@
 import csv
 from datetime import datetime
+from enum import Enum
 import os
 from types import SimpleNamespace
 from typing import List, Optional
 
 import typer
 from importlib.metadata import version as _version
-from bfcl_eval._llm_response_generation import main as generation_main
 from bfcl_eval.constants.category_mapping import TEST_COLLECTION_MAPPING
 from bfcl_eval.constants.eval_config import (
+    CACHE_MODES,
     DOTENV_PATH,
+    EXECUTION_MODES,
+    HEDGE_MAX_RATE,
     PROJECT_ROOT,
     RESULT_PATH,
+    SCHEDULING_POLICIES,
     SCORE_PATH,
+    STATE_LOG_FORMATS,
 )
 from bfcl_eval.constants.model_config import MODEL_CONFIG_MAPPING
-from bfcl_eval.eval_checker.eval_runner import main as evaluation_main
 from dotenv import load_dotenv
 from tabulate import tabulate
 
@@ -57,6 +61,20 @@ def handle_multiple_input(input_str):
 
     return [item.strip() for item in ",".join(input_str).split(",") if item.strip()]
 
+
+def choice_enum(name, values):
+    """
+    Build a string enum from a list of allowed values, so that typer rejects anything else at the command line.
+    """
+    return Enum(name, {value: value for value in values}, type=str)
+
+
+ExecutionMode = choice_enum("ExecutionMode", EXECUTION_MODES)
+SchedulingPolicy = choice_enum("SchedulingPolicy", SCHEDULING_POLICIES)
+StateLogFormat = choice_enum("StateLogFormat", STATE_LOG_FORMATS)
+CacheMode = choice_enum("CacheMode", CACHE_MODES)
+
+
 @cli.command()
 def version():
     """
@@ -120,6 +138,69 @@ def generate(
     ),
     num_gpus: int = typer.Option(1, help="The number of GPUs to use."),
     num_threads: Optional[int] = typer.Option(None, help="The number of threads to use."),
+    execution_mode: ExecutionMode = typer.Option(
+        "thread",
+        help="How to keep requests in flight: 'thread' runs one blocking request per worker thread; 'async' drives all requests from a single event loop, with `--num-threads` as the maximum number of in-flight requests.",
+    ),
+    adaptive_concurrency: bool = typer.Option(
+        False,
+        "--adaptive-concurrency",
+        help="Adjust the number of in-flight requests at runtime (AIMD): grow it while latency stays healthy and halve it on rate-limit backoffs or timeouts. `--num-threads` becomes the starting point.",
+    ),
+    max_concurrency: Optional[int] = typer.Option(
+        None, help="Upper bound for `--adaptive-concurrency`."
+    ),
+    scheduling_policy: SchedulingPolicy = typer.Option(
+        "default",
+        help="Order in which ready test cases are dispatched: 'default', 'prefix-affinity' or 'critical-path'. 'prefix-affinity' dispatches locally-hosted model entries that share the same system prompt and tool block back-to-back, to keep the server's prefix cache hot. 'critical-path' starts the entries with the longest expected latency (including their dependency chains) first, based on the latencies recorded in previous runs.",
+    ),
+    work_queue: Optional[str] = typer.Option(
+        None,
+        help="Share the run with every other `bfcl generate` process started with the same queue name and result directory (possibly on other hosts). Test cases are claimed from a lease-based queue, so no work is duplicated, and the test cases of a worker that dies are picked up by the others.",
+    ),
+    predict_makespan: bool = typer.Option(
+        False,
+        "--predict-makespan",
+        help="Dry run: print the predicted end-to-end generation time of the 'default' and 'critical-path' policies for `--num-threads`, and exit without generating anything.",
+    ),
+    prompt_batch_size: int = typer.Option(
+        1,
+        help="For locally-hosted models, coalesce up to this many ready single-turn prompts into one multi-prompt Completions request. 1 disables batching.",
+    ),
+    state_log_format: StateLogFormat = typer.Option(
+        "full",
+        help="How the backend state of multi-turn entries is logged: 'full' logs the complete state after every turn; 'delta' logs it once, followed by a JSON Patch per turn.",
+    ),
+    requests_per_minute: Optional[float] = typer.Option(
+        None,
+        help="Requests-per-minute quota of the provider account. Requests are paced to stay just under it, shared by all models of the same account.",
+    ),
+    tokens_per_minute: Optional[float] = typer.Option(
+        None,
+        help="Tokens-per-minute quota of the provider account. Each request is charged its estimated prompt size up front and corrected with the reported usage.",
+    ),
+    request_deadline: Optional[float] = typer.Option(
+        None,
+        help="Abandon a model request that has not answered after this many seconds, and record the test case as a timeout error. By default, requests have no deadline.",
+    ),
+    hedge_requests: bool = typer.Option(
+        False,
+        "--hedge-requests",
+        help="Send a duplicate of a model request that is still running after the p95 latency observed so far for its test category, and take whichever answers first.",
+    ),
+    max_hedge_rate: float = typer.Option(
+        HEDGE_MAX_RATE,
+        help="With --hedge-requests, the maximum fraction of requests that get a duplicate.",
+    ),
+    cache_mode: CacheMode = typer.Option(
+        "off",
+        help="Cache model responses on disk, keyed by the full request: one of 'off', 'read', 'write', 'readwrite'. 'read' replays cached responses, 'write' records new ones, 'readwrite' does both.",
+    ),
+    concurrent_models: bool = typer.Option(
+        False,
+        "--concurrent-models",
+        help="When several models are given, generate all API models concurrently in one scheduler, each with its own `--num-threads` budget. Locally-hosted models still run one at a time.",
+    ),
     gpu_memory_utilization: float = typer.Option(0.9, help="The GPU memory utilization."),
     backend: str = typer.Option("sglang", help="The backend to use for the model."),
     skip_server_setup: bool = typer.Option(
@@ -176,6 +257,21 @@ def generate(
         exclude_state_log=exclude_state_log,
         num_gpus=num_gpus,
         num_threads=num_threads,
+        execution_mode=execution_mode.value,
+        adaptive_concurrency=adaptive_concurrency,
+        max_concurrency=max_concurrency,
+        concurrent_models=concurrent_models,
+        scheduling_policy=scheduling_policy.value,
+        predict_makespan=predict_makespan,
+        work_queue=work_queue,
+        prompt_batch_size=prompt_batch_size,
+        state_log_format=state_log_format.value,
+        requests_per_minute=requests_per_minute,
+        tokens_per_minute=tokens_per_minute,
+        request_deadline=request_deadline,
+        hedge_requests=hedge_requests,
+        max_hedge_rate=max_hedge_rate,
+        cache_mode=cache_mode.value,
         gpu_memory_utilization=gpu_memory_utilization,
         backend=backend,
         skip_server_setup=skip_server_setup,
@@ -187,6 +283,9 @@ def generate(
         max_lora_rank=max_lora_rank,
         lora_modules=lora_modules,
     )
+    # Imported here rather than at the top, so that the other commands (and `--help`) don't pay for the generation pipeline and its dependencies
+    from bfcl_eval._llm_response_generation import main as generation_main
+
     load_dotenv(dotenv_path=DOTENV_PATH, verbose=True, override=True)  # Load the .env file
     generation_main(args)
 
@@ -274,13 +373,33 @@ def evaluate(
         "--partial-eval",
         help="Run evaluation on a partial set of benchmark entries (eg. entries present in the model result files) without raising for missing IDs.",
     ),
+    eval_workers: int = typer.Option(
+        1,
+        "--eval-workers",
+        help="Number of worker processes used to evaluate the multi-turn categories. The score files are the same as with a single process.",
+    ),
+    ground_truth_disk_cache: bool = typer.Option(
+        False,
+        "--ground-truth-disk-cache",
+        help="Also store the ground-truth execution of the multi-turn entries on disk, so that it is shared by the worker processes and reused by later evaluation runs.",
+    ),
 ):
     """
     Evaluate results from run of one or more models on a test-category (same as eval_runner.py).
     """
 
+    from bfcl_eval.eval_checker.eval_runner import main as evaluation_main
+
     load_dotenv(dotenv_path=DOTENV_PATH, verbose=True, override=True)  # Load the .env file
-    evaluation_main(model, test_category, result_dir, score_dir, partial_eval)
+    evaluation_main(
+        model,
+        test_category,
+        result_dir,
+        score_dir,
+        partial_eval,
+        eval_workers=eval_workers,
+        ground_truth_disk_cache=ground_truth_disk_cache,
+    )
 
 
 @cli.command()
@@ -0,0 +1,332 @@
+import heapq
+import threading
+import time
+from collections import defaultdict, deque
+from typing import Callable, Optional
+
+from bfcl_eval.utils import sort_key
+
+
+class DependencyScheduler:
+    """
+    Track the `depends_on` relationship between test cases and hand out the ones that are ready to run.
+
+    Ready test cases are kept in a heap ordered by `_priority` (`sort_key` by default). A test case becomes ready once all of its dependencies have been marked as completed. The scheduler itself does not run anything; it is shared by the thread-based and the asyncio-based generation loops so that both dispatch work in exactly the same order.
+    """
+
+    def __init__(self, test_cases: list[dict]) -> None:
+        self.id_to_test_case = {test_case["id"]: test_case for test_case in test_cases}
+        self.dependencies = {
+            test_case["id"]: set(test_case.get("depends_on", [])) for test_case in test_cases
+        }
+        self.children_of = defaultdict(list)
+        for test_case in test_cases:
+            for dependency_id in test_case.get("depends_on", []):
+                self.children_of[dependency_id].append(test_case["id"])
+
+        self.completed = set()
+        self.ready_queue = [
+            (self._priority(test_case_id), test_case_id)
+            for test_case_id, dependency_ids in self.dependencies.items()
+            if not dependency_ids
+        ]
+        heapq.heapify(self.ready_queue)
+
+    def _priority(self, test_case_id: str):
+        return sort_key(self.id_to_test_case[test_case_id])
+
+    def __len__(self) -> int:
+        return len(self.id_to_test_case)
+
+    def has_ready(self) -> bool:
+        return len(self.ready_queue) > 0
+
+    def pop_ready(self) -> dict:
+        _, test_case_id = heapq.heappop(self.ready_queue)
+        return self.id_to_test_case[test_case_id]
+
+    def summary(self) -> Optional[str]:
+        """
+        One-line description of how the work was dispatched, printed at the end of the run. None if there is nothing to report.
+        """
+        return None
+
+    def awaiting_remote_work(self) -> bool:
+        """
+        Whether more work may become ready later even though nothing is ready or in flight locally (eg, when other processes share the work).
+        """
+        return False
+
+    def close(self) -> None:
+        pass
+
+    def mark_written(self, test_case_ids: list[str]) -> None:
+        """
+        Record that the results of the test cases have been written to the result files. Called from the result writer thread.
+        """
+        pass
+
+    def mark_completed(self, test_case_id: str) -> None:
+        """
+        Record that a test case has finished and unlock any children whose dependencies are now all satisfied.
+        """
+        self.completed.add(test_case_id)
+        for child_id in self.children_of[test_case_id]:
+            self.dependencies[child_id].discard(test_case_id)
+            if not self.dependencies[child_id]:
+                heapq.heappush(self.ready_queue, (self._priority(child_id), child_id))
+
+
+class CriticalPathScheduler(DependencyScheduler):
+    """
+    Dependency scheduler that dispatches the test cases on the longest expected path first.
+
+    With `sort_key` order, long multi-turn and long-context entries (and the heads of memory prerequisite chains) often start last, leaving a single straggler running for minutes while every other worker sits idle. Here, each test case is prioritized by its expected latency plus that of the longest chain of test cases that depend on it (its "bottom level" in the `depends_on` graph), which is the classic longest-processing-time-first heuristic extended to dependency chains.
+
+    `expected_latency(test_case)` usually comes from `LatencyHistory.estimator`, ie the latencies recorded in previous runs.
+    """
+
+    def __init__(
+        self, test_cases: list[dict], expected_latency: Callable[[dict], float]
+    ) -> None:
+        self.expected_latency = {
+            test_case["id"]: expected_latency(test_case) for test_case in test_cases
+        }
+        self.critical_path = self._compute_critical_path(test_cases)
+        super().__init__(test_cases)
+
+    def _compute_critical_path(self, test_cases: list[dict]) -> dict[str, float]:
+        children_of = defaultdict(list)
+        for test_case in test_cases:
+            for dependency_id in test_case.get("depends_on", []):
+                children_of[dependency_id].append(test_case["id"])
+
+        critical_path = {}
+        for test_case_id in self.expected_latency:
+            # Iterative post-order traversal, as prerequisite chains can be long
+            stack = [(test_case_id, False)]
+            while stack:
+                current_id, children_done = stack.pop()
+                if current_id in critical_path:
+                    continue
+                if not children_done:
+                    stack.append((current_id, True))
+                    stack.extend(
+                        (child_id, False)
+                        for child_id in children_of[current_id]
+                        if child_id not in critical_path
+                    )
+                    continue
+                critical_path[current_id] = self.expected_latency[current_id] + max(
+                    (critical_path[child_id] for child_id in children_of[current_id]),
+                    default=0.0,
+                )
+        return critical_path
+
+    def _priority(self, test_case_id: str):
+        return (-self.critical_path[test_case_id], sort_key(self.id_to_test_case[test_case_id]))
+
+    def lower_bound(self, num_workers: int) -> float:
+        """
+        No schedule on `num_workers` workers can finish faster than this.
+        """
+        return max(
+            sum(self.expected_latency.values()) / num_workers,
+            max(self.critical_path.values(), default=0.0),
+        )
+
+
+def simulate_makespan(
+    scheduler: DependencyScheduler,
+    expected_latency: Callable[[dict], float],
+    num_workers: int,
+) -> float:
+    """
+    Replay the dispatch loop with `num_workers` in-flight slots, assuming every test case takes exactly its expected latency, and return the predicted end-to-end time. The scheduler is consumed in the process.
+    """
+    now = 0.0
+    running = []
+    while scheduler.has_ready() or running:
+        while scheduler.has_ready() and len(running) < num_workers:
+            test_case = scheduler.pop_ready()
+            heapq.heappush(running, (now + expected_latency(test_case), test_case["id"]))
+        now, test_case_id = heapq.heappop(running)
+        scheduler.mark_completed(test_case_id)
+    return now
+
+
+class PrefixAffinityScheduler(DependencyScheduler):
+    """
+    Dependency scheduler that dispatches test cases sharing the same prompt prefix back-to-back.
+
+    Locally-hosted models are served by vLLM/SGLang, which keep the KV cache of recently seen prompt prefixes around (automatic prefix caching / radix cache). Many test cases only differ in their last user message: live categories reuse the same function doc across many prompts, and multi-turn entries share the docs of their involved classes. Dispatching them in `sort_key` order interleaves unrelated prefixes and lets the server evict a prefix before it is reused.
+
+    Ready test cases are grouped by `prefix_key_fn(test_case)` (eg, a hash of the rendered system prompt and tool block). Once a group is started, it is drained before switching to the group whose first test case comes earliest in `sort_key` order. The dependency handling is the same as in `DependencyScheduler`; `ready_queue` only stages newly ready test cases until the next `pop_ready`, so the prefix keys are computed lazily, after the model's tokenizer and server are up. The key of each test case is computed once, and the groups are picked from a heap of their first test cases, so a pop costs O(log ready) however many groups there are.
+    """
+
+    def __init__(self, test_cases: list[dict], prefix_key_fn: Callable[[dict], str]) -> None:
+        super().__init__(test_cases)
+        self.prefix_key_fn = prefix_key_fn
+        self.ready_groups: dict[str, list] = {}
+        # (first entry, prefix key) of the groups; stale once the group's first entry changed
+        self.group_heads = []
+        self.current_group = None
+        self.prefix_key_of: dict[str, str] = {}
+        self.prefix_keys = set()
+        self.group_switches = 0
+
+    def _get_prefix_key(self, test_case_id: str) -> str:
+        prefix_key = self.prefix_key_of.get(test_case_id)
+        if prefix_key is None:
+            prefix_key = self.prefix_key_fn(self.id_to_test_case[test_case_id])
+            self.prefix_key_of[test_case_id] = prefix_key
+            self.prefix_keys.add(prefix_key)
+        return prefix_key
+
+    def has_ready(self) -> bool:
+        return len(self.ready_queue) > 0 or len(self.ready_groups) > 0
+
+    def pop_ready(self) -> dict:
+        # Bucket the newly ready test cases
+        for entry in self.ready_queue:
+            prefix_key = self._get_prefix_key(entry[1])
+            group = self.ready_groups.setdefault(prefix_key, [])
+            heapq.heappush(group, entry)
+            if group[0] is entry:
+                heapq.heappush(self.group_heads, (entry, prefix_key))
+        self.ready_queue.clear()
+
+        if self.current_group not in self.ready_groups:
+            while True:
+                head, prefix_key = heapq.heappop(self.group_heads)
+                group = self.ready_groups.get(prefix_key)
+                if group and group[0] == head:
+                    break
+            self.current_group = prefix_key
+            self.group_switches += 1
+
+        group = self.ready_groups[self.current_group]
+        _, test_case_id = heapq.heappop(group)
+        if not group:
+            del self.ready_groups[self.current_group]
+        return self.id_to_test_case[test_case_id]
+
+    def summary(self) -> Optional[str]:
+        return (
+            f"Prefix-affinity scheduling: {len(self.id_to_test_case)} test cases in "
+            f"{len(self.prefix_keys)} prefix groups, {self.group_switches} group switches."
+        )
+
+
+class AdaptiveConcurrencyController:
+    """
+    Additive-increase / multiplicative-decrease (AIMD) controller for the number of in-flight requests.
+
+    The limit grows by `additive_increase` after every `limit` consecutive healthy completions (roughly once per round trip of the whole window), and shrinks by `multiplicative_decrease` whenever the provider signals congestion (a rate-limit backoff or a timeout). Growth is put on hold while the smoothed request latency is more than `latency_tolerance` times its best observed value, since rising latency is usually the first sign of queueing on the provider side.
+
+    All methods are thread-safe, as completions are reported from the scheduler loop while backoff events are reported from worker threads.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 1,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        additive_increase: int = 1,
+        multiplicative_decrease: float = 0.5,
+        latency_tolerance: float = 2.0,
+        latency_smoothing: float = 0.2,
+        throughput_window: float = 30.0,
+    ) -> None:
+        self.min_limit = min_limit
+        self.max_limit = max(max_limit, min_limit)
+        self.additive_increase = additive_increase
+        self.multiplicative_decrease = multiplicative_decrease
+        self.latency_tolerance = latency_tolerance
+        self.latency_smoothing = latency_smoothing
+        self.throughput_window = throughput_window
+
+        self._limit = min(max(initial_limit, min_limit), self.max_limit)
+        self._healthy_streak = 0
+        self._smoothed_latency = None
+        self._baseline_latency = None
+        # Requests dispatched before the last decrease must not trigger another one, otherwise a single burst of 429s would collapse the limit to the minimum
+        self._last_decrease_time = 0.0
+        self._completion_times = deque()
+        self._created_time = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    def record_success(self, latency: float, start_time: float) -> None:
+        """
+        Report a request that completed without congestion. `start_time` is the `time.monotonic()` value at dispatch.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._completion_times.append(now)
+
+            if self._smoothed_latency is None:
+                self._smoothed_latency = latency
+            else:
+                self._smoothed_latency += self.latency_smoothing * (
+                    latency - self._smoothed_latency
+                )
+            # Let the baseline drift upwards slowly, so that a switch to a slower test category does not stall growth forever
+            if self._baseline_latency is None:
+                self._baseline_latency = self._smoothed_latency
+            else:
+                self._baseline_latency = min(
+                    self._smoothed_latency, self._baseline_latency * 1.01
+                )
+
+            if start_time < self._last_decrease_time:
+                return
+            if self._smoothed_latency > self.latency_tolerance * self._baseline_latency:
+                self._healthy_streak = 0
+                return
+
+            self._healthy_streak += 1
+            if self._healthy_streak >= self._limit:
+                self._limit = min(self._limit + self.additive_increase, self.max_limit)
+                self._healthy_streak = 0
+
+    def record_congestion(self, start_time: Optional[float] = None) -> None:
+        """
+        Report a rate-limit or timeout signal. `start_time` is the dispatch time of the affected request, if known.
+        """
+        with self._lock:
+            if start_time is not None and start_time < self._last_decrease_time:
+                return
+            now = time.monotonic()
+            # Backoff events carry no dispatch time; treat events within one smoothed latency of the last decrease as part of the same burst
+            if (
+                start_time is None
+                and self._smoothed_latency is not None
+                and now - self._last_decrease_time < self._smoothed_latency
+            ):
+                return
+            self._limit = max(
+                int(self._limit * self.multiplicative_decrease), self.min_limit
+            )
+            self._healthy_streak = 0
+            self._last_decrease_time = now
+
+    def throughput(self) -> float:
+        """
+        Completed requests per second over the last `throughput_window` seconds.
+        """
+        with self._lock:
+            now = time.monotonic()
+            while (
+                self._completion_times
+                and now - self._completion_times[0] > self.throughput_window
+            ):
+                self._completion_times.popleft()
+            elapsed = min(now - self._created_time, self.throughput_window)
+            return len(self._completion_times) / max(elapsed, 1e-6)
+
+    def postfix(self) -> dict:
+        return {"limit": self.limit, "req/s": f"{self.throughput():.2f}"}
@@ -1,27 +1,49 @@
 import argparse
-import heapq
+import asyncio
 import multiprocessing as mp
 import os
-import queue
 import shutil
-import threading
+import time
 import traceback
-from collections import defaultdict
 from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from copy import deepcopy
+from dataclasses import dataclass
 from typing import Optional
 
+from bfcl_eval._generation_scheduler import (
+    AdaptiveConcurrencyController,
+    CriticalPathScheduler,
+    DependencyScheduler,
+    PrefixAffinityScheduler,
+    simulate_makespan,
+)
 from bfcl_eval.constants.eval_config import (
+    CACHE_MODES,
+    EXECUTION_MODES,
     PROJECT_ROOT,
     RESULT_FILE_PATTERN,
     RESULT_PATH,
+    SCHEDULING_POLICIES,
+    STATE_LOG_FORMATS,
     TEST_IDS_TO_GENERATE_PATH,
 )
 from bfcl_eval.constants.model_config import MODEL_CONFIG_MAPPING
-from bfcl_eval.eval_checker.eval_runner_helper import load_file
+from bfcl_eval.eval_checker.multi_turn_eval.multi_turn_utils import backend_session_store
 from bfcl_eval.model_handler.base_handler import BaseHandler
 from bfcl_eval.model_handler.local_inference.base_oss_handler import OSSHandler
+from bfcl_eval.model_handler.rate_limiter import get_rate_limiter, rate_limit_key
+from bfcl_eval.model_handler.request_hedging import HedgingPolicy, track_query_stats
+from bfcl_eval.model_handler.response_cache import ResponseCache
+from bfcl_eval.model_handler.utils import add_backoff_listener, remove_backoff_listener
+from bfcl_eval.result_store import (
+    LATENCY_HISTORY_FILE_NAME,
+    BatchedResultWriter,
+    CompletionManifest,
+    LatencyHistory,
+    compact_result_journals,
+)
 from bfcl_eval.utils import *
+from bfcl_eval.work_queue import WorkQueue, WorkQueueScheduler
 from tqdm import tqdm
 
 
@@ -37,6 +59,100 @@ def get_args():
     parser.add_argument("--include-input-log", action="store_true", default=False)
     parser.add_argument("--exclude-state-log", action="store_true", default=False)
     parser.add_argument("--num-threads", required=False, type=int)
+    parser.add_argument(
+        "--execution-mode",
+        default="thread",
+        type=str,
+        choices=EXECUTION_MODES,
+        help="How to keep requests in flight. `thread` runs one blocking request per worker thread; `async` drives all requests from a single event loop, and `--num-threads` becomes the maximum number of in-flight requests.",
+    )
+    parser.add_argument(
+        "--adaptive-concurrency",
+        action="store_true",
+        default=False,
+        help="Adjust the number of in-flight requests at runtime (AIMD): grow it while latency stays healthy and halve it on rate-limit backoffs or timeouts. `--num-threads` becomes the starting point.",
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        required=False,
+        type=int,
+        help="Upper bound for `--adaptive-concurrency`.",
+    )
+    parser.add_argument(
+        "--concurrent-models",
+        action="store_true",
+        default=False,
+        help="When several `--model` values are given, generate all API models concurrently in one scheduler, each with its own `--num-threads` budget. Locally-hosted models still run one at a time.",
+    )
+    parser.add_argument(
+        "--scheduling-policy",
+        default="default",
+        type=str,
+        choices=SCHEDULING_POLICIES,
+        help="Order in which ready test cases are dispatched. `default` follows the test category and index; `prefix-affinity` dispatches locally-hosted model entries that share the same system prompt and tool block back-to-back, to keep the server's prefix cache hot; `critical-path` starts the entries with the longest expected latency (including their `depends_on` chains) first, based on the latencies recorded in previous runs.",
+    )
+    parser.add_argument(
+        "--work-queue",
+        default=None,
+        type=str,
+        help="Share the run with every other `bfcl generate` process started with the same queue name and the same result directory (possibly on other hosts, through a shared file system). Test cases are claimed from a lease-based queue under the lock directory, so no work is duplicated, and the test cases of a worker that dies are picked up by the others.",
+    )
+    parser.add_argument(
+        "--predict-makespan",
+        action="store_true",
+        default=False,
+        help="Dry run: print the predicted end-to-end generation time of the `default` and `critical-path` policies for `--num-threads`, based on the latencies recorded in previous runs, and exit without generating anything.",
+    )
+    parser.add_argument(
+        "--prompt-batch-size",
+        default=1,
+        type=int,
+        help="For locally-hosted models, coalesce up to this many ready single-turn prompts into one multi-prompt Completions request. `1` disables batching.",
+    )
+    parser.add_argument(
+        "--state-log-format",
+        default="full",
+        type=str,
+        choices=STATE_LOG_FORMATS,
+        help="How the backend state of multi-turn entries is logged when the state log is not excluded. `full` logs the complete state after every turn; `delta` logs it once, followed by a JSON Patch per turn (use `bfcl_eval.scripts.expand_state_log` to get the full log back).",
+    )
+    parser.add_argument(
+        "--requests-per-minute",
+        default=None,
+        type=float,
+        help="Requests-per-minute quota of the provider account. Requests are paced to stay just under it, shared by all models of the same account.",
+    )
+    parser.add_argument(
+        "--tokens-per-minute",
+        default=None,
+        type=float,
+        help="Tokens-per-minute quota of the provider account. Each request is charged its estimated prompt size up front and corrected with the reported usage.",
+    )
+    parser.add_argument(
+        "--request-deadline",
+        default=None,
+        type=float,
+        help="Abandon a model request that has not answered after this many seconds, and record the test case as a timeout error. By default, requests have no deadline.",
+    )
+    parser.add_argument(
+        "--hedge-requests",
+        action="store_true",
+        default=False,
+        help="Send a duplicate of a model request that is still running after the p95 latency observed so far for its test category, and take whichever answers first.",
+    )
+    parser.add_argument(
+        "--max-hedge-rate",
+        default=HEDGE_MAX_RATE,
+        type=float,
+        help="With `--hedge-requests`, the maximum fraction of requests that get a duplicate.",
+    )
+    parser.add_argument(
+        "--cache-mode",
+        default="off",
+        type=str,
+        choices=CACHE_MODES,
+        help="Cache model responses on disk, keyed by the full request. `read` replays cached responses, `write` records new ones, `readwrite` does both.",
+    )
     parser.add_argument("--num-gpus", default=1, type=int)
     parser.add_argument("--backend", default="vllm", type=str, choices=["vllm", "sglang"])
     parser.add_argument("--gpu-memory-utilization", default=0.9, type=float)
@@ -83,7 +199,7 @@ def get_args():
 
 def build_handler(model_name, temperature):
     config = MODEL_CONFIG_MAPPING[model_name]
-    handler = config.model_handler(
+    handler = config.get_handler_class()(
         model_name=config.model_name,
         temperature=temperature,
         registry_name=model_name,
@@ -114,7 +230,11 @@ def collect_test_cases(args, model_name, all_test_categories, all_test_entries_i
     model_name_dir = model_name.replace("/", "_")
     model_result_dir = args.result_dir / model_name_dir
 
-    existing_result = []
+    # A previous run in update mode might have been interrupted before its journal was merged
+    compact_result_journals(model_result_dir)
+
+    completion_manifest = CompletionManifest(model_result_dir)
+    existing_ids = set()
     for test_category in all_test_categories:
         # TODO: Simplify the handling of memory prerequisite entries/categories
         result_file_paths = [
@@ -134,7 +254,7 @@ def collect_test_cases(args, model_name, all_test_categories, all_test_entries_i
             if file_path.exists():
                 # Not allowing overwrite, we will load the existing results
                 if not args.allow_overwrite:
-                    existing_result.extend(load_file(file_path))
+                    existing_ids.update(completion_manifest.get_ids(file_path))
                 # Allow overwrite and not running specific test ids, we will delete the existing result file before generating new results
                 elif not args.run_ids:
                     file_path.unlink()
@@ -155,10 +275,11 @@ def collect_test_cases(args, model_name, all_test_categories, all_test_entries_i
                     # It's not implemented yet, but it won't affect the accuracy, as those files will be overwritten anyway (assume generation success)
                     pass
 
-    existing_ids = [entry["id"] for entry in existing_result]
+    completion_manifest.save()
 
+    # Shallow copies are enough, as the steps below only reassign top-level keys (eg, `depends_on`, `initial_config`)
     test_cases_to_generate = [
-        test_case
+        dict(test_case)
         for test_case in all_test_entries_involved
         if test_case["id"] not in existing_ids
     ]
@@ -186,46 +307,194 @@ def collect_test_cases(args, model_name, all_test_categories, all_test_entries_i
     return sorted(test_cases_to_generate, key=sort_key)
 
 
-def multi_threaded_inference(handler, test_case, include_input_log, exclude_state_log):
+def multi_threaded_inference(
+    handler, test_case, include_input_log, exclude_state_log, controller=None
+):
 
     assert type(test_case["function"]) is list
 
-    try:
-        result, metadata = handler.inference(
-            test_case, include_input_log, exclude_state_log
-        )
-    except Exception as e:
-        # This is usually the case when the model getting stuck on one particular test case.
-        # For example, timeout error or FC model returning invalid JSON response.
-        # Since temperature is already set to 0.001, retrying the same test case will not help.
-        # So we continue the generation process and record the error message as the model response
-        error_block = (
-            "-" * 100
-            + "\n❗️❗️ Error occurred during inference. Continuing to next test case.\n"
-            + f"❗️❗️ Test case ID: {test_case['id']}, Error: {str(e)}\n"
-            + traceback.format_exc(limit=10)
-            + "-" * 100
-        )
-        tqdm.write(error_block)
+    start_time = time.monotonic()
+    with track_query_stats(test_case["id"]) as query_stats:
+        try:
+            result, metadata = handler.inference(
+                test_case, include_input_log, exclude_state_log
+            )
+            if controller is not None:
+                controller.record_success(time.monotonic() - start_time, start_time)
+        except Exception as e:
+            result, metadata = _handle_inference_error(test_case, e, controller, start_time)
 
-        result = f"Error during inference: {str(e)}"
-        metadata = {"traceback": traceback.format_exc()}
+    result_to_write = {
+        "id": test_case["id"],
+        "result": result,
+        **metadata,
+        **query_stats.to_metadata(),
+    }
+
+    return result_to_write
+
+
+async def async_inference(
+    handler, test_case, include_input_log, exclude_state_log, controller=None
+):
+    """
+    Asyncio counterpart of `multi_threaded_inference`, used by the `async` execution mode.
+    """
+
+    assert type(test_case["function"]) is list
+
+    start_time = time.monotonic()
+    with track_query_stats(test_case["id"]) as query_stats:
+        try:
+            result, metadata = await handler.inference_async(
+                test_case, include_input_log, exclude_state_log
+            )
+            if controller is not None:
+                controller.record_success(time.monotonic() - start_time, start_time)
+        except Exception as e:
+            result, metadata = _handle_inference_error(test_case, e, controller, start_time)
 
     result_to_write = {
         "id": test_case["id"],
         "result": result,
         **metadata,
+        **query_stats.to_metadata(),
     }
 
     return result_to_write
 
 
-def generate_results(args, model_name, test_cases_total):
+def _is_timeout_error(e: Exception) -> bool:
+    # Covers the builtin TimeoutError as well as the client-specific ones (openai.APITimeoutError, httpx.TimeoutException, requests.Timeout, ...)
+    return isinstance(e, TimeoutError) or "timeout" in type(e).__name__.lower()
+
+
+def _handle_inference_error(test_case, e, controller=None, start_time=None):
+    if controller is not None and _is_timeout_error(e):
+        controller.record_congestion(start_time)
+
+    # This is usually the case when the model getting stuck on one particular test case.
+    # For example, timeout error or FC model returning invalid JSON response.
+    # Since temperature is already set to 0.001, retrying the same test case will not help.
+    # So we continue the generation process and record the error message as the model response
+    error_block = (
+        "-" * 100
+        + "\n❗️❗️ Error occurred during inference. Continuing to next test case.\n"
+        + f"❗️❗️ Test case ID: {test_case['id']}, Error: {str(e)}\n"
+        + traceback.format_exc(limit=10)
+        + "-" * 100
+    )
+    tqdm.write(error_block)
+
+    result = f"Error during inference: {str(e)}"
+    metadata = {"traceback": traceback.format_exc()}
+
+    return result, metadata
+
+
+def _build_progress_bar(model_name, total, position=0):
+    return tqdm(
+        total=total,
+        desc=f"Generating results for {model_name}",
+        position=position,
+        leave=True,
+        dynamic_ncols=True,
+        mininterval=0.2,
+        smoothing=0.1,
+        bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}{postfix}]",
+    )
+
+
+@dataclass
+class ModelRun:
+    """
+    Per-model state of a generation run: the model's own dependency scheduler, concurrency budget, result writer and progress bar.
+    Several runs can share one scheduler loop, so that models served by different providers are generated concurrently.
+    """
+
+    model_name: str
+    handler: BaseHandler
+    scheduler: DependencyScheduler
+    max_concurrency: int
+    controller: Optional[AdaptiveConcurrencyController] = None
+    result_writer: Optional[BatchedResultWriter] = None
+    pbar: Optional[tqdm] = None
+    in_flight: int = 0
+    # Server-side prefix cache counters at the start of the run, for locally-hosted models
+    prefix_cache_metrics: Optional[dict] = None
+    # Updated with the latency of every generated entry, for the `critical-path` policy of later runs
+    latency_history: Optional[LatencyHistory] = None
+
+    @property
+    def limit(self) -> int:
+        return self.controller.limit if self.controller is not None else self.max_concurrency
+
+    @property
+    def is_oss_model(self) -> bool:
+        return isinstance(self.handler, OSSHandler)
+
+    def on_backoff(self, backoff_handler, error):
+        if backoff_handler is self.handler:
+            self.controller.record_congestion()
+
+    def record_result(self, result_dict: dict) -> None:
+        # Enqueue the result for the writer thread to handle file IO
+        self.result_writer.put(result_dict)
+        self._record_completion(result_dict)
+
+    async def record_result_async(self, result_dict: dict) -> None:
+        # When the writer falls behind, wait for room in its queue off the event loop, so the requests in flight keep progressing
+        if not self.result_writer.try_put(result_dict):
+            await asyncio.get_running_loop().run_in_executor(
+                None, self.result_writer.put, result_dict
+            )
+        self._record_completion(result_dict)
+
+    def _record_completion(self, result_dict: dict) -> None:
+        if self.latency_history is not None:
+            self.latency_history.record(result_dict["id"], result_dict.get("latency"))
+
+        # Update progress bar right after inference completes
+        postfix = self.controller.postfix() if self.controller is not None else {}
+        if backend_session_store.peak_sessions > 0:
+            # Backend instances held by the multi-turn entries in flight
+            postfix.update(backend_session_store.postfix())
+        if postfix:
+            self.pbar.set_postfix(postfix, refresh=False)
+        self.pbar.update()
+
+        # unlock children
+        self.in_flight -= 1
+        self.scheduler.mark_completed(result_dict["id"])
+
+
+def build_model_run(args, model_name, test_cases_total, response_cache=None):
     handler = build_handler(model_name, args.temperature)
+    handler.response_cache = response_cache
+    handler.state_log_format = getattr(args, "state_log_format", "full")
+    if (
+        getattr(args, "requests_per_minute", None) is not None
+        or getattr(args, "tokens_per_minute", None) is not None
+    ):
+        handler.rate_limiter = get_rate_limiter(
+            rate_limit_key(handler),
+            requests_per_minute=args.requests_per_minute,
+            tokens_per_minute=args.tokens_per_minute,
+            utilization=RATE_LIMIT_UTILIZATION,
+            burst_seconds=RATE_LIMIT_BURST_SECONDS,
+        )
+    if getattr(args, "request_deadline", None) is not None or getattr(
+        args, "hedge_requests", False
+    ):
+        handler.hedging_policy = HedgingPolicy(
+            deadline_seconds=args.request_deadline,
+            hedge=args.hedge_requests,
+            max_hedge_rate=getattr(args, "max_hedge_rate", HEDGE_MAX_RATE),
+            quantile=HEDGE_LATENCY_QUANTILE,
+            min_samples=HEDGE_MIN_SAMPLES,
+        )
 
     if isinstance(handler, OSSHandler):
-        handler: OSSHandler
-        is_oss_model = True
         # For OSS models, if the user didn't explicitly set the number of threads,
         # we default to 100 threads to speed up the inference.
         num_threads = (
@@ -234,126 +503,340 @@ def generate_results(args, model_name, test_cases_total):
             else LOCAL_SERVER_MAX_CONCURRENT_REQUEST
         )
     else:
-        handler: BaseHandler
-        is_oss_model = False
         num_threads = args.num_threads if args.num_threads is not None else 1
 
-    # Use a separate thread to write the results to the file to avoid concurrent IO issues
-    def _writer():
-        """Consume result dicts from the queue and write them with exclusive access."""
-        while True:
-            item = write_queue.get()
-            if item is None:
-                break
-            handler.write(item, result_dir=args.result_dir, update_mode=args.run_ids)
-            write_queue.task_done()
+    scheduling_policy = getattr(args, "scheduling_policy", "default")
+    # Reading the latencies out of the existing result files is only worth it when they are used for estimates
+    latency_history = LatencyHistory(
+        args.result_dir / handler.registry_dir_name,
+        bootstrap=scheduling_policy == "critical-path"
+        or getattr(args, "predict_makespan", False),
+    )
+    if scheduling_policy == "critical-path":
+        scheduler = CriticalPathScheduler(
+            test_cases_total,
+            latency_history.estimator(
+                load_fallback_latency_histories(args.result_dir, handler.registry_dir_name)
+            ),
+        )
+    elif scheduling_policy == "prefix-affinity" and isinstance(handler, OSSHandler):
+        scheduler = PrefixAffinityScheduler(test_cases_total, handler.get_prefix_key)
+    else:
+        if scheduling_policy == "prefix-affinity":
+            tqdm.write(
+                f"Prefix-affinity scheduling only applies to locally-hosted models. Using the default policy for {model_name}."
+            )
+        scheduler = DependencyScheduler(test_cases_total)
+
+    if getattr(args, "work_queue", None):
+        # The local policy only decides the priority order of the shared queue
+        scheduler = WorkQueueScheduler(
+            test_cases_total,
+            WorkQueue(
+                WORK_QUEUE_DIR / f"{args.work_queue}.sqlite",
+                model_name=handler.registry_dir_name,
+                lease_seconds=WORK_QUEUE_LEASE_SECONDS,
+            ),
+            order_by=scheduler,
+            poll_interval=WORK_QUEUE_POLL_INTERVAL_SECONDS,
+            # Without `--allow-overwrite`, these are the test cases still missing from the result files, so a rerun with the same queue name picks them up again
+            reset_done=not args.allow_overwrite,
+        )
 
-    write_queue: queue.Queue = queue.Queue()
+    run = ModelRun(
+        model_name=model_name,
+        handler=handler,
+        scheduler=scheduler,
+        max_concurrency=num_threads,
+        latency_history=latency_history,
+    )
+
+    if getattr(args, "adaptive_concurrency", False):
+        # Start from `--num-threads` and let the controller find the provider's limit
+        max_concurrency = (
+            args.max_concurrency
+            if getattr(args, "max_concurrency", None) is not None
+            else ADAPTIVE_CONCURRENCY_MAX_LIMIT
+        )
+        run.controller = AdaptiveConcurrencyController(
+            initial_limit=num_threads, max_limit=max_concurrency
+        )
+        run.max_concurrency = run.controller.max_limit
+
+    return run
+
+
+def load_fallback_latency_histories(result_dir, excluded_model_dir_name):
+    """
+    Latency histories of the other models in `result_dir`, used to estimate test cases that a model has never run.
+    """
+    if not result_dir.exists():
+        return []
+    return [
+        LatencyHistory(model_result_dir, bootstrap=False)
+        for model_result_dir in result_dir.iterdir()
+        if model_result_dir.name != excluded_model_dir_name
+        and (model_result_dir / LATENCY_HISTORY_FILE_NAME).exists()
+    ]
+
+
+def predict_makespan(args, run: ModelRun):
+    """
+    Print the predicted end-to-end time of the `default` and `critical-path` policies for the run's concurrency.
+    """
+    test_cases = list(run.scheduler.id_to_test_case.values())
+    expected_latency = run.latency_history.estimator(
+        load_fallback_latency_histories(args.result_dir, run.handler.registry_dir_name)
+    )
+    num_known = sum(test_case["id"] in run.latency_history.latencies for test_case in test_cases)
+    critical_path_scheduler = CriticalPathScheduler(test_cases, expected_latency)
+    lower_bound = critical_path_scheduler.lower_bound(run.max_concurrency)
+
+    tqdm.write(
+        f"Predicted makespan for {run.model_name} ({len(test_cases)} test cases, {num_known} with a recorded latency, {run.max_concurrency} in flight):"
+    )
+    for policy, scheduler in [
+        ("default", DependencyScheduler(test_cases)),
+        ("critical-path", critical_path_scheduler),
+    ]:
+        makespan = simulate_makespan(scheduler, expected_latency, run.max_concurrency)
+        tqdm.write(f"  {policy:<14} {makespan:10.1f}s")
+    tqdm.write(f"  {'lower bound':<14} {lower_bound:10.1f}s")
 
-    writer_thread = threading.Thread(target=_writer, daemon=True)
-    writer_thread.start()
+
+def generate_results(args, model_name, test_cases_total):
+    generate_results_for_models(args, [build_model_run(args, model_name, test_cases_total)])
+
+
+def generate_results_for_models(args, runs: list[ModelRun]):
+    """
+    Generate results for one or more models in a single scheduler loop.
+    Each model keeps its own concurrency budget and result writer; the models' test cases are interleaved, so the total time is roughly that of the slowest model instead of the sum.
+    """
+    assert sum(run.is_oss_model for run in runs) <= 1, "Only one locally-hosted model can be served at a time."
+    # With a shared work queue, other processes write to the same result files, so results go through the (locked) journal as well
+    journal_results = args.run_ids or bool(getattr(args, "work_queue", None))
 
     try:
-        if is_oss_model:
-            handler.spin_up_local_server(
-                num_gpus=args.num_gpus,
-                gpu_memory_utilization=args.gpu_memory_utilization,
-                backend=args.backend,
-                skip_server_setup=args.skip_server_setup,
-                local_model_path=args.local_model_path,
-                lora_modules=args.lora_modules,
-                enable_lora=args.enable_lora,
-                max_lora_rank=args.max_lora_rank,
-            )
+        for position, run in enumerate(runs):
+            # Use a separate thread to write the results to the file to avoid concurrent IO issues
+            run.result_writer = BatchedResultWriter(
+                run.handler,
+                result_dir=args.result_dir,
+                update_mode=journal_results,
+                max_batch_size=RESULT_WRITER_MAX_BATCH_SIZE,
+                max_batch_delay_ms=RESULT_WRITER_MAX_BATCH_DELAY_MS,
+                max_queue_size=RESULT_WRITER_MAX_QUEUE_SIZE,
+                on_written=lambda batch, scheduler=run.scheduler: scheduler.mark_written(
+                    [result["id"] for result in batch]
+                ),
+            ).start()
+            run.pbar = _build_progress_bar(run.model_name, len(run.scheduler), position)
+            if run.controller is not None:
+                add_backoff_listener(run.on_backoff)
+
+            if run.is_oss_model:
+                run.handler.spin_up_local_server(
+                    num_gpus=args.num_gpus,
+                    gpu_memory_utilization=args.gpu_memory_utilization,
+                    backend=args.backend,
+                    skip_server_setup=args.skip_server_setup,
+                    local_model_path=args.local_model_path,
+                    lora_modules=args.lora_modules,
+                    enable_lora=args.enable_lora,
+                    max_lora_rank=args.max_lora_rank,
+                )
+                run.prefix_cache_metrics = run.handler.get_prefix_cache_metrics()
+                if getattr(args, "prompt_batch_size", 1) > 1:
+                    run.handler.enable_prompt_batching(
+                        max_batch_size=args.prompt_batch_size,
+                        max_batch_delay_ms=PROMPT_BATCH_MAX_DELAY_MS,
+                        max_concurrent_batches=run.max_concurrency,
+                    )
 
-        # ───── dependency bookkeeping ──────────────────────────────
-        dependencies = {
-            test_case["id"]: set(test_case.get("depends_on", []))
-            for test_case in test_cases_total
-        }
-        children_of = defaultdict(list)
-        for test_case in test_cases_total:
-            for dependency_id in test_case.get("depends_on", []):
-                children_of[dependency_id].append(test_case["id"])
-
-        id_to_test_case = {test_case["id"]: test_case for test_case in test_cases_total}
-
-        ready_queue = [
-            (sort_key(id_to_test_case[test_case_id]), test_case_id)
-            for test_case_id, dependency_ids in dependencies.items()
-            if not dependency_ids
-        ]
-        heapq.heapify(ready_queue)
-        in_flight: dict[Future, str] = {}  # future -> test_case_id
-        completed = set()
-
-        with ThreadPoolExecutor(max_workers=num_threads) as pool, tqdm(
-            total=len(test_cases_total),
-            desc=f"Generating results for {model_name}",
-            position=0,
-            leave=True,
-            dynamic_ncols=True,
-            mininterval=0.2,
-            smoothing=0.1,
-            bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]",
-        ) as pbar:
-
-            # seed initial ready tasks
-            while ready_queue and len(in_flight) < num_threads:
-                _, test_case_id = heapq.heappop(ready_queue)
-                test_case = id_to_test_case[test_case_id]
+        if getattr(args, "execution_mode", "thread") == "async":
+            asyncio.run(_run_async_scheduler(args, runs))
+        else:
+            _run_threaded_scheduler(args, runs)
+
+    finally:
+        for run in runs:
+            if run.controller is not None:
+                remove_backoff_listener(run.on_backoff)
+            if run.pbar is not None:
+                run.pbar.close()
+            scheduler_summary = run.scheduler.summary()
+            if scheduler_summary is not None:
+                tqdm.write(scheduler_summary)
+            if run.handler.hedging_policy is not None:
+                tqdm.write(run.handler.hedging_policy.summary())
+            if run.handler.rate_limiter is not None:
+                tqdm.write(run.handler.rate_limiter.summary())
+
+            try:
+                if run.result_writer is not None:
+                    # Flush the pending results and wait for the writer thread to finish
+                    run.result_writer.close()
+
+                    if journal_results:
+                        # Merge the journaled results into the result files, once
+                        compact_result_journals(
+                            args.result_dir / run.handler.registry_dir_name
+                        )
+            finally:
+                # After the writer, which marks the written test cases as done in the work queue
+                run.scheduler.close()
+                if run.is_oss_model:
+                    run.handler.disable_prompt_batching()
+                    _report_prefix_cache_usage(run)
+                    run.handler.shutdown_local_server()
+
+
+def _report_prefix_cache_usage(run: ModelRun):
+    """
+    Print how many prompt tokens the server served from its prefix cache during the run, measured from its own counters.
+    """
+    if run.prefix_cache_metrics is None:
+        return
+    end_metrics = run.handler.get_prefix_cache_metrics()
+    if end_metrics is None:
+        return
+    prompt_tokens = end_metrics["prompt_tokens"] - run.prefix_cache_metrics["prompt_tokens"]
+    cached_tokens = end_metrics["cached_tokens"] - run.prefix_cache_metrics["cached_tokens"]
+    if prompt_tokens <= 0:
+        return
+    tqdm.write(
+        f"Prefix cache for {run.model_name}: {int(cached_tokens)} of {int(prompt_tokens)} prompt tokens "
+        f"({cached_tokens / prompt_tokens:.1%}) were served from the cache and skipped prefill."
+    )
+
+
+def _pop_ready_test_cases(runs: list[ModelRun]):
+    """
+    Hand out ready test cases round-robin across models, until every model is either at its concurrency limit or has nothing ready.
+    """
+    while True:
+        dispatched = False
+        for run in runs:
+            if run.scheduler.has_ready() and run.in_flight < run.limit:
+                run.in_flight += 1
+                dispatched = True
+                # Every model gets its own copy, as the inference pipeline mutates the test entry
+                yield run, deepcopy(run.scheduler.pop_ready())
+        if not dispatched:
+            return
+
+
+def _awaiting_remote_work(runs: list[ModelRun]) -> bool:
+    return any(run.scheduler.awaiting_remote_work() for run in runs)
+
+
+def _run_threaded_scheduler(args, runs: list[ModelRun]):
+    """
+    Run one blocking `handler.inference` call per worker thread, so each model needs as many threads as it has requests in flight.
+    With a controller, a model's `max_concurrency` is only the upper bound and the number of in-flight requests follows `controller.limit`.
+    """
+    in_flight: dict[Future, ModelRun] = {}
+
+    with ThreadPoolExecutor(max_workers=sum(run.max_concurrency for run in runs)) as pool:
+
+        def _fill():
+            # refill the pool up to each model's limit
+            for run, test_case in _pop_ready_test_cases(runs):
                 future = pool.submit(
                     multi_threaded_inference,
-                    handler,
+                    run.handler,
                     test_case,
                     args.include_input_log,
                     args.exclude_state_log,
+                    run.controller,
                 )
-                in_flight[future] = test_case_id
-
-            # main scheduler loop
-            while in_flight:
-                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
-                for future in done:
-                    test_case_id = in_flight.pop(future)
-                    result_dict = future.result()
-
-                    # Enqueue the result for the writer thread to handle file IO
-                    write_queue.put(result_dict)
-
-                    # Update progress bar right after inference completes
-                    pbar.update()
-                    completed.add(test_case_id)
-
-                    # unlock children
-                    for child_id in children_of[test_case_id]:
-                        dependencies[child_id].discard(test_case_id)
-                        if not dependencies[child_id]:
-                            heapq.heappush(
-                                ready_queue,
-                                (sort_key(id_to_test_case[child_id]), child_id),
-                            )
-
-                # refill the pool up to max_workers
-                while ready_queue and len(in_flight) < num_threads:
-                    _, test_case_id = heapq.heappop(ready_queue)
-                    test_case = id_to_test_case[test_case_id]
-                    future = pool.submit(
-                        multi_threaded_inference,
-                        handler,
-                        test_case,
-                        args.include_input_log,
-                        args.exclude_state_log,
-                    )
-                    in_flight[future] = test_case_id
+                in_flight[future] = run
+
+        # seed initial ready tasks
+        _fill()
+
+        # main scheduler loop
+        while in_flight or _awaiting_remote_work(runs):
+            if not in_flight:
+                # Everything left is held by other workers; wait for it to complete or for a lease to expire
+                time.sleep(WORK_QUEUE_POLL_INTERVAL_SECONDS)
+                _fill()
+                continue
+
+            done, _ = wait(
+                in_flight,
+                timeout=WORK_QUEUE_POLL_INTERVAL_SECONDS if _awaiting_remote_work(runs) else None,
+                return_when=FIRST_COMPLETED,
+            )
+            for future in done:
+                run = in_flight.pop(future)
+                run.record_result(future.result())
+
+            _fill()
+
+
+async def _run_async_scheduler(args, runs: list[ModelRun]):
+    """
+    Drive the same dependency schedulers from a single event loop, so the concurrency budgets only bound the number of in-flight requests, not the number of OS threads.
+
+    Handlers that implement `_query_FC_async`/`_query_prompting_async` natively run without any thread. Everything else (sync-only handlers, and multi-turn entries that execute backend calls between queries) runs through the thread bridge, i.e. the default executor of the event loop.
+    """
+    loop = asyncio.get_running_loop()
+    # The thread bridge only needs as many threads as there are sync calls in flight
+    bridge_workers = 0
+    for run in runs:
+        if run.handler._has_native_async(
+            "_query_FC", "_query_FC_async"
+        ) or run.handler._has_native_async("_query_prompting", "_query_prompting_async"):
+            bridge_workers += min(run.max_concurrency, LOCAL_SERVER_MAX_CONCURRENT_REQUEST)
+        else:
+            bridge_workers += run.max_concurrency
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=bridge_workers))
+    for run in runs:
+        run.handler.configure_async_clients(run.max_concurrency)
 
+    try:
+        await _run_async_scheduler_loop(args, runs)
     finally:
-        # Signal writer thread to finish and wait for it
-        write_queue.put(None)
-        writer_thread.join()
+        for run in runs:
+            await run.handler.close_async_clients()
 
-        if is_oss_model:
-            handler.shutdown_local_server()
+
+async def _run_async_scheduler_loop(args, runs: list[ModelRun]):
+    in_flight: dict[asyncio.Task, ModelRun] = {}
+
+    def _fill():
+        for run, test_case in _pop_ready_test_cases(runs):
+            task = asyncio.create_task(
+                async_inference(
+                    run.handler,
+                    test_case,
+                    args.include_input_log,
+                    args.exclude_state_log,
+                    run.controller,
+                )
+            )
+            in_flight[task] = run
+
+    _fill()
+
+    while in_flight or _awaiting_remote_work(runs):
+        if not in_flight:
+            await asyncio.sleep(WORK_QUEUE_POLL_INTERVAL_SECONDS)
+            _fill()
+            continue
+
+        done, _ = await asyncio.wait(
+            in_flight,
+            timeout=WORK_QUEUE_POLL_INTERVAL_SECONDS if _awaiting_remote_work(runs) else None,
+            return_when=asyncio.FIRST_COMPLETED,
+        )
+        for task in done:
+            run = in_flight.pop(task)
+            await run.record_result_async(task.result())
+
+        _fill()
 
 
 def main(args):
@@ -399,17 +882,35 @@ def main(args):
                     f"Since {model_name} is a FC model based on its config, the format sensitivity test cases will be skipped."
                 )
 
+    if getattr(args, "work_queue", None) and args.allow_overwrite and not args.run_ids:
+        raise ValueError(
+            "`--allow-overwrite` deletes the existing result files, including those written by other workers, so it cannot be combined with `--work-queue`."
+        )
+
     if args.result_dir is not None:
         args.result_dir = PROJECT_ROOT / args.result_dir
     else:
         args.result_dir = RESULT_PATH
 
+    response_cache = None
+    if getattr(args, "cache_mode", "off") != "off" and not getattr(
+        args, "predict_makespan", False
+    ):
+        response_cache = ResponseCache(
+            RESPONSE_CACHE_PATH,
+            mode=args.cache_mode,
+            max_size_bytes=RESPONSE_CACHE_MAX_SIZE_BYTES,
+        )
+
+    # All models share the same parsed test entries; `collect_test_cases` only makes shallow per-model copies,
+    # and each test case is deep-copied when it is dispatched
+    runs = []
     for model_name in args.model:
         test_cases_total = collect_test_cases(
             args,
             model_name,
             all_test_categories,
-            deepcopy(all_test_entries_involved),
+            all_test_entries_involved,
         )
 
         if len(test_cases_total) == 0:
@@ -417,7 +918,40 @@ def main(args):
                 f"✅ All selected test cases have been previously generated for {model_name}. No new test cases to generate."
             )
         else:
-            generate_results(args, model_name, test_cases_total)
-            # Sort the result files by id at the end
-            for model_result_json in args.result_dir.rglob(RESULT_FILE_PATTERN):
+            runs.append(
+                build_model_run(args, model_name, test_cases_total, response_cache)
+            )
+
+    if getattr(args, "predict_makespan", False):
+        for run in runs:
+            predict_makespan(args, run)
+        return
+
+    if getattr(args, "concurrent_models", False):
+        # API models are interleaved in one scheduler loop; locally-hosted models need their own server, so they still run one at a time
+        api_runs = [run for run in runs if not run.is_oss_model]
+        batches = [api_runs] if api_runs else []
+        batches += [[run] for run in runs if run.is_oss_model]
+    else:
+        batches = [[run] for run in runs]
+
+    for batch in batches:
+        generate_results_for_models(args, batch)
+        # Sort the result files by id at the end
+        for run in batch:
+            model_result_dir = args.result_dir / run.handler.registry_dir_name
+            model_result_jsons = list(model_result_dir.rglob(RESULT_FILE_PATTERN))
+            for model_result_json in model_result_jsons:
                 sort_file_content_by_id(model_result_json)
+
+            # Record the completed ids, so that the next resume does not need to parse the result files
+            completion_manifest = CompletionManifest(model_result_dir)
+            completion_manifest.refresh(model_result_jsons)
+            completion_manifest.save()
+            run.latency_history.save()
+
+    if response_cache is not None:
+        tqdm.write(
+            f"Response cache ({args.cache_mode}): {response_cache.hits} hits, {response_cache.misses} misses."
+        )
+        response_cache.close()
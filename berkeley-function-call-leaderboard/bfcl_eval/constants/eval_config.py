@@ -4,6 +4,46 @@ from bfcl_eval.constants.category_mapping import VERSION_PREFIX
 
 LOCAL_SERVER_PORT = 1053
 LOCAL_SERVER_MAX_CONCURRENT_REQUEST = 100
+# Client-side timeout of a request to the local server when no `--request-deadline` is set
+LOCAL_SERVER_REQUEST_TIMEOUT = 72000
+# Values of `--execution-mode`
+EXECUTION_MODES = ["thread", "async"]
+# Default upper bound for the number of in-flight requests when `--adaptive-concurrency` is enabled
+ADAPTIVE_CONCURRENCY_MAX_LIMIT = 64
+# Values of `--scheduling-policy`
+SCHEDULING_POLICIES = ["default", "prefix-affinity", "critical-path"]
+
+# The result writer commits up to this many results at once, waiting at most this long for a batch to fill up
+RESULT_WRITER_MAX_BATCH_SIZE = 64
+RESULT_WRITER_MAX_BATCH_DELAY_MS = 50
+# Workers block once this many results are waiting to be written
+RESULT_WRITER_MAX_QUEUE_SIZE = 1024
+# With `--prompt-batch-size`, single-turn prompts are coalesced for at most this long before the batch is sent
+PROMPT_BATCH_MAX_DELAY_MS = 10
+# With `--hedge-requests`, a request still running after this quantile of its category's observed latency gets a duplicate,
+# once the category has this many completed requests, and at most this fraction of all requests is hedged (unless `--max-hedge-rate` is given)
+HEDGE_LATENCY_QUANTILE = 0.95
+HEDGE_MIN_SAMPLES = 20
+HEDGE_MAX_RATE = 0.05
+# With `--requests-per-minute`/`--tokens-per-minute`, requests are paced at this fraction of the quota,
+# and the rate limiter holds at most this many seconds' worth of quota for bursts
+RATE_LIMIT_UTILIZATION = 0.95
+RATE_LIMIT_BURST_SECONDS = 3
+
+# Values of `--state-log-format`
+STATE_LOG_FORMATS = ["full", "delta"]
+
+# Unpinned backend sessions of multi-turn entries (eg, opened by scripts) are evicted beyond this many
+BACKEND_SESSION_STORE_MAX_SESSIONS = 1024
+
+# Number of parsed multi-turn function call strings kept for the direct dispatch of `execute_multi_turn_func_call`
+FUNC_CALL_PARSE_CACHE_SIZE = 65536
+
+# Number of loaded multi-turn scenarios kept as templates for new backend instances
+SCENARIO_TEMPLATE_CACHE_MAX_TEMPLATES = 512
+
+# Number of multi-turn entries whose ground-truth execution is kept in memory during evaluation
+GROUND_TRUTH_CACHE_MAX_ENTRIES = 4096
 
 # Price got from Lambda Cloud, 23.92 per hour for 8x H100, on-demand pay as you go total price
 # Reference: https://lambda.ai/pricing
@@ -25,6 +65,22 @@ DOTENV_PATH = PROJECT_ROOT / ".env"
 TEST_IDS_TO_GENERATE_PATH = PROJECT_ROOT / "test_case_ids_to_generate.json"
 # Directory that stores all lock files (kept out of the results tree)
 LOCK_DIR = PROJECT_ROOT / ".file_locks"
+# Used by `--work-queue` to share one generation run between several processes or hosts
+WORK_QUEUE_DIR = LOCK_DIR / "work_queues"
+# A claimed test case goes back to the queue if its worker stops renewing the lease for this long
+WORK_QUEUE_LEASE_SECONDS = 120
+WORK_QUEUE_POLL_INTERVAL_SECONDS = 2
+# Used by `--cache-mode` to store model responses; least recently used entries are evicted past the size limit
+RESPONSE_CACHE_PATH = PROJECT_ROOT / ".response_cache" / "responses.sqlite"
+RESPONSE_CACHE_MAX_SIZE_BYTES = 10 * 1024**3
+# Values of `--cache-mode`
+CACHE_MODES = ["off", "read", "write", "readwrite"]
+# Fully processed dataset entries, so that `load_dataset_entry` does not re-parse and re-process the JSON files on every run
+DATASET_CACHE_DIR = PROJECT_ROOT / ".dataset_cache"
+# Bump this when the cached format or the processing logic changes in a way not covered by the source file checksums
+DATASET_CACHE_VERSION = 1
+# Used by `--ground-truth-disk-cache` to store the ground-truth execution of multi-turn entries across evaluation runs and worker processes
+GROUND_TRUTH_CACHE_DIR = PROJECT_ROOT / ".ground_truth_cache"
 
 PROMPT_PATH = PACKAGE_ROOT / "data"
 MULTI_TURN_FUNC_DOC_PATH = PROMPT_PATH / "multi_turn_func_doc"
@@ -44,3 +44,12 @@ OMIT_STATE_INFO_CLASSES = [
     "MemoryAPI_rec_sum",
     "WebSearchAPI",
 ]
+
+# These classes are always loaded with `_load_scenario`, never cloned from a cached scenario template
+# The memory backends read and write snapshot files of the test entry when they load, and the web search backend is cheap to load
+SCENARIO_TEMPLATE_EXCLUDED_CLASSES = [
+    "MemoryAPI_kv",
+    "MemoryAPI_vector",
+    "MemoryAPI_rec_sum",
+    "WebSearchAPI",
+]
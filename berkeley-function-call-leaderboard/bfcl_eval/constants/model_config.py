@@ -1,73 +1,9 @@
+import importlib
 from dataclasses import dataclass
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from bfcl_eval.model_handler.api_inference.claude import ClaudeHandler
-from bfcl_eval.model_handler.api_inference.cohere import CohereHandler
-from bfcl_eval.model_handler.api_inference.deepseek import DeepSeekAPIHandler
-from bfcl_eval.model_handler.api_inference.dm_cito import DMCitoHandler
-from bfcl_eval.model_handler.api_inference.fireworks import FireworksHandler
-from bfcl_eval.model_handler.api_inference.functionary import FunctionaryHandler
-from bfcl_eval.model_handler.api_inference.gemini import GeminiHandler
-from bfcl_eval.model_handler.api_inference.glm import GLMAPIHandler
-from bfcl_eval.model_handler.api_inference.gogoagent import GoGoAgentHandler
-from bfcl_eval.model_handler.api_inference.gorilla import GorillaHandler
-from bfcl_eval.model_handler.api_inference.grok import GrokHandler
-from bfcl_eval.model_handler.api_inference.kimi import KimiHandler
-from bfcl_eval.model_handler.api_inference.ling import LingAPIHandler
-from bfcl_eval.model_handler.api_inference.mining import MiningHandler
-from bfcl_eval.model_handler.api_inference.mistral import MistralHandler
-from bfcl_eval.model_handler.api_inference.nemotron import NemotronHandler
-from bfcl_eval.model_handler.api_inference.nova import NovaHandler
-from bfcl_eval.model_handler.api_inference.novita import NovitaHandler
-from bfcl_eval.model_handler.api_inference.nvidia import NvidiaHandler
-from bfcl_eval.model_handler.api_inference.openai_completion import (
-    OpenAICompletionsHandler,
-)
-from bfcl_eval.model_handler.api_inference.openai_response import OpenAIResponsesHandler
-from bfcl_eval.model_handler.api_inference.qwen import (
-    QwenAgentNoThinkHandler,
-    QwenAgentThinkHandler,
-    QwenAPIHandler,
-)
-from bfcl_eval.model_handler.api_inference.nanbeige import NanbeigeAPIHandler
-from bfcl_eval.model_handler.api_inference.writer import WriterHandler
-from bfcl_eval.model_handler.local_inference.arch import ArchHandler
-from bfcl_eval.model_handler.local_inference.bielik import BielikHandler
-from bfcl_eval.model_handler.local_inference.bitagent import BitAgentHandler
-from bfcl_eval.model_handler.local_inference.deepseek_reasoning import (
-    DeepseekReasoningHandler,
-)
-from bfcl_eval.model_handler.local_inference.falcon_fc import Falcon3FCHandler
-from bfcl_eval.model_handler.local_inference.gemma import GemmaHandler
-from bfcl_eval.model_handler.local_inference.functiongemma import FunctionGemmaHandler
-from bfcl_eval.model_handler.local_inference.glm import GLMHandler
-from bfcl_eval.model_handler.local_inference.granite import (
-    GraniteFunctionCallingHandler,
-)
-from bfcl_eval.model_handler.local_inference.granite_3 import Granite3FCHandler
-from bfcl_eval.model_handler.local_inference.granite_4 import Granite4FCHandler
-from bfcl_eval.model_handler.local_inference.hammer import HammerHandler
-from bfcl_eval.model_handler.local_inference.llama import LlamaHandler
-from bfcl_eval.model_handler.local_inference.llama_3_1 import LlamaHandler_3_1
-from bfcl_eval.model_handler.local_inference.minicpm import MiniCPMHandler
-from bfcl_eval.model_handler.local_inference.minicpm_fc import MiniCPMFCHandler
-from bfcl_eval.model_handler.local_inference.mistral_fc import MistralFCHandler
-from bfcl_eval.model_handler.local_inference.phi import PhiHandler
-from bfcl_eval.model_handler.local_inference.phi_fc import PhiFCHandler
-from bfcl_eval.model_handler.local_inference.quick_testing_oss import (
-    QuickTestingOSSHandler,
-)
-from bfcl_eval.model_handler.local_inference.qwen import QwenHandler
-from bfcl_eval.model_handler.local_inference.qwen_fc import QwenFCHandler
-from bfcl_eval.model_handler.local_inference.pelican_vl_fc import PelicanVLFCHandler
-from bfcl_eval.model_handler.local_inference.nanbeige_fc import NanbeigeFCHandler
-from bfcl_eval.model_handler.local_inference.salesforce_llama import (
-    SalesforceLlamaHandler,
-)
-from bfcl_eval.model_handler.local_inference.salesforce_qwen import (
-    SalesforceQwenHandler,
-)
-from bfcl_eval.model_handler.local_inference.think_agent import ThinkAgentHandler
+if TYPE_CHECKING:
+    from bfcl_eval.model_handler.base_handler import BaseHandler
 
 # -----------------------------------------------------------------------------
 # A mapping of model identifiers to their respective model configurations.
@@ -88,7 +24,7 @@ class ModelConfig:
         url (str): Reference URL for the model or hosting service.
         org (str): Organization providing the model.
         license (str): License under which the model is released.
-        model_handler (str): Handler name for invoking the model.
+        model_handler (str): Dotted import path of the handler class for invoking the model (eg, "bfcl_eval.model_handler.api_inference.claude.ClaudeHandler"). The handler module, and the vendor SDK it depends on, is only imported by `get_handler_class`.
         input_price (Optional[float]): USD per million input tokens (None for open source models).
         output_price (Optional[float]): USD per million output tokens (None for open source models).
         is_fc_model (bool): True if this model is used in Function-Calling mode, otherwise False for Prompt-based mode.
@@ -114,6 +50,13 @@ class ModelConfig:
     # True if this model does not allow '.' in function names
     underscore_to_dot: bool = False
 
+    def get_handler_class(self) -> type["BaseHandler"]:
+        """
+        Import and return the handler class named by `model_handler`.
+        """
+        module_path, _, class_name = self.model_handler.rpartition(".")
+        return getattr(importlib.import_module(module_path), class_name)
+
 
 # Inference through API calls
 api_inference_model_map = {
@@ -123,7 +66,7 @@ api_inference_model_map = {
         url="https://gorilla.cs.berkeley.edu/blogs/7_open_functions_v2.html",
         org="Gorilla LLM",
         license="Apache 2.0",
-        model_handler=GorillaHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.gorilla.GorillaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -135,7 +78,7 @@ api_inference_model_map = {
         url="https://api-docs.deepseek.com/news/news250528",
         org="DeepSeek",
         license="MIT",
-        model_handler=DeepSeekAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.deepseek.DeepSeekAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -147,7 +90,7 @@ api_inference_model_map = {
         url="https://api-docs.deepseek.com/news/news250528",
         org="DeepSeek",
         license="MIT",
-        model_handler=DeepSeekAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.deepseek.DeepSeekAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -159,7 +102,7 @@ api_inference_model_map = {
         url="https://api-docs.deepseek.com/news/news250528",
         org="DeepSeek",
         license="MIT",
-        model_handler=DeepSeekAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.deepseek.DeepSeekAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -171,7 +114,7 @@ api_inference_model_map = {
         url="https://openai.com/zh-Hans-CN/index/introducing-gpt-5-2/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=1.75,
         output_price=14,
         is_fc_model=True,
@@ -183,7 +126,7 @@ api_inference_model_map = {
         url="https://openai.com/zh-Hans-CN/index/introducing-gpt-5-2/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=1.75,
         output_price=14,
         is_fc_model=False,
@@ -195,7 +138,7 @@ api_inference_model_map = {
         url="https://openai.com/index/introducing-gpt-5/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=0.25,
         output_price=2,
         is_fc_model=True,
@@ -207,7 +150,7 @@ api_inference_model_map = {
         url="https://openai.com/index/introducing-gpt-5/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=0.25,
         output_price=2,
         is_fc_model=False,
@@ -219,7 +162,7 @@ api_inference_model_map = {
         url="https://openai.com/index/introducing-gpt-5/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=0.05,
         output_price=0.4,
         is_fc_model=True,
@@ -231,7 +174,7 @@ api_inference_model_map = {
         url="https://openai.com/index/introducing-gpt-5/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=0.05,
         output_price=0.4,
         is_fc_model=False,
@@ -243,7 +186,7 @@ api_inference_model_map = {
         url="https://openai.com/index/gpt-4-1/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=2,
         output_price=8,
         is_fc_model=True,
@@ -255,7 +198,7 @@ api_inference_model_map = {
         url="https://openai.com/index/gpt-4-1/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=2,
         output_price=8,
         is_fc_model=False,
@@ -267,7 +210,7 @@ api_inference_model_map = {
         url="https://openai.com/index/gpt-4-1/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=0.4,
         output_price=1.6,
         is_fc_model=True,
@@ -279,7 +222,7 @@ api_inference_model_map = {
         url="https://openai.com/index/gpt-4-1/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=0.4,
         output_price=1.6,
         is_fc_model=False,
@@ -291,7 +234,7 @@ api_inference_model_map = {
         url="https://openai.com/index/gpt-4-1/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=0.1,
         output_price=0.4,
         is_fc_model=True,
@@ -303,7 +246,7 @@ api_inference_model_map = {
         url="https://openai.com/index/gpt-4-1/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=0.1,
         output_price=0.4,
         is_fc_model=False,
@@ -315,7 +258,7 @@ api_inference_model_map = {
         url="https://openai.com/index/hello-gpt-4o/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=2.5,
         output_price=10,
         is_fc_model=False,
@@ -327,7 +270,7 @@ api_inference_model_map = {
         url="https://openai.com/index/hello-gpt-4o/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=2.5,
         output_price=10,
         is_fc_model=True,
@@ -339,7 +282,7 @@ api_inference_model_map = {
         url="https://openai.com/index/gpt-4o-mini-advancing-cost-efficient-intelligence/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=0.15,
         output_price=0.6,
         is_fc_model=False,
@@ -351,7 +294,7 @@ api_inference_model_map = {
         url="https://openai.com/index/gpt-4o-mini-advancing-cost-efficient-intelligence/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=0.15,
         output_price=0.6,
         is_fc_model=True,
@@ -363,7 +306,7 @@ api_inference_model_map = {
         url="https://openai.com/index/introducing-o3-and-o4-mini/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=2,
         output_price=8,
         is_fc_model=False,
@@ -375,7 +318,7 @@ api_inference_model_map = {
         url="https://openai.com/index/introducing-o3-and-o4-mini/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=2,
         output_price=8,
         is_fc_model=True,
@@ -387,7 +330,7 @@ api_inference_model_map = {
         url="https://openai.com/index/introducing-o3-and-o4-mini/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=1.10,
         output_price=4.40,
         is_fc_model=False,
@@ -399,7 +342,7 @@ api_inference_model_map = {
         url="https://openai.com/index/introducing-o3-and-o4-mini/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=1.10,
         output_price=4.40,
         is_fc_model=True,
@@ -411,7 +354,7 @@ api_inference_model_map = {
         url="https://www.anthropic.com/news/claude-4",
         org="Anthropic",
         license="Proprietary",
-        model_handler=ClaudeHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.claude.ClaudeHandler",
         input_price=5,
         output_price=25,
         is_fc_model=False,
@@ -423,7 +366,7 @@ api_inference_model_map = {
         url="https://www.anthropic.com/news/claude-4",
         org="Anthropic",
         license="Proprietary",
-        model_handler=ClaudeHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.claude.ClaudeHandler",
         input_price=5,
         output_price=25,
         is_fc_model=True,
@@ -435,7 +378,7 @@ api_inference_model_map = {
         url="https://www.anthropic.com/news/claude-sonnet-4-5",
         org="Anthropic",
         license="Proprietary",
-        model_handler=ClaudeHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.claude.ClaudeHandler",
         input_price=3,
         output_price=15,
         is_fc_model=False,
@@ -447,7 +390,7 @@ api_inference_model_map = {
         url="https://www.anthropic.com/news/claude-sonnet-4-5",
         org="Anthropic",
         license="Proprietary",
-        model_handler=ClaudeHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.claude.ClaudeHandler",
         input_price=3,
         output_price=15,
         is_fc_model=True,
@@ -459,7 +402,7 @@ api_inference_model_map = {
         url="https://www.anthropic.com/news/claude-haiku-4-5",
         org="Anthropic",
         license="Proprietary",
-        model_handler=ClaudeHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.claude.ClaudeHandler",
         input_price=0.8,
         output_price=4,
         is_fc_model=False,
@@ -471,7 +414,7 @@ api_inference_model_map = {
         url="https://www.anthropic.com/news/claude-haiku-4-5",
         org="Anthropic",
         license="Proprietary",
-        model_handler=ClaudeHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.claude.ClaudeHandler",
         input_price=0.8,
         output_price=4,
         is_fc_model=True,
@@ -483,7 +426,7 @@ api_inference_model_map = {
         url="https://aws.amazon.com/cn/ai/generative-ai/nova/",
         org="Amazon",
         license="Proprietary",
-        model_handler=NovaHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.nova.NovaHandler",
         input_price=0.8,
         output_price=3.2,
         is_fc_model=True,
@@ -495,7 +438,7 @@ api_inference_model_map = {
         url="https://aws.amazon.com/cn/ai/generative-ai/nova/",
         org="Amazon",
         license="Proprietary",
-        model_handler=NovaHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.nova.NovaHandler",
         input_price=0.3,
         output_price=2.5,
         is_fc_model=True,
@@ -507,7 +450,7 @@ api_inference_model_map = {
         url="https://aws.amazon.com/cn/ai/generative-ai/nova/",
         org="Amazon",
         license="Proprietary",
-        model_handler=NovaHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.nova.NovaHandler",
         input_price=0.035,
         output_price=0.14,
         is_fc_model=True,
@@ -519,7 +462,7 @@ api_inference_model_map = {
         url="https://mistral.ai/news/mistral-nemo/",
         org="Mistral AI",
         license="Proprietary",
-        model_handler=MistralHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.mistral.MistralHandler",
         input_price=0.15,
         output_price=0.15,
         is_fc_model=False,
@@ -531,7 +474,7 @@ api_inference_model_map = {
         url="https://mistral.ai/news/mistral-nemo/",
         org="Mistral AI",
         license="Proprietary",
-        model_handler=MistralHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.mistral.MistralHandler",
         input_price=0.15,
         output_price=0.15,
         is_fc_model=True,
@@ -543,7 +486,7 @@ api_inference_model_map = {
         url="https://docs.mistral.ai/guides/model-selection/",
         org="Mistral AI",
         license="Proprietary",
-        model_handler=MistralHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.mistral.MistralHandler",
         input_price=2,
         output_price=6,
         is_fc_model=False,
@@ -555,7 +498,7 @@ api_inference_model_map = {
         url="https://docs.mistral.ai/guides/model-selection/",
         org="Mistral AI",
         license="Proprietary",
-        model_handler=MistralHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.mistral.MistralHandler",
         input_price=2,
         output_price=6,
         is_fc_model=True,
@@ -567,7 +510,7 @@ api_inference_model_map = {
         url="https://docs.mistral.ai/guides/model-selection/",
         org="Mistral AI",
         license="Proprietary",
-        model_handler=MistralHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.mistral.MistralHandler",
         input_price=0.1,
         output_price=0.3,
         is_fc_model=False,
@@ -579,7 +522,7 @@ api_inference_model_map = {
         url="https://docs.mistral.ai/guides/model-selection/",
         org="Mistral AI",
         license="Proprietary",
-        model_handler=MistralHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.mistral.MistralHandler",
         input_price=0.1,
         output_price=0.3,
         is_fc_model=True,
@@ -591,7 +534,7 @@ api_inference_model_map = {
         url="https://docs.mistral.ai/guides/model-selection/",
         org="Mistral AI",
         license="Proprietary",
-        model_handler=MistralHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.mistral.MistralHandler",
         input_price=0.4,
         output_price=2,
         is_fc_model=False,
@@ -603,7 +546,7 @@ api_inference_model_map = {
         url="https://docs.mistral.ai/guides/model-selection/",
         org="Mistral AI",
         license="Proprietary",
-        model_handler=MistralHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.mistral.MistralHandler",
         input_price=0.4,
         output_price=2,
         is_fc_model=True,
@@ -615,7 +558,7 @@ api_inference_model_map = {
         url="https://huggingface.co/fireworks-ai/firefunction-v2",
         org="Fireworks",
         license="Apache 2.0",
-        model_handler=FireworksHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.fireworks.FireworksHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -627,7 +570,7 @@ api_inference_model_map = {
         url="https://deepmind.google/technologies/gemini/flash-lite/",
         org="Google",
         license="Proprietary",
-        model_handler=GeminiHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.gemini.GeminiHandler",
         input_price=0.1,
         output_price=0.4,
         is_fc_model=True,
@@ -639,7 +582,7 @@ api_inference_model_map = {
         url="https://deepmind.google/technologies/gemini/flash-lite/",
         org="Google",
         license="Proprietary",
-        model_handler=GeminiHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.gemini.GeminiHandler",
         input_price=0.1,
         output_price=0.4,
         is_fc_model=False,
@@ -651,7 +594,7 @@ api_inference_model_map = {
         url="https://deepmind.google/technologies/gemini/flash/",
         org="Google",
         license="Proprietary",
-        model_handler=GeminiHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.gemini.GeminiHandler",
         input_price=0.3,
         output_price=2.5,
         is_fc_model=True,
@@ -663,7 +606,7 @@ api_inference_model_map = {
         url="https://deepmind.google/technologies/gemini/flash/",
         org="Google",
         license="Proprietary",
-        model_handler=GeminiHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.gemini.GeminiHandler",
         input_price=0.3,
         output_price=2.5,
         is_fc_model=False,
@@ -675,7 +618,7 @@ api_inference_model_map = {
         url="https://deepmind.google/technologies/gemini/pro/",
         org="Google",
         license="Proprietary",
-        model_handler=GeminiHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.gemini.GeminiHandler",
         input_price=2,
         output_price=12,
         is_fc_model=True,
@@ -687,7 +630,7 @@ api_inference_model_map = {
         url="https://deepmind.google/technologies/gemini/pro/",
         org="Google",
         license="Proprietary",
-        model_handler=GeminiHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.gemini.GeminiHandler",
         input_price=2,
         output_price=12,
         is_fc_model=False,
@@ -699,7 +642,7 @@ api_inference_model_map = {
         url="https://blog.google/innovation-and-ai/models-and-research/gemini-models/gemini-3-1-flash-lite/",
         org="Google",
         license="Proprietary",
-        model_handler=GeminiHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.gemini.GeminiHandler",
         input_price=0.25,
         output_price=1.5,
         is_fc_model=True,
@@ -711,7 +654,7 @@ api_inference_model_map = {
         url="https://blog.google/innovation-and-ai/models-and-research/gemini-models/gemini-3-1-flash-lite/",
         org="Google",
         license="Proprietary",
-        model_handler=GeminiHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.gemini.GeminiHandler",
         input_price=0.25,
         output_price=1.5,
         is_fc_model=False,
@@ -723,7 +666,7 @@ api_inference_model_map = {
         url="https://huggingface.co/meetkai/functionary-small-v3.1",
         org="MeetKai",
         license="MIT",
-        model_handler=FunctionaryHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.functionary.FunctionaryHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -735,7 +678,7 @@ api_inference_model_map = {
         url="https://huggingface.co/meetkai/functionary-medium-v3.1",
         org="MeetKai",
         license="MIT",
-        model_handler=FunctionaryHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.functionary.FunctionaryHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -747,7 +690,7 @@ api_inference_model_map = {
         url="https://cohere.com/blog/command-r7b",
         org="Cohere",
         license="cc-by-nc-4.0",
-        model_handler=CohereHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.cohere.CohereHandler",
         input_price=0.0375,
         output_price=0.15,
         is_fc_model=True,
@@ -759,7 +702,7 @@ api_inference_model_map = {
         url="https://cohere.com/blog/command-a",
         org="Cohere",
         license="CC-BY-NC 4.0 License (w/ Acceptable Use Addendum)",
-        model_handler=CohereHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.cohere.CohereHandler",
         input_price=2.5,
         output_price=10,
         is_fc_model=True,
@@ -771,7 +714,7 @@ api_inference_model_map = {
         url="https://cohere.com/blog/command-a-reasoning",
         org="Cohere",
         license="CC-BY-NC 4.0 License (w/ Acceptable Use Addendum)",
-        model_handler=CohereHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.cohere.CohereHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -783,7 +726,7 @@ api_inference_model_map = {
         url="https://huggingface.co/nvidia/Llama-3_1-Nemotron-Ultra-253B-v1",
         org="NVIDIA",
         license="nvidia-open-model-license",
-        model_handler=NemotronHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.nemotron.NemotronHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -795,7 +738,7 @@ api_inference_model_map = {
         url="https://huggingface.co/nvidia/nemotron-4-340b-instruct",
         org="NVIDIA",
         license="nvidia-open-model-license",
-        model_handler=NvidiaHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.nvidia.NvidiaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -807,7 +750,7 @@ api_inference_model_map = {
         url="https://gogoagent.ai",
         org="BitAgent",
         license="Proprietary",
-        model_handler=GoGoAgentHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.gogoagent.GoGoAgentHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -819,7 +762,7 @@ api_inference_model_map = {
         url="https://writer.com/engineering/actions-with-palmyra-x-004/",
         org="Writer",
         license="Proprietary",
-        model_handler=WriterHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.writer.WriterHandler",
         input_price=5,
         output_price=12,
         is_fc_model=True,
@@ -831,7 +774,7 @@ api_inference_model_map = {
         url="https://docs.x.ai/docs/models",
         org="xAI",
         license="Proprietary",
-        model_handler=GrokHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.grok.GrokHandler",
         input_price=3,
         output_price=15,
         is_fc_model=True,
@@ -843,7 +786,7 @@ api_inference_model_map = {
         url="https://docs.x.ai/docs/models",
         org="xAI",
         license="Proprietary",
-        model_handler=GrokHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.grok.GrokHandler",
         input_price=3,
         output_price=15,
         is_fc_model=False,
@@ -855,7 +798,7 @@ api_inference_model_map = {
         url="https://docs.x.ai/docs/models",
         org="xAI",
         license="Proprietary",
-        model_handler=GrokHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.grok.GrokHandler",
         input_price=0.2,
         output_price=0.5,
         is_fc_model=True,
@@ -867,7 +810,7 @@ api_inference_model_map = {
         url="https://docs.x.ai/docs/models",
         org="xAI",
         license="Proprietary",
-        model_handler=GrokHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.grok.GrokHandler",
         input_price=0.2,
         output_price=0.5,
         is_fc_model=True,
@@ -879,7 +822,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-0.6B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -891,7 +834,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-0.6B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -903,7 +846,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-1.7B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -915,7 +858,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-1.7B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -927,7 +870,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-4B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -939,7 +882,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-4B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -951,7 +894,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-8B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -963,7 +906,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-8B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -975,7 +918,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-14B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -987,7 +930,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-14B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -999,7 +942,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-32B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1011,7 +954,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-32B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1023,7 +966,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-30B-A3B-Instruct-2507",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1035,7 +978,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-30B-A3B-Instruct-2507",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1047,7 +990,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-235B-A22B-Instruct-2507",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1059,7 +1002,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-235B-A22B-Instruct-2507",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1071,7 +1014,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/QwQ-32B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1083,7 +1026,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/QwQ-32B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1095,7 +1038,7 @@ api_inference_model_map = {
         url="https://www.mininglamp.com/",
         org="Mininglamp",
         license="Proprietary",
-        model_handler=MiningHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.mining.MiningHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1107,7 +1050,7 @@ api_inference_model_map = {
         url="https://www.mininglamp.com/",
         org="Mininglamp",
         license="Proprietary",
-        model_handler=DMCitoHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.dm_cito.DMCitoHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1119,7 +1062,7 @@ api_inference_model_map = {
         url="https://www.mininglamp.com/",
         org="Mininglamp",
         license="Proprietary",
-        model_handler=DMCitoHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.dm_cito.DMCitoHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1131,7 +1074,7 @@ api_inference_model_map = {
         url="https://huggingface.co/inclusionAI/Ling-lite-1.5",
         org="Ling",
         license="MIT",
-        model_handler=LingAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.ling.LingAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1143,7 +1086,7 @@ api_inference_model_map = {
         url="https://huggingface.co/zai-org/GLM-4.6",
         org="Zhipu AI",
         license="MIT",
-        model_handler=GLMAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.glm.GLMAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1155,7 +1098,7 @@ api_inference_model_map = {
         url="https://huggingface.co/zai-org/GLM-4.5",
         org="Zhipu AI",
         license="MIT",
-        model_handler=GLMAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.glm.GLMAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1167,7 +1110,7 @@ api_inference_model_map = {
         url="https://huggingface.co/zai-org/GLM-4.5-Air",
         org="Zhipu AI",
         license="MIT",
-        model_handler=GLMAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.glm.GLMAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1179,7 +1122,7 @@ api_inference_model_map = {
         url="https://huggingface.co/moonshotai/Kimi-K2-Instruct",
         org="MoonshotAI",
         license="modified-mit",
-        model_handler=KimiHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.kimi.KimiHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1191,7 +1134,7 @@ api_inference_model_map = {
         url="https://huggingface.co/moonshotai/Kimi-K2-Instruct",
         org="MoonshotAI",
         license="modified-mit",
-        model_handler=KimiHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.kimi.KimiHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1203,7 +1146,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Nanbeige",
         org="Nanbeige",
         license="apache-2.0",
-        model_handler=NanbeigeAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.nanbeige.NanbeigeAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1219,7 +1162,7 @@ local_inference_model_map = {
         url="https://huggingface.co/deepseek-ai/DeepSeek-R1",
         org="DeepSeek",
         license="MIT",
-        model_handler=DeepseekReasoningHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.deepseek_reasoning.DeepseekReasoningHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1231,7 +1174,7 @@ local_inference_model_map = {
         url="https://blog.google/technology/developers/gemma-3/",
         org="Google",
         license="gemma-terms-of-use",
-        model_handler=GemmaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.gemma.GemmaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1243,7 +1186,7 @@ local_inference_model_map = {
         url="https://blog.google/technology/developers/gemma-3/",
         org="Google",
         license="gemma-terms-of-use",
-        model_handler=GemmaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.gemma.GemmaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1255,7 +1198,7 @@ local_inference_model_map = {
         url="https://blog.google/technology/developers/gemma-3/",
         org="Google",
         license="gemma-terms-of-use",
-        model_handler=GemmaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.gemma.GemmaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1267,7 +1210,7 @@ local_inference_model_map = {
         url="https://blog.google/technology/developers/gemma-3/",
         org="Google",
         license="gemma-terms-of-use",
-        model_handler=GemmaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.gemma.GemmaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1279,7 +1222,7 @@ local_inference_model_map = {
         url="https://ai.google.dev/gemma/docs/functiongemma",
         org="Google",
         license="gemma-terms-of-use",
-        model_handler=FunctionGemmaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.functiongemma.FunctionGemmaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1291,7 +1234,7 @@ local_inference_model_map = {
         url="https://llama.meta.com/llama3",
         org="Meta",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler_3_1,
+        model_handler="bfcl_eval.model_handler.local_inference.llama_3_1.LlamaHandler_3_1",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1303,7 +1246,7 @@ local_inference_model_map = {
         url="https://llama.meta.com/llama3",
         org="Meta",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1315,7 +1258,7 @@ local_inference_model_map = {
         url="https://llama.meta.com/llama3",
         org="Meta",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler_3_1,
+        model_handler="bfcl_eval.model_handler.local_inference.llama_3_1.LlamaHandler_3_1",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1327,7 +1270,7 @@ local_inference_model_map = {
         url="https://llama.meta.com/llama3",
         org="Meta",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1339,7 +1282,7 @@ local_inference_model_map = {
         url="https://llama.meta.com/llama3",
         org="Meta",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1351,7 +1294,7 @@ local_inference_model_map = {
         url="https://llama.meta.com/llama3",
         org="Meta",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1363,7 +1306,7 @@ local_inference_model_map = {
         url="https://llama.meta.com/llama3",
         org="Meta",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1375,7 +1318,7 @@ local_inference_model_map = {
         url="https://huggingface.co/meta-llama/Llama-4-Scout-17B-16E-Instruct",
         org="Meta",
         license="Meta Llama 4 Community",
-        model_handler=LlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1387,7 +1330,7 @@ local_inference_model_map = {
         url="https://huggingface.co/meta-llama/Llama-4-Maverick-17B-128E-Instruct-FP8",
         org="Meta",
         license="Meta Llama 4 Community",
-        model_handler=LlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1399,7 +1342,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Salesforce/Llama-xLAM-2-70b-fc-r",
         org="Salesforce",
         license="cc-by-nc-4.0",
-        model_handler=SalesforceLlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.salesforce_llama.SalesforceLlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1411,7 +1354,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Salesforce/Llama-xLAM-2-8b-fc-r",
         org="Salesforce",
         license="cc-by-nc-4.0",
-        model_handler=SalesforceLlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.salesforce_llama.SalesforceLlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1423,7 +1366,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Salesforce/xLAM-2-32b-fc-r",
         org="Salesforce",
         license="cc-by-nc-4.0",
-        model_handler=SalesforceQwenHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.salesforce_qwen.SalesforceQwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1435,7 +1378,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Salesforce/xLAM-2-3b-fc-r",
         org="Salesforce",
         license="cc-by-nc-4.0",
-        model_handler=SalesforceQwenHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.salesforce_qwen.SalesforceQwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1447,7 +1390,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Salesforce/xLAM-2-1b-fc-r",
         org="Salesforce",
         license="cc-by-nc-4.0",
-        model_handler=SalesforceQwenHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.salesforce_qwen.SalesforceQwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1459,7 +1402,7 @@ local_inference_model_map = {
         url="https://huggingface.co/mistralai/Ministral-8B-Instruct-2410",
         org="Mistral AI",
         license="Mistral AI Research License",
-        model_handler=MistralFCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.mistral_fc.MistralFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1471,7 +1414,7 @@ local_inference_model_map = {
         url="https://huggingface.co/microsoft/phi-4",
         org="Microsoft",
         license="MIT",
-        model_handler=PhiHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.phi.PhiHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1483,7 +1426,7 @@ local_inference_model_map = {
         url="https://huggingface.co/microsoft/Phi-4-mini-instruct",
         org="Microsoft",
         license="MIT",
-        model_handler=PhiHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.phi.PhiHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1495,7 +1438,7 @@ local_inference_model_map = {
         url="https://huggingface.co/microsoft/Phi-4-mini-instruct",
         org="Microsoft",
         license="MIT",
-        model_handler=PhiFCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.phi_fc.PhiFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1507,7 +1450,7 @@ local_inference_model_map = {
         url="https://huggingface.co/ibm-granite/granite-3.2-8b-instruct",
         org="IBM",
         license="Apache-2.0",
-        model_handler=Granite3FCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.granite_3.Granite3FCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1519,7 +1462,7 @@ local_inference_model_map = {
         url="https://huggingface.co/ibm-granite/granite-3.1-8b-instruct",
         org="IBM",
         license="Apache-2.0",
-        model_handler=Granite3FCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.granite_3.Granite3FCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1531,7 +1474,7 @@ local_inference_model_map = {
         url="https://huggingface.co/ibm-granite/granite-4.0-350m",
         org="IBM",
         license="Apache-2.0",
-        model_handler=Granite4FCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.granite_4.Granite4FCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1543,7 +1486,7 @@ local_inference_model_map = {
         url="https://huggingface.co/ibm-granite/granite-20b-functioncalling",
         org="IBM",
         license="Apache-2.0",
-        model_handler=GraniteFunctionCallingHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.granite.GraniteFunctionCallingHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1555,7 +1498,7 @@ local_inference_model_map = {
         url="https://huggingface.co/MadeAgents/Hammer2.1-7b",
         org="MadeAgents",
         license="cc-by-nc-4.0",
-        model_handler=HammerHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.hammer.HammerHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1567,7 +1510,7 @@ local_inference_model_map = {
         url="https://huggingface.co/MadeAgents/Hammer2.1-3b",
         org="MadeAgents",
         license="qwen-research",
-        model_handler=HammerHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.hammer.HammerHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1579,7 +1522,7 @@ local_inference_model_map = {
         url="https://huggingface.co/MadeAgents/Hammer2.1-1.5b",
         org="MadeAgents",
         license="cc-by-nc-4.0",
-        model_handler=HammerHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.hammer.HammerHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1591,7 +1534,7 @@ local_inference_model_map = {
         url="https://huggingface.co/MadeAgents/Hammer2.1-0.5b",
         org="MadeAgents",
         license="cc-by-nc-4.0",
-        model_handler=HammerHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.hammer.HammerHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1603,7 +1546,7 @@ local_inference_model_map = {
         url="https://huggingface.co/THUDM/glm-4-9b-chat",
         org="THUDM",
         license="glm-4",
-        model_handler=GLMHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.glm.GLMHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1615,7 +1558,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-0.6B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenFCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen_fc.QwenFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1627,7 +1570,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-0.6B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen.QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1639,7 +1582,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-1.7B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenFCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen_fc.QwenFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1651,7 +1594,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-1.7B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen.QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1663,7 +1606,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-4B-Instruct-2507",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenFCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen_fc.QwenFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1675,7 +1618,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-4B-Instruct-2507",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen.QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1687,7 +1630,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-8B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenFCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen_fc.QwenFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1699,7 +1642,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-8B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen.QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1711,7 +1654,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-14B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenFCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen_fc.QwenFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1723,7 +1666,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-14B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen.QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1735,7 +1678,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-32B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenFCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen_fc.QwenFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1747,7 +1690,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-32B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen.QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1759,7 +1702,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-30B-A3B-Instruct-2507",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenFCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen_fc.QwenFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1771,7 +1714,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-30B-A3B-Instruct-2507",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen.QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1783,7 +1726,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-235B-A22B-Instruct-2507",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenFCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen_fc.QwenFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1795,7 +1738,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-235B-A22B-Instruct-2507",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen.QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1807,7 +1750,7 @@ local_inference_model_map = {
         url="https://huggingface.co/X-Humanoid/Pelican1.0-VL-235B-A22B-FC",
         org="x-humanoid",
         license="apache-2.0",
-        model_handler=PelicanVLFCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.pelican_vl_fc.PelicanVLFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1819,7 +1762,7 @@ local_inference_model_map = {
         url="https://huggingface.co/X-Humanoid/Pelican1.0-VL-30B-A3B-FC",
         org="x-humanoid",
         license="apache-2.0",
-        model_handler=PelicanVLFCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.pelican_vl_fc.PelicanVLFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1831,7 +1774,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Team-ACE/ToolACE-2-8B",
         org="Huawei Noah & USTC",
         license="Apache-2.0",
-        model_handler=LlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1843,7 +1786,7 @@ local_inference_model_map = {
         url="https://huggingface.co/openbmb/MiniCPM3-4B",
         org="openbmb",
         license="Apache-2.0",
-        model_handler=MiniCPMHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.minicpm.MiniCPMHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1855,7 +1798,7 @@ local_inference_model_map = {
         url="https://huggingface.co/openbmb/MiniCPM3-4B",
         org="openbmb",
         license="Apache-2.0",
-        model_handler=MiniCPMFCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.minicpm_fc.MiniCPMFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1867,7 +1810,7 @@ local_inference_model_map = {
         url="https://huggingface.co/openbmb/MiniCPM-SALA",
         org="openbmb",
         license="Apache-2.0",
-        model_handler=OpenAICompletionsHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_completion.OpenAICompletionsHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1879,7 +1822,7 @@ local_inference_model_map = {
         url="https://huggingface.co/watt-ai/watt-tool-8B/",
         org="Watt AI Lab",
         license="Apache-2.0",
-        model_handler=LlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1891,7 +1834,7 @@ local_inference_model_map = {
         url="https://huggingface.co/watt-ai/watt-tool-70B/",
         org="Watt AI Lab",
         license="Apache-2.0",
-        model_handler=LlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1903,7 +1846,7 @@ local_inference_model_map = {
         url="https://huggingface.co/ZJared/Haha-7B",
         org="TeleAI",
         license="Apache 2.0",
-        model_handler=QwenHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen.QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1915,7 +1858,7 @@ local_inference_model_map = {
         url="https://huggingface.co/speakleash/Bielik-11B-v2.3-Instruct",
         org="SpeakLeash & ACK Cyfronet AGH",
         license="Apache 2.0",
-        model_handler=BielikHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.bielik.BielikHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1927,7 +1870,7 @@ local_inference_model_map = {
         url="https://huggingface.co/NovaSky-AI/Sky-T1-32B-Preview",
         org="NovaSky-AI",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen.QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1939,7 +1882,7 @@ local_inference_model_map = {
         url="https://huggingface.co/tiiuae/Falcon3-10B-Instruct",
         org="TII UAE",
         license="falcon-llm-license",
-        model_handler=Falcon3FCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.falcon_fc.Falcon3FCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1951,7 +1894,7 @@ local_inference_model_map = {
         url="https://huggingface.co/tiiuae/Falcon3-7B-Instruct",
         org="TII UAE",
         license="falcon-llm-license",
-        model_handler=Falcon3FCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.falcon_fc.Falcon3FCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1963,7 +1906,7 @@ local_inference_model_map = {
         url="https://huggingface.co/tiiuae/Falcon3-3B-Instruct",
         org="TII UAE",
         license="falcon-llm-license",
-        model_handler=Falcon3FCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.falcon_fc.Falcon3FCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1975,7 +1918,7 @@ local_inference_model_map = {
         url="https://huggingface.co/tiiuae/Falcon3-1B-Instruct",
         org="TII UAE",
         license="falcon-llm-license",
-        model_handler=Falcon3FCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.falcon_fc.Falcon3FCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1987,7 +1930,7 @@ local_inference_model_map = {
         url="https://huggingface.co/uiuc-convai/CoALM-8B",
         org="UIUC + Oumi",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1999,7 +1942,7 @@ local_inference_model_map = {
         url="https://huggingface.co/uiuc-convai/CoALM-70B",
         org="UIUC + Oumi",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -2011,7 +1954,7 @@ local_inference_model_map = {
         url="https://huggingface.co/uiuc-convai/CoALM-405B",
         org="UIUC + Oumi",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -2023,7 +1966,7 @@ local_inference_model_map = {
         url="https://huggingface.co/katanemo/Arch-Agent-1.5B",
         org="katanemo",
         license="katanemo-research",
-        model_handler=ArchHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.arch.ArchHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -2035,7 +1978,7 @@ local_inference_model_map = {
         url="https://huggingface.co/katanemo/Arch-Agent-3B",
         org="katanemo",
         license="katanemo-research",
-        model_handler=ArchHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.arch.ArchHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -2047,7 +1990,7 @@ local_inference_model_map = {
         url="https://huggingface.co/katanemo/Arch-Agent-7B",
         org="katanemo",
         license="katanemo-research",
-        model_handler=ArchHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.arch.ArchHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -2059,7 +2002,7 @@ local_inference_model_map = {
         url="https://huggingface.co/katanemo/Arch-Agent-32B",
         org="katanemo",
         license="katanemo-research",
-        model_handler=ArchHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.arch.ArchHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -2071,7 +2014,7 @@ local_inference_model_map = {
         url="https://huggingface.co/BitAgent/BitAgent-8B/",
         org="Bittensor",
         license="Apache-2.0",
-        model_handler=LlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -2083,7 +2026,7 @@ local_inference_model_map = {
         url="https://huggingface.co/BitAgent/BitAgent-Bounty-8B",
         org="Bittensor",
         license="Apache-2.0",
-        model_handler=BitAgentHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.bitagent.BitAgentHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -2095,7 +2038,7 @@ local_inference_model_map = {
         url="https://huggingface.co/ThinkAgents/ThinkAgent-1B",
         org="ThinkAgents",
         license="apache-2.0",
-        model_handler=ThinkAgentHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.think_agent.ThinkAgentHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -2107,7 +2050,7 @@ local_inference_model_map = {
         url="https://huggingface.co/phronetic-ai/RZN-T",
         org="Phronetic AI",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen.QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -2119,7 +2062,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Nanbeige/Nanbeige4-3B-Thinking-2511",
         org="Nanbeige",
         license="apache-2.0",
-        model_handler=NanbeigeFCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.nanbeige_fc.NanbeigeFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -2136,7 +2079,7 @@ third_party_inference_model_map = {
         url="https://huggingface.co/meta-llama/Llama-4-Maverick-17B-128E-Instruct-FP8",
         org="Meta",
         license="Meta Llama 4 Community",
-        model_handler=NovitaHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.novita.NovitaHandler",
         input_price=0.2,
         output_price=0.85,
         is_fc_model=False,
@@ -2148,7 +2091,7 @@ third_party_inference_model_map = {
         url="https://huggingface.co/meta-llama/Llama-4-Maverick-17B-128E-Instruct-FP8",
         org="Meta",
         license="Meta Llama 4 Community",
-        model_handler=NovitaHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.novita.NovitaHandler",
         input_price=0.2,
         output_price=0.85,
         is_fc_model=True,
@@ -2160,7 +2103,7 @@ third_party_inference_model_map = {
         url="https://huggingface.co/meta-llama/Llama-4-Scout-17B-16E-Instruct",
         org="Meta",
         license="Meta Llama 4 Community",
-        model_handler=NovitaHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.novita.NovitaHandler",
         input_price=0.1,
         output_price=0.5,
         is_fc_model=False,
@@ -2172,7 +2115,7 @@ third_party_inference_model_map = {
         url="https://huggingface.co/meta-llama/Llama-4-Scout-17B-16E-Instruct",
         org="Meta",
         license="Meta Llama 4 Community",
-        model_handler=NovitaHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.novita.NovitaHandler",
         input_price=0.1,
         output_price=0.5,
         is_fc_model=True,
@@ -2184,7 +2127,7 @@ third_party_inference_model_map = {
         url="https://huggingface.co/Qwen/QwQ-32B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=NovitaHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.novita.NovitaHandler",
         input_price=0.18,
         output_price=0.2,
         is_fc_model=True,
@@ -2196,7 +2139,7 @@ third_party_inference_model_map = {
         url="https://huggingface.co/Qwen/QwQ-32B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=NovitaHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.novita.NovitaHandler",
         input_price=0.18,
         output_price=0.2,
         is_fc_model=False,
@@ -2209,7 +2152,7 @@ third_party_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-4B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAgentThinkHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAgentThinkHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -2221,7 +2164,7 @@ third_party_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-4B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAgentNoThinkHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAgentNoThinkHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1,6 +1,7 @@
 import argparse
 import statistics
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 
 from bfcl_eval.constants.enums import Language, ReturnFormat
 from bfcl_eval.constants.eval_config import *
@@ -9,10 +10,12 @@ from bfcl_eval.eval_checker.agentic_eval.agentic_checker import agentic_checker
 from bfcl_eval.eval_checker.ast_eval.ast_checker import ast_checker
 from bfcl_eval.eval_checker.eval_runner_helper import *
 from bfcl_eval.eval_checker.multi_turn_eval.multi_turn_checker import (
+    ground_truth_cache,
     multi_turn_checker,
     multi_turn_irrelevance_checker,
 )
 from bfcl_eval.eval_checker.multi_turn_eval.multi_turn_utils import (
+    backend_session_store,
     is_empty_execute_response,
 )
 from bfcl_eval.model_handler.base_handler import BaseHandler
@@ -24,7 +27,7 @@ from tqdm import tqdm
 
 def get_handler(model_name: str) -> BaseHandler:
     config = MODEL_CONFIG_MAPPING[model_name]
-    handler: BaseHandler = config.model_handler(
+    handler: BaseHandler = config.get_handler_class()(
         model_name=config.model_name,
         temperature=0,
         registry_name=model_name,
@@ -540,6 +543,20 @@ def agentic_runner(
     )
 
 
+# Handler of a multi-turn evaluation worker process, built once by `_init_multi_turn_worker`
+_worker_handler = None
+
+
+def _init_multi_turn_worker(registry_name: str, ground_truth_cache_dir) -> None:
+    global _worker_handler
+    _worker_handler = get_handler(registry_name)
+    ground_truth_cache.cache_dir = ground_truth_cache_dir
+
+
+def _evaluate_multi_turn_entry_in_worker(entry_args: tuple):
+    return _evaluate_single_multi_turn_entry(_worker_handler, *entry_args)
+
+
 def multi_turn_runner(
     handler: BaseHandler,
     model_result,
@@ -548,29 +565,56 @@ def multi_turn_runner(
     model_name,
     test_category,
     score_dir,
+    eval_workers: int = 1,
 ):
     assert (
         len(model_result) == len(prompt) == len(possible_answer)
     ), f"The length of the model result ({len(model_result)}) does not match the length of the prompt ({len(prompt)}) or possible answer ({len(possible_answer)}). Please check the input files for completeness."
 
-    result = []
-    correct_count = 0
-    for i in range(len(model_result)):
-        index = model_result[i]["id"]
-        multi_turn_model_result_list = model_result[i]["result"]
-        multi_turn_ground_truth_list = possible_answer[i]["ground_truth"]
-        test_entry = prompt[i]
-
-        entry_result = _evaluate_single_multi_turn_entry(
-            handler,
-            index,
-            multi_turn_model_result_list,
-            multi_turn_ground_truth_list,
-            test_entry,
+    entry_args = [
+        (
+            model_result[i]["id"],
+            model_result[i]["result"],
+            possible_answer[i]["ground_truth"],
+            prompt[i],
             model_name,
             test_category,
         )
+        for i in range(len(model_result))
+    ]
 
+    result = []
+    correct_count = 0
+    eval_workers = min(eval_workers, len(entry_args))
+    if eval_workers > 1:
+        # Each worker process has its own handler and backend session store
+        # `map` yields the entry results in input order, so the score file is the same as in serial mode
+        with ProcessPoolExecutor(
+            max_workers=eval_workers,
+            initializer=_init_multi_turn_worker,
+            initargs=(handler.registry_name, ground_truth_cache.cache_dir),
+        ) as executor:
+            entry_results = list(
+                tqdm(
+                    executor.map(
+                        _evaluate_multi_turn_entry_in_worker,
+                        entry_args,
+                        chunksize=max(1, len(entry_args) // (eval_workers * 8)),
+                    ),
+                    total=len(entry_args),
+                    desc=f"Evaluating {test_category} ({eval_workers} workers)",
+                    leave=False,
+                )
+            )
+    else:
+        entry_results = []
+        progress_bar = tqdm(entry_args, desc=f"Evaluating {test_category}", leave=False)
+        for args in progress_bar:
+            entry_results.append(_evaluate_single_multi_turn_entry(handler, *args))
+            # Live backend instances; stays flat across the run since every entry releases its own
+            progress_bar.set_postfix(backend_session_store.postfix(), refresh=False)
+
+    for i, entry_result in enumerate(entry_results):
         if entry_result["valid"]:
             correct_count += 1
         else:
@@ -674,6 +718,7 @@ def evaluate_task(
     handler,
     leaderboard_table,
     allow_missing: bool = False,
+    eval_workers: int = 1,
 ):
     print(f"🔍 Running test: {test_category}")
 
@@ -725,6 +770,7 @@ def evaluate_task(
                 model_name,
                 test_category,
                 score_dir,
+                eval_workers=eval_workers,
             )
 
         elif is_agentic(test_category):
@@ -757,7 +803,12 @@ def evaluate_task(
 
 
 def runner(
-    model_names, test_categories, result_dir, score_dir, allow_missing: bool = False
+    model_names,
+    test_categories,
+    result_dir,
+    score_dir,
+    allow_missing: bool = False,
+    eval_workers: int = 1,
 ):
 
     # A dictionary to store the evaluation scores.
@@ -811,6 +862,7 @@ def runner(
                 handler,
                 leaderboard_table,
                 allow_missing=allow_missing,
+                eval_workers=eval_workers,
             )
 
     # This function reads all the score files from local folder and updates the
@@ -821,7 +873,15 @@ def runner(
     generate_leaderboard_csv(leaderboard_table, score_dir)
 
 
-def main(model, test_categories, result_dir, score_dir, partial_eval: bool = False):
+def main(
+    model,
+    test_categories,
+    result_dir,
+    score_dir,
+    partial_eval: bool = False,
+    eval_workers: int = 1,
+    ground_truth_disk_cache: bool = False,
+):
     if result_dir is None:
         result_dir = RESULT_PATH
     else:
@@ -837,6 +897,9 @@ def main(model, test_categories, result_dir, score_dir, partial_eval: bool = Fal
 
     all_test_categories = parse_test_category_argument(test_categories)
 
+    if ground_truth_disk_cache:
+        ground_truth_cache.cache_dir = GROUND_TRUTH_CACHE_DIR
+
     model_names = None
     if model:
         model_names = []
@@ -855,6 +918,7 @@ def main(model, test_categories, result_dir, score_dir, partial_eval: bool = Fal
         result_dir,
         score_dir,
         allow_missing=partial_eval,
+        eval_workers=eval_workers,
     )
 
     print(
@@ -901,6 +965,18 @@ if __name__ == "__main__":
         action="store_true",
         help="Run evaluation on a partial set of benchmark entries (eg. entries present in the model result files) without raising for missing IDs.",
     )
+    parser.add_argument(
+        "--eval-workers",
+        default=1,
+        type=int,
+        help="Number of worker processes used to evaluate the multi-turn categories. The score files are the same as with a single process.",
+    )
+    parser.add_argument(
+        "--ground-truth-disk-cache",
+        default=False,
+        action="store_true",
+        help="Also store the ground-truth execution of the multi-turn entries on disk, so that it is shared by the worker processes and reused by later evaluation runs.",
+    )
 
     args = parser.parse_args()
 
@@ -911,4 +987,6 @@ if __name__ == "__main__":
         args.result_dir,
         args.score_dir,
         partial_eval=args.partial_eval,
+        eval_workers=args.eval_workers,
+        ground_truth_disk_cache=args.ground_truth_disk_cache,
     )
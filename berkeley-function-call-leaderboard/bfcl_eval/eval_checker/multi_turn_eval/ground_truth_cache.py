@@ -0,0 +1,160 @@
+import hashlib
+import json
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+from bfcl_eval.eval_checker.multi_turn_eval.multi_turn_utils import (
+    backend_session,
+    execute_multi_turn_func_call,
+)
+
+# Bump this when the cached format changes
+GROUND_TRUTH_CACHE_VERSION = 1
+
+# Model name of the backend sessions used to execute the ground truth for the cache
+_GROUND_TRUTH_SESSION_NAME = "_ground_truth_cache"
+
+# Directory of the backend classes; their code is part of the cache key
+_BACKEND_SOURCE_DIR = Path(__file__).parent / "func_source_code"
+
+
+class GroundTruthExecutionCache:
+    """
+    Thread-safe cache of the ground-truth execution of multi-turn entries.
+
+    The ground-truth trajectory of an entry, its execution results and the state of the backend instances after each turn only depend on the entry, not on the model being evaluated. The first time an entry is checked, its ground truth is executed turn by turn, and every turn is recorded as its execution results and the pickled ground-truth instances. Checking the same entry for another model unpickles the recorded state of each turn instead of executing the ground truth again.
+
+    Entries are keyed by a hash of the entry (id, initial config, involved classes, ground truth, long context) and of the backend source code, so that a changed dataset or backend is never served from a stale record. At most `max_entries` entries are kept in memory, in LRU order. When `cache_dir` is set, records are also written there, so that they are shared by the worker processes of `--eval-workers` and by later runs.
+    """
+
+    def __init__(self, max_entries: int = 4096, cache_dir: Optional[Path] = None) -> None:
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self._records: "OrderedDict[str, list[tuple[list, bytes]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._backend_digest = None
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def get_turns(
+        self,
+        test_entry: dict,
+        multi_turn_ground_truth_list: list[list[str]],
+        long_context: bool,
+    ) -> Optional[list[tuple[list, bytes]]]:
+        """
+        Return one `(execution_results, pickled ground-truth instances)` pair per turn of the entry, executing the ground truth if it is not cached yet.
+        Returns None if the ground-truth instances cannot be pickled; the caller should then execute the ground truth itself.
+        """
+        key = self._get_entry_key(test_entry, multi_turn_ground_truth_list, long_context)
+        with self._lock:
+            turns = self._records.get(key)
+            if turns is not None:
+                self._records.move_to_end(key)
+                self.hits += 1
+                return turns
+
+        turns = self._load_from_disk(key)
+        if turns is not None:
+            with self._lock:
+                self.disk_hits += 1
+        else:
+            turns = self._execute(test_entry, multi_turn_ground_truth_list, long_context)
+            if turns is None:
+                return None
+            with self._lock:
+                self.misses += 1
+            self._write_to_disk(key, turns)
+
+        with self._lock:
+            self._records[key] = turns
+            while len(self._records) > self.max_entries:
+                self._records.popitem(last=False)
+        return turns
+
+    @staticmethod
+    def _execute(
+        test_entry: dict, multi_turn_ground_truth_list: list[list[str]], long_context: bool
+    ) -> Optional[list[tuple[list, bytes]]]:
+        turns = []
+        with backend_session(_GROUND_TRUTH_SESSION_NAME, test_entry["id"], is_evaL_run=True):
+            for single_turn_ground_truth_list in multi_turn_ground_truth_list:
+                execution_results, ground_truth_instances = execute_multi_turn_func_call(
+                    func_call_list=single_turn_ground_truth_list,
+                    initial_config=test_entry["initial_config"],
+                    involved_classes=test_entry["involved_classes"],
+                    model_name=_GROUND_TRUTH_SESSION_NAME,
+                    test_entry_id=test_entry["id"],
+                    long_context=long_context,
+                    is_evaL_run=True,
+                )
+                try:
+                    state = pickle.dumps(ground_truth_instances, protocol=pickle.HIGHEST_PROTOCOL)
+                except (pickle.PicklingError, TypeError, AttributeError):
+                    return None
+                turns.append((execution_results, state))
+        return turns
+
+    def _get_entry_key(
+        self, test_entry: dict, multi_turn_ground_truth_list: list[list[str]], long_context: bool
+    ) -> str:
+        if self._backend_digest is None:
+            backend_hash = hashlib.sha256()
+            for path in sorted(_BACKEND_SOURCE_DIR.glob("*.py")):
+                backend_hash.update(path.name.encode("utf-8"))
+                backend_hash.update(path.read_bytes())
+            self._backend_digest = backend_hash.hexdigest()
+
+        serialized = json.dumps(
+            [
+                GROUND_TRUTH_CACHE_VERSION,
+                self._backend_digest,
+                test_entry["id"],
+                test_entry["initial_config"],
+                test_entry["involved_classes"],
+                multi_turn_ground_truth_list,
+                long_context,
+            ],
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+    def _load_from_disk(self, key: str) -> Optional[list[tuple[list, bytes]]]:
+        if self.cache_dir is None:
+            return None
+        try:
+            with open(self.cache_dir / f"{key}.pkl", "rb") as f:
+                return pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, ValueError, TypeError):
+            # No record yet, or a partial or incompatible one; execute the ground truth again
+            return None
+
+    def _write_to_disk(self, key: str, turns: list[tuple[list, bytes]]) -> None:
+        if self.cache_dir is None:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_path = self.cache_dir / f"{key}.pkl"
+            # Write to a temporary file first, so that concurrent readers never see a partial record
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as f:
+                pickle.dump(turns, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            # The disk cache is only an optimization; a read-only project root should not break evaluation
+            pass
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._records),
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+            }
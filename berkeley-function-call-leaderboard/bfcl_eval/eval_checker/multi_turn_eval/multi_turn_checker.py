@@ -1,8 +1,18 @@
+import pickle
+
+from bfcl_eval.constants.eval_config import GROUND_TRUTH_CACHE_MAX_ENTRIES
+from bfcl_eval.eval_checker.multi_turn_eval.ground_truth_cache import (
+    GroundTruthExecutionCache,
+)
 from bfcl_eval.eval_checker.multi_turn_eval.multi_turn_utils import (
+    backend_session,
     execute_multi_turn_func_call,
     is_empty_execute_response,
 )
 
+# Ground-truth execution of the entries checked so far, shared by every model evaluated in the process
+ground_truth_cache = GroundTruthExecutionCache(max_entries=GROUND_TRUTH_CACHE_MAX_ENTRIES)
+
 #### Main functions ####
 
 
@@ -16,13 +26,38 @@ def multi_turn_checker(
     """
     The main function that checks the correctness of the model's function call execution.
     """
+    # The backend instances of the model and of the ground truth are released once the entry is checked
+    with backend_session(model_name, test_entry["id"], is_evaL_run=True), backend_session(
+        model_name + "_ground_truth", test_entry["id"], is_evaL_run=True
+    ):
+        return _multi_turn_checker(
+            multi_turn_model_result_list_decoded,
+            multi_turn_ground_truth_list,
+            test_entry,
+            test_category,
+            model_name,
+        )
+
 
+def _multi_turn_checker(
+    multi_turn_model_result_list_decoded: list[list[list[str]]],
+    multi_turn_ground_truth_list: list[list[str]],
+    test_entry: dict,
+    test_category: str,
+    model_name: str,
+) -> dict:
     initial_config: dict = test_entry["initial_config"]
     involved_classes: list = test_entry["involved_classes"]
     test_entry_id: str = test_entry["id"]
     test_category: str = test_entry_id.rsplit("_", 1)[0]
     execution_results: list[dict] = []
     all_turn_model_execution_results: list[str] = []
+    long_context = "long_context" in test_category or "composite" in test_category
+
+    # The ground truth does not depend on the model, so its execution is shared across models
+    ground_truth_turns = ground_truth_cache.get_turns(
+        test_entry, multi_turn_ground_truth_list, long_context
+    )
 
     # First execute all the function calls
     for turn_index, single_turn_ground_truth_list in enumerate(
@@ -45,9 +80,7 @@ def multi_turn_checker(
                     involved_classes=involved_classes,
                     model_name=model_name,
                     test_entry_id=test_entry_id,
-                    long_context=(
-                        "long_context" in test_category or "composite" in test_category
-                    ),
+                    long_context=long_context,
                     is_evaL_run=True,
                 )
             )
@@ -55,19 +88,27 @@ def multi_turn_checker(
             single_turn_model_execution_results_uncombined.append(single_step_model_execution_results)
 
         # Execute the ground truth function calls
-        single_turn_ground_truth_execution_results, ground_truth_instances = (
-            execute_multi_turn_func_call(
-                func_call_list=single_turn_ground_truth_list,
-                initial_config=initial_config,
-                involved_classes=involved_classes,
-                model_name=model_name + "_ground_truth",
-                test_entry_id=test_entry_id,
-                long_context=(
-                    "long_context" in test_category or "composite" in test_category
-                ),
-                is_evaL_run=True,
+        if ground_truth_turns is not None:
+            single_turn_ground_truth_execution_results, ground_truth_state = (
+                ground_truth_turns[turn_index]
+            )
+            # Copy the cached results, since they end up in the score file of every model
+            single_turn_ground_truth_execution_results = list(
+                single_turn_ground_truth_execution_results
+            )
+            ground_truth_instances = pickle.loads(ground_truth_state)
+        else:
+            single_turn_ground_truth_execution_results, ground_truth_instances = (
+                execute_multi_turn_func_call(
+                    func_call_list=single_turn_ground_truth_list,
+                    initial_config=initial_config,
+                    involved_classes=involved_classes,
+                    model_name=model_name + "_ground_truth",
+                    test_entry_id=test_entry_id,
+                    long_context=long_context,
+                    is_evaL_run=True,
+                )
             )
-        )
 
         all_turn_model_execution_results.extend(single_turn_model_execution_results)
         execution_results.append(
@@ -1,13 +1,67 @@
+import ast
 import copy
 import importlib
 import inspect
 import json
 import re
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Optional
 
+from bfcl_eval.constants.eval_config import (
+    BACKEND_SESSION_STORE_MAX_SESSIONS,
+    FUNC_CALL_PARSE_CACHE_SIZE,
+    SCENARIO_TEMPLATE_CACHE_MAX_TEMPLATES,
+)
 from bfcl_eval.constants.executable_backend_config import (
     CLASS_FILE_PATH_MAPPING,
+    SCENARIO_TEMPLATE_EXCLUDED_CLASSES,
     STATELESS_CLASSES,
 )
+from bfcl_eval.eval_checker.multi_turn_eval.scenario_cache import ScenarioTemplateCache
+from bfcl_eval.eval_checker.multi_turn_eval.session_store import BackendSessionStore
+
+# Backend instances of the multi-turn entries in progress, shared by every thread of the process
+backend_session_store = BackendSessionStore(max_sessions=BACKEND_SESSION_STORE_MAX_SESSIONS)
+
+# Loaded scenarios, cloned for every backend instance built from the same initial configuration
+scenario_template_cache = ScenarioTemplateCache(
+    max_templates=SCENARIO_TEMPLATE_CACHE_MAX_TEMPLATES,
+    excluded_classes=SCENARIO_TEMPLATE_EXCLUDED_CLASSES,
+)
+
+# Functions that are never executed, even if a backend class defines them
+FORBIDDEN_FUNCTION_NAMES = ["kill", "exit", "quit", "remove", "unlink", "popen", "Popen", "run"]
+
+# Public method names of each backend class
+_PUBLIC_METHOD_NAMES: dict[type, list[str]] = {}
+
+# Argument kinds of a compiled function call
+_LITERAL = "literal"
+_CALL = "call"
+
+
+def get_backend_session_key(
+    model_name: str, test_entry_id: str, is_evaL_run: bool = False
+) -> str:
+    if is_evaL_run:
+        model_name += "_eval"
+    # TODO: Handler the model name issue from handler more elegantly
+    return re.sub(r"[-./:]", "_", f"{model_name}_{test_entry_id}")
+
+
+@contextmanager
+def backend_session(model_name: str, test_entry_id: str, is_evaL_run: bool = False):
+    """
+    Keep the backend instances of one test entry alive across the `execute_multi_turn_func_call` calls made inside the block, and release them when it exits.
+    `model_name` and `is_evaL_run` should be the same as in those calls.
+    """
+    session_key = get_backend_session_key(model_name, test_entry_id, is_evaL_run)
+    backend_session_store.open(session_key)
+    try:
+        yield
+    finally:
+        backend_session_store.close(session_key)
 
 
 def execute_multi_turn_func_call(
@@ -22,65 +76,54 @@ def execute_multi_turn_func_call(
     """
     TODO: Add docstring
     """
-    if is_evaL_run:
-        model_name += "_eval"
+    session_key = get_backend_session_key(model_name, test_entry_id, is_evaL_run)
 
     class_method_name_mapping = {}
+    # Method name -> backend instance, for the direct dispatch of the function calls
+    method_table = {}
     involved_instances = {}
+    # The instances are only visible to the function calls of this session
+    instance_namespace = {}
     for class_name in involved_classes:
         module_name = CLASS_FILE_PATH_MAPPING[class_name]
-        # TODO: Handler the model name issue from handler more elegantly
-        instance_name = (
-            f"{model_name}_{test_entry_id}_{class_name}_instance"
-        )
-        instance_name = re.sub(r'[-./:]', '_', instance_name)
-        if instance_name not in globals():
+        instance_name = f"{session_key}_{class_name}_instance"
+        class_instance = backend_session_store.get(session_key, class_name)
+        if class_instance is None:
             module = importlib.import_module(module_name)
             class_ = getattr(module, class_name)
-            class_instance = class_()
-            if class_name not in STATELESS_CLASSES:
-                class_initial_config = initial_config.get(class_name, {})
-                # Deep copy the initial configuration to avoid mutation issues
-                class_instance._load_scenario(
-                    copy.deepcopy(class_initial_config), long_context=long_context
+            if class_name in STATELESS_CLASSES:
+                class_instance = class_()
+            else:
+                class_instance = scenario_template_cache.instantiate(
+                    class_,
+                    class_name,
+                    initial_config.get(class_name, {}),
+                    long_context=long_context,
                 )
-            globals()[instance_name] = class_instance
-        # This happens in subsequent turns
-        else:
-            class_instance = globals()[instance_name]
+            backend_session_store.put(session_key, class_name, class_instance)
 
         involved_instances[class_name] = class_instance
+        instance_namespace[instance_name] = class_instance
 
-        # Retrieve all method names and map them to the instance
-        for method_name, method in inspect.getmembers(
-            class_instance, predicate=inspect.ismethod
-        ):
-            # Skip private methods
-            if method_name.startswith("_"):
-                continue
+        for method_name in _get_public_method_names(class_instance):
             class_method_name_mapping[method_name] = instance_name
+            method_table[method_name] = class_instance
 
     execution_results = []
     for func_call in func_call_list:
-        # Add the instance name to the method calls
-        func_call = _process_method_calls(func_call, class_method_name_mapping)
-
-        # Evaluate the function call
         try:
-            # We need to make a copy here because otherwise the `eval(func_call)` would error. 
-            func_call_copy = func_call
-            # Before calling `eval`, we need to make sure that the function call is safe
-            # We do so by checking if the function is `kill` or `exit`, etc.
-            # Extract the function name first
-            if "(" in func_call_copy:
-                func_call_copy = func_call_copy.split("(")[0]
-            # Situation where the function call is a method call
-            if "." in func_call_copy:
-                func_call_copy = func_call_copy.split(".")[1]
-            if func_call_copy in ["kill", "exit", "quit", "remove", "unlink", "popen", "Popen", "run"]:
-                raise Exception(f"Function call {func_call_copy} is not allowed.")
-
-            func_call_result = eval(func_call)
+            compiled_call = _compile_func_call(func_call)
+            if compiled_call is not None and _can_dispatch(compiled_call, method_table):
+                method_name = compiled_call[0]
+                # Before calling the method, we need to make sure that the function call is safe
+                if method_name in FORBIDDEN_FUNCTION_NAMES:
+                    raise Exception(f"Function call {method_name} is not allowed.")
+                func_call_result = _dispatch(compiled_call, method_table)
+            else:
+                # Anything that is not a plain method call with literal arguments goes through `eval`
+                func_call_result = _eval_func_call(
+                    func_call, class_method_name_mapping, instance_namespace
+                )
 
             if type(func_call_result) == str:
                 pass
@@ -100,6 +143,120 @@ def execute_multi_turn_func_call(
     return execution_results, involved_instances
 
 
+def _get_public_method_names(class_instance) -> list[str]:
+    """
+    Names of the public methods of a backend instance, computed once per class.
+    """
+    class_ = type(class_instance)
+    method_names = _PUBLIC_METHOD_NAMES.get(class_)
+    if method_names is None:
+        method_names = [
+            method_name
+            for method_name, _ in inspect.getmembers(class_instance, predicate=inspect.ismethod)
+            # Skip private methods
+            if not method_name.startswith("_")
+        ]
+        _PUBLIC_METHOD_NAMES[class_] = method_names
+    return method_names
+
+
+@lru_cache(maxsize=FUNC_CALL_PARSE_CACHE_SIZE)
+def _compile_func_call(func_call: str) -> Optional[tuple]:
+    """
+    Parse a function call string such as `cd(folder='document')` into `(method_name, args, kwargs)`, where every argument is either `(_LITERAL, value)` or `(_CALL, compiled_call)` for a nested call.
+    Returns None if the string is anything else (eg, a syntax error, an attribute call, a non-literal argument), in which case the caller falls back to `eval`.
+    """
+    try:
+        node = ast.parse(func_call.strip(), mode="eval").body
+    except (SyntaxError, ValueError):
+        return None
+    return _compile_call_node(node)
+
+
+def _compile_call_node(node: ast.AST) -> Optional[tuple]:
+    if not isinstance(node, ast.Call) or not isinstance(node.func, ast.Name):
+        return None
+
+    args = []
+    for arg_node in node.args:
+        compiled_arg = _compile_argument_node(arg_node)
+        if compiled_arg is None:
+            return None
+        args.append(compiled_arg)
+
+    kwargs = []
+    for keyword in node.keywords:
+        # `**kwargs` unpacking
+        if keyword.arg is None:
+            return None
+        compiled_arg = _compile_argument_node(keyword.value)
+        if compiled_arg is None:
+            return None
+        kwargs.append((keyword.arg, compiled_arg))
+
+    return node.func.id, tuple(args), tuple(kwargs)
+
+
+def _compile_argument_node(node: ast.AST) -> Optional[tuple]:
+    if isinstance(node, ast.Call):
+        compiled_call = _compile_call_node(node)
+        return (_CALL, compiled_call) if compiled_call is not None else None
+    try:
+        return _LITERAL, ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return None
+
+
+def _can_dispatch(compiled_call: tuple, method_table: dict) -> bool:
+    """
+    Whether every function called in `compiled_call`, nested calls included, is a method of the involved instances.
+    """
+    method_name, args, kwargs = compiled_call
+    if method_name not in method_table:
+        return False
+    for kind, value in list(args) + [arg for _, arg in kwargs]:
+        if kind == _CALL and not _can_dispatch(value, method_table):
+            return False
+    return True
+
+
+def _dispatch(compiled_call: tuple, method_table: dict):
+    method_name, args, kwargs = compiled_call
+    method = getattr(method_table[method_name], method_name)
+    return method(
+        *[_resolve_argument(arg, method_table) for arg in args],
+        **{name: _resolve_argument(arg, method_table) for name, arg in kwargs},
+    )
+
+
+def _resolve_argument(compiled_arg: tuple, method_table: dict):
+    kind, value = compiled_arg
+    if kind == _CALL:
+        return _dispatch(value, method_table)
+    # The parsed value is cached, so each call gets its own copy in case the method mutates it
+    return copy.deepcopy(value)
+
+
+def _eval_func_call(func_call: str, class_method_name_mapping: dict, instance_namespace: dict):
+    # Add the instance name to the method calls
+    func_call = _process_method_calls(func_call, class_method_name_mapping)
+
+    # We need to make a copy here because otherwise the `eval(func_call)` would error.
+    func_call_copy = func_call
+    # Before calling `eval`, we need to make sure that the function call is safe
+    # We do so by checking if the function is `kill` or `exit`, etc.
+    # Extract the function name first
+    if "(" in func_call_copy:
+        func_call_copy = func_call_copy.split("(")[0]
+    # Situation where the function call is a method call
+    if "." in func_call_copy:
+        func_call_copy = func_call_copy.split(".")[1]
+    if func_call_copy in FORBIDDEN_FUNCTION_NAMES:
+        raise Exception(f"Function call {func_call_copy} is not allowed.")
+
+    return eval(func_call, globals(), instance_namespace)
+
+
 def is_empty_execute_response(input_list: list):
     if len(input_list) == 0:
         return True
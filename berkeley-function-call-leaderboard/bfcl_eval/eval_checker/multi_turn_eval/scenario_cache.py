@@ -0,0 +1,83 @@
+import copy
+import hashlib
+import json
+import pickle
+import threading
+from collections import OrderedDict
+from typing import Any, Iterable
+
+
+class ScenarioTemplateCache:
+    """
+    Thread-safe cache of loaded backend instances, keyed by class, initial configuration and `long_context`.
+
+    The first time a scenario is requested, the instance is built with `_load_scenario` as usual and pickled into a template. Every later request for the same scenario (eg, the `_eval` and `_ground_truth` instances of the entry the model instance was built for, or the same entry for another model) unpickles a fresh clone of the template instead of loading the scenario again. A clone shares nothing with the template or with the other clones, so the backend code can keep mutating its state in place.
+
+    Classes listed in `excluded_classes` (eg, the memory backends, whose `_load_scenario` reads and writes snapshot files per test entry), and classes whose instances cannot be pickled, are always loaded directly. At most `max_templates` templates are kept, in LRU order.
+    """
+
+    def __init__(self, max_templates: int = 512, excluded_classes: Iterable[str] = ()) -> None:
+        self.max_templates = max_templates
+        self.excluded_classes = set(excluded_classes)
+        self._templates: "OrderedDict[tuple, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def instantiate(
+        self, class_: type, class_name: str, initial_config: dict, long_context: bool = False
+    ) -> Any:
+        """
+        Return a new instance of `class_` with `initial_config` loaded, as `_load_scenario` would.
+        """
+        if class_name in self.excluded_classes:
+            return self._load(class_, initial_config, long_context)
+
+        key = (class_name, _hash_config(initial_config), long_context)
+        with self._lock:
+            template = self._templates.get(key)
+            if template is not None:
+                self._templates.move_to_end(key)
+                self.hits += 1
+        if template is not None:
+            return pickle.loads(template)
+
+        class_instance = self._load(class_, initial_config, long_context)
+        try:
+            template = pickle.dumps(class_instance, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            # Eg, the instance holds a client or a lock; never try to cache this class again
+            self.excluded_classes.add(class_name)
+            return class_instance
+
+        with self._lock:
+            self.misses += 1
+            self._templates[key] = template
+            while len(self._templates) > self.max_templates:
+                self._templates.popitem(last=False)
+        return class_instance
+
+    @staticmethod
+    def _load(class_: type, initial_config: dict, long_context: bool) -> Any:
+        class_instance = class_()
+        # Deep copy the initial configuration to avoid mutation issues
+        class_instance._load_scenario(copy.deepcopy(initial_config), long_context=long_context)
+        return class_instance
+
+    def clear(self) -> None:
+        with self._lock:
+            self._templates.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "templates": len(self._templates),
+                "template_bytes": sum(len(template) for template in self._templates.values()),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+def _hash_config(initial_config: dict) -> str:
+    serialized = json.dumps(initial_config, sort_keys=True, ensure_ascii=False, default=repr)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
@@ -0,0 +1,128 @@
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+def estimate_size(obj: Any, max_objects: int = 1_000_000) -> int:
+    """
+    Approximate deep size in bytes of `obj`: `sys.getsizeof` summed over everything reachable through containers and instance attributes, each object counted once.
+    """
+    seen = set()
+    stack = [obj]
+    total = 0
+    while stack and len(seen) < max_objects:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        try:
+            total += sys.getsizeof(current)
+        except TypeError:
+            continue
+
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        elif hasattr(current, "__dict__") and not isinstance(current, type):
+            stack.append(vars(current))
+    return total
+
+
+class BackendSession:
+    def __init__(self) -> None:
+        self.instances: dict[str, Any] = {}
+        self.estimated_bytes = 0
+        # Number of `open` calls not yet closed; a pinned session is never evicted
+        self.pin_count = 0
+
+
+class BackendSessionStore:
+    """
+    Thread-safe store of the backend instances (eg, `GorillaFileSystem`, `TradingBot`) of multi-turn test entries, one session per model and test entry.
+
+    A session is pinned between `open` and `close`: the inference and evaluation flows open the session of an entry before its first turn and close it once the entry is done, which drops its instances. Sessions that are used without being opened (eg, by scripts) are unpinned, and the least recently used of them are evicted once the store holds more than `max_sessions` sessions, so a long run keeps a bounded number of instances alive.
+
+    The memory of every instance is estimated once, when it is created; `stats` and `postfix` report the live sessions and their estimated size for the progress bars.
+    """
+
+    def __init__(self, max_sessions: int = 1024) -> None:
+        self.max_sessions = max_sessions
+        self._sessions: "OrderedDict[str, BackendSession]" = OrderedDict()
+        self._lock = threading.RLock()
+        self.evicted_sessions = 0
+        self.peak_sessions = 0
+        self.peak_bytes = 0
+
+    def open(self, session_key: str) -> None:
+        with self._lock:
+            session = self._touch(session_key)
+            session.pin_count += 1
+
+    def close(self, session_key: str) -> None:
+        with self._lock:
+            session = self._sessions.get(session_key)
+            if session is None:
+                return
+            session.pin_count -= 1
+            if session.pin_count <= 0:
+                del self._sessions[session_key]
+
+    def get(self, session_key: str, class_name: str) -> Optional[Any]:
+        with self._lock:
+            return self._touch(session_key).instances.get(class_name)
+
+    def put(self, session_key: str, class_name: str, instance: Any) -> None:
+        estimated_bytes = estimate_size(instance)
+        with self._lock:
+            session = self._touch(session_key)
+            session.instances[class_name] = instance
+            session.estimated_bytes += estimated_bytes
+            self._evict()
+            self.peak_sessions = max(self.peak_sessions, len(self._sessions))
+            self.peak_bytes = max(self.peak_bytes, self.estimated_bytes)
+
+    @property
+    def estimated_bytes(self) -> int:
+        with self._lock:
+            return sum(session.estimated_bytes for session in self._sessions.values())
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def _touch(self, session_key: str) -> BackendSession:
+        session = self._sessions.get(session_key)
+        if session is None:
+            session = self._sessions[session_key] = BackendSession()
+        else:
+            self._sessions.move_to_end(session_key)
+        return session
+
+    def _evict(self) -> None:
+        if len(self._sessions) <= self.max_sessions:
+            return
+        for session_key in list(self._sessions):
+            if len(self._sessions) <= self.max_sessions:
+                break
+            if self._sessions[session_key].pin_count <= 0:
+                del self._sessions[session_key]
+                self.evicted_sessions += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "sessions": len(self._sessions),
+                "estimated_bytes": self.estimated_bytes,
+                "peak_sessions": self.peak_sessions,
+                "peak_bytes": self.peak_bytes,
+                "evicted_sessions": self.evicted_sessions,
+            }
+
+    def postfix(self) -> dict:
+        with self._lock:
+            return {
+                "sessions": len(self._sessions),
+                "backend mem": f"{self.estimated_bytes / 2**20:.0f}MB",
+            }
@@ -4,6 +4,7 @@ import time
 from typing import Any
 
 from bfcl_eval.constants.type_mappings import GORILLA_TO_OPENAPI
+from bfcl_eval.model_handler.async_client_pool import AsyncClientPool
 from bfcl_eval.model_handler.base_handler import BaseHandler
 from bfcl_eval.constants.enums import ModelStyle
 from bfcl_eval.model_handler.utils import (
@@ -15,7 +16,7 @@ from bfcl_eval.model_handler.utils import (
     retry_with_backoff,
     system_prompt_pre_processing_chat_model,
 )
-from openai import OpenAI, RateLimitError
+from openai import AsyncOpenAI, OpenAI, RateLimitError
 
 
 class OpenAICompletionsHandler(BaseHandler):
@@ -30,6 +31,30 @@ class OpenAICompletionsHandler(BaseHandler):
         super().__init__(model_name, temperature, registry_name, is_fc_model, **kwargs)
         self.model_style = ModelStyle.OPENAI_COMPLETIONS
         self.client = OpenAI(**self._build_client_kwargs())
+        # Clients are created lazily inside the event loop of the `async` execution mode
+        self.async_client_pool = AsyncClientPool(self._build_async_client)
+
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        return self.async_client_pool.get()
+
+    def _build_async_client(self, http_client) -> AsyncOpenAI:
+        # Mirror the sync client, since many subclasses replace `self.client` to point at a different provider
+        return AsyncOpenAI(
+            api_key=self.client.api_key,
+            organization=self.client.organization,
+            base_url=self.client.base_url,
+            timeout=self.client.timeout,
+            max_retries=self.client.max_retries,
+            default_headers=getattr(self.client, "_custom_headers", None),
+            http_client=http_client,
+        )
+
+    def configure_async_clients(self, max_concurrency: int) -> None:
+        self.async_client_pool.max_concurrency = max_concurrency
+
+    async def close_async_clients(self) -> None:
+        await self.async_client_pool.aclose()
 
     def _build_client_kwargs(self):
         """Collect OpenAI client keyword arguments from environment variables, but only
@@ -74,9 +99,38 @@ class OpenAICompletionsHandler(BaseHandler):
 
         return api_response, end_time - start_time
 
+    @retry_with_backoff(error_type=RateLimitError)
+    async def generate_with_backoff_async(self, **kwargs):
+        start_time = time.time()
+        api_response = await self.async_client.chat.completions.create(**kwargs)
+        end_time = time.time()
+
+        return api_response, end_time - start_time
+
+    def _has_native_async_query(self, sync_query_name: str, async_query_name: str) -> bool:
+        """
+        Subclasses that only override the sync query path (eg, to use a different client or retry policy) must not silently take the async path defined here.
+        """
+        return (
+            isinstance(self.client, OpenAI)
+            and self._has_native_async(sync_query_name, async_query_name)
+            and self._has_native_async("generate_with_backoff", "generate_with_backoff_async")
+        )
+
     #### FC methods ####
 
     def _query_FC(self, inference_data: dict):
+        return self.generate_with_backoff(**self._build_FC_request(inference_data))
+
+    async def _query_FC_async(self, inference_data: dict):
+        if not self._has_native_async_query("_query_FC", "_query_FC_async"):
+            return await super()._query_FC_async(inference_data)
+
+        return await self.generate_with_backoff_async(
+            **self._build_FC_request(inference_data)
+        )
+
+    def _build_FC_request(self, inference_data: dict) -> dict:
         message: list[dict] = inference_data["message"]
         tools = inference_data["tools"]
         inference_data["inference_input_log"] = {"message": repr(message), "tools": tools}
@@ -91,7 +145,7 @@ class OpenAICompletionsHandler(BaseHandler):
         if len(tools) > 0:
             kwargs["tools"] = tools
 
-        return self.generate_with_backoff(**kwargs)
+        return kwargs
 
     def _pre_query_processing_FC(self, inference_data: dict, test_entry: dict) -> dict:
         inference_data["message"] = []
@@ -216,15 +270,26 @@ class OpenAICompletionsHandler(BaseHandler):
     #### Prompting methods ####
 
     def _query_prompting(self, inference_data: dict):
-        inference_data["inference_input_log"] = {"message": repr(inference_data["message"])}
+        return self.generate_with_backoff(**self._build_prompting_request(inference_data))
+
+    async def _query_prompting_async(self, inference_data: dict):
+        if not self._has_native_async_query("_query_prompting", "_query_prompting_async"):
+            return await super()._query_prompting_async(inference_data)
 
-        return self.generate_with_backoff(
-            messages=inference_data["message"],
-            model=self.model_name,
-            temperature=self.temperature,
-            store=False,
+        return await self.generate_with_backoff_async(
+            **self._build_prompting_request(inference_data)
         )
 
+    def _build_prompting_request(self, inference_data: dict) -> dict:
+        inference_data["inference_input_log"] = {"message": repr(inference_data["message"])}
+
+        return {
+            "messages": inference_data["message"],
+            "model": self.model_name,
+            "temperature": self.temperature,
+            "store": False,
+        }
+
     def _pre_query_processing_prompting(self, test_entry: dict) -> dict:
         functions: list = test_entry["function"]
         test_entry_id: str = test_entry["id"]
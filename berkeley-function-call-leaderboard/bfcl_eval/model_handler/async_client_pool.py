@@ -0,0 +1,58 @@
+import math
+from typing import Callable
+
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+
+class AsyncClientPool:
+    """
+    Round-robin over several `AsyncOpenAI` clients, so that no single HTTP connection pool holds hundreds of connections.
+
+    httpx's connection pool scans every one of its connections and queued requests each time a request starts or a response is closed. With one client and 1000 requests in flight, that bookkeeping costs more CPU than the rest of the request, and caps the `async` execution mode well below what the concurrency allows. Requests are therefore spread over `ceil(max_concurrency / connections_per_client)` clients. Each client's own pool is unbounded, as the scheduler already bounds the number of requests in flight.
+
+    `client_factory(http_client)` builds one client around the given `httpx.AsyncClient`. Clients are created lazily, inside the event loop that uses them, and share one SSL context, since loading the CA bundle is the most expensive part of creating a client.
+    """
+
+    def __init__(
+        self,
+        client_factory: Callable[[httpx.AsyncClient], AsyncOpenAI],
+        connections_per_client: int = 32,
+    ) -> None:
+        self.client_factory = client_factory
+        self.connections_per_client = connections_per_client
+        # Upper bound of the requests in flight through the pool; set by `BaseHandler.configure_async_clients`
+        self.max_concurrency = 1
+        self._clients: list[AsyncOpenAI] = []
+        self._next_index = 0
+        self._ssl_context = None
+
+    def get(self) -> AsyncOpenAI:
+        num_clients = max(1, math.ceil(self.max_concurrency / self.connections_per_client))
+        index = self._next_index % num_clients
+        self._next_index = index + 1
+        while len(self._clients) <= index:
+            if self._ssl_context is None:
+                self._ssl_context = httpx.create_ssl_context()
+            self._clients.append(
+                self.client_factory(
+                    DefaultAsyncHttpxClient(
+                        verify=self._ssl_context,
+                        limits=httpx.Limits(max_connections=None, max_keepalive_connections=None),
+                    )
+                )
+            )
+        return self._clients[index]
+
+    async def aclose(self) -> None:
+        """
+        Close the clients, which are bound to the event loop they were used in. The next `get` creates new ones.
+        """
+        clients, self._clients = self._clients, []
+        self._next_index = 0
+        for client in clients:
+            await client.close()
+
+    @property
+    def num_clients(self) -> int:
+        return len(self._clients)
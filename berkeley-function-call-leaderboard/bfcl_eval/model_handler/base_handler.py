@@ -1,6 +1,6 @@
+import asyncio
 import json
-from copy import deepcopy
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Optional
 
 from bfcl_eval.constants.category_mapping import VERSION_PREFIX
 from bfcl_eval.constants.default_prompts import (
@@ -15,10 +15,17 @@ from bfcl_eval.constants.executable_backend_config import (
     STATELESS_CLASSES,
 )
 from bfcl_eval.eval_checker.multi_turn_eval.multi_turn_utils import (
+    backend_session,
     execute_multi_turn_func_call,
     is_empty_execute_response,
 )
+from bfcl_eval.model_handler.rate_limiter import (
+    estimate_request_tokens,
+    response_token_usage,
+)
 from bfcl_eval.model_handler.utils import add_memory_instruction_system_prompt
+from bfcl_eval.result_store import ResultJournal, serialize_result_entry
+from bfcl_eval.state_log import StateLogger
 from bfcl_eval.utils import *
 from overrides import final
 
@@ -26,6 +33,9 @@ if TYPE_CHECKING:
     from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.memory_api_metaclass import (
         MemoryAPI,
     )
+    from bfcl_eval.model_handler.rate_limiter import RateLimiter
+    from bfcl_eval.model_handler.request_hedging import HedgingPolicy
+    from bfcl_eval.model_handler.response_cache import ResponseCache
 
 
 class BaseHandler:
@@ -36,6 +46,14 @@ class BaseHandler:
     registry_dir_name: str
     model_name_underline_replaced: str
     model_style: ModelStyle
+    # Set by the generation pipeline when `--cache-mode` is not `off`
+    response_cache: Optional["ResponseCache"] = None
+    # Set by the generation pipeline when `--request-deadline` or `--hedge-requests` is used
+    hedging_policy: Optional["HedgingPolicy"] = None
+    # Set by the generation pipeline when `--requests-per-minute` or `--tokens-per-minute` is used; shared by the handlers of the same provider account
+    rate_limiter: Optional["RateLimiter"] = None
+    # Set by the generation pipeline from `--state-log-format`: "full" logs the complete backend state after every turn, "delta" only the changes
+    state_log_format: str = "full"
 
     def __init__(
         self, model_name, temperature, registry_name, is_fc_model, **kwargs
@@ -91,12 +109,88 @@ class BaseHandler:
             else:
                 return self.inference_single_turn_prompting(test_entry, include_input_log)
 
+    async def inference_async(
+        self,
+        test_entry: dict,
+        include_input_log: bool,
+        exclude_state_log: bool,
+    ):
+        """
+        Asyncio counterpart of `inference`, used by the `async` execution mode.
+
+        Single-turn entries await `_query_FC_async`/`_query_prompting_async` directly. Multi-turn and agentic entries execute the backend function calls synchronously between model queries, so they run through the thread bridge (`asyncio.to_thread`) as a whole.
+        If a subclass overrides `inference` without providing a matching `inference_async`, the whole sync `inference` is bridged so that the override is still respected.
+        """
+        if not self._has_native_async("inference", "inference_async"):
+            return await asyncio.to_thread(
+                self.inference, test_entry, include_input_log, exclude_state_log
+            )
+
+        if contain_multi_turn_interaction(test_entry["id"]):
+            return await asyncio.to_thread(
+                self.inference, test_entry, include_input_log, exclude_state_log
+            )
+
+        # TODO: Let all models have the is_fc_model attribute and remove the "FC" check
+        if "FC" in self.registry_name or self.is_fc_model:
+            return await self.inference_single_turn_FC_async(test_entry, include_input_log)
+        else:
+            return await self.inference_single_turn_prompting_async(
+                test_entry, include_input_log
+            )
+
+    @final
+    def _has_native_async(self, sync_method_name: str, async_method_name: str) -> bool:
+        """
+        Check whether `async_method_name` is implemented at the same level or deeper in the class hierarchy than `sync_method_name`.
+
+        When a subclass only overrides the sync method, the inherited async method would silently bypass that override. In that case, callers should fall back to running the sync method through the thread bridge.
+        """
+
+        def _defining_class(method_name: str):
+            for cls in type(self).__mro__:
+                if method_name in vars(cls):
+                    return cls
+            return None
+
+        sync_owner = _defining_class(sync_method_name)
+        async_owner = _defining_class(async_method_name)
+        if sync_owner is None or async_owner is None:
+            return False
+        return issubclass(async_owner, sync_owner)
+
+    def configure_async_clients(self, max_concurrency: int) -> None:
+        """
+        Size the connection pools of the async clients for up to `max_concurrency` requests in flight. Called by the `async` execution mode before the first request.
+        Handlers built on an async client should override this, together with `close_async_clients`.
+        """
+        pass
+
+    async def close_async_clients(self) -> None:
+        """
+        Close the async clients at the end of the `async` execution mode, while their event loop is still running.
+        """
+        pass
+
     @final
     def inference_multi_turn_FC(
         self,
         test_entry: dict,
         include_input_log: bool,
         exclude_state_log: bool,
+    ) -> tuple[list[list], dict]:
+        # The backend instances of the entry are released once it is done, even if the inference fails
+        with backend_session(self.model_name_underline_replaced, test_entry["id"]):
+            return self._inference_multi_turn_FC(
+                test_entry, include_input_log, exclude_state_log
+            )
+
+    @final
+    def _inference_multi_turn_FC(
+        self,
+        test_entry: dict,
+        include_input_log: bool,
+        exclude_state_log: bool,
     ) -> tuple[list[list], dict]:
         initial_config: dict = test_entry.get("initial_config", {})
         involved_classes: list = test_entry["involved_classes"]
@@ -144,24 +238,12 @@ class BaseHandler:
                 memory_instance,
             )
 
+        state_logger = StateLogger(
+            self.state_log_format,
+            skipped_classes=STATELESS_CLASSES + OMIT_STATE_INFO_CLASSES,
+        )
         if not exclude_state_log:
-            state_log = []
-            for class_name, class_instance in involved_instances.items():
-                if class_name in STATELESS_CLASSES or class_name in OMIT_STATE_INFO_CLASSES:
-                    continue
-                # Avoid modification in future turns
-                class_instance = deepcopy(class_instance)
-                state_log.append(
-                    {
-                        "role": "state_info",
-                        "class_name": class_name,
-                        "content": {
-                            key: value
-                            for key, value in vars(class_instance).items()
-                            if not key.startswith("_")
-                        },
-                    }
-                )
+            state_log = state_logger.record(involved_instances)
             if len(state_log) > 0:
                 all_inference_log.append(state_log)
 
@@ -217,7 +299,7 @@ class BaseHandler:
                 # Add to the current_turn_inference_log at beginning of each step so that we don't need to bother dealing with the break statements
                 current_turn_inference_log[f"step_{count}"] = current_step_inference_log
 
-                api_response, query_latency = self._query_FC(inference_data)
+                api_response, query_latency = self._query("FC", inference_data)
 
                 # This part of logging is disabled by default because it is too verbose and will make the result file extremely large
                 # It is only useful to see if the inference pipeline is working as expected (eg, does it convert all the inputs correctly)
@@ -340,26 +422,7 @@ class BaseHandler:
             total_latency.append(current_turn_latency)
 
             if not exclude_state_log:
-                state_log = []
-                for class_name, class_instance in involved_instances.items():
-                    if (
-                        class_name in STATELESS_CLASSES
-                        or class_name in OMIT_STATE_INFO_CLASSES
-                    ):
-                        continue
-                    # Avoid modification in future turns
-                    class_instance = deepcopy(class_instance)
-                    state_log.append(
-                        {
-                            "role": "state_info",
-                            "class_name": class_name,
-                            "content": {
-                                key: value
-                                for key, value in vars(class_instance).items()
-                                if not key.startswith("_")
-                            },
-                        }
-                    )
+                state_log = state_logger.record(involved_instances)
                 if len(state_log) > 0:
                     all_inference_log.append(state_log)
 
@@ -396,6 +459,19 @@ class BaseHandler:
         test_entry: dict,
         include_input_log: bool,
         exclude_state_log: bool,
+    ) -> tuple[list[list], dict]:
+        # The backend instances of the entry are released once it is done, even if the inference fails
+        with backend_session(self.model_name_underline_replaced, test_entry["id"]):
+            return self._inference_multi_turn_prompting(
+                test_entry, include_input_log, exclude_state_log
+            )
+
+    @final
+    def _inference_multi_turn_prompting(
+        self,
+        test_entry: dict,
+        include_input_log: bool,
+        exclude_state_log: bool,
     ) -> tuple[list[list], dict]:
         initial_config: dict = test_entry.get("initial_config", {})
         involved_classes: list = test_entry["involved_classes"]
@@ -441,24 +517,12 @@ class BaseHandler:
                 memory_instance,
             )
 
+        state_logger = StateLogger(
+            self.state_log_format,
+            skipped_classes=STATELESS_CLASSES + OMIT_STATE_INFO_CLASSES,
+        )
         if not exclude_state_log:
-            state_log = []
-            for class_name, class_instance in involved_instances.items():
-                if class_name in STATELESS_CLASSES or class_name in OMIT_STATE_INFO_CLASSES:
-                    continue
-                # Avoid modification in future turns
-                class_instance = deepcopy(class_instance)
-                state_log.append(
-                    {
-                        "role": "state_info",
-                        "class_name": class_name,
-                        "content": {
-                            key: value
-                            for key, value in vars(class_instance).items()
-                            if not key.startswith("_")
-                        },
-                    }
-                )
+            state_log = state_logger.record(involved_instances)
             if len(state_log) > 0:
                 all_inference_log.append(state_log)
 
@@ -509,7 +573,7 @@ class BaseHandler:
                 # Add to the current_turn_inference_log at beginning of each step so that we don't need to bother dealing with the break statements
                 current_turn_inference_log[f"step_{count}"] = current_step_inference_log
 
-                api_response, query_latency = self._query_prompting(inference_data)
+                api_response, query_latency = self._query("prompting", inference_data)
 
                 # This part of logging is disabled by default because it is too verbose and will make the result file extremely large
                 # It is only useful to see if the inference pipeline is working as expected (eg, does it convert all the inputs correctly)
@@ -631,26 +695,7 @@ class BaseHandler:
             total_latency.append(current_turn_latency)
 
             if not exclude_state_log:
-                state_log = []
-                for class_name, class_instance in involved_instances.items():
-                    if (
-                        class_name in STATELESS_CLASSES
-                        or class_name in OMIT_STATE_INFO_CLASSES
-                    ):
-                        continue
-                    # Avoid modification in future turns
-                    class_instance = deepcopy(class_instance)
-                    state_log.append(
-                        {
-                            "role": "state_info",
-                            "class_name": class_name,
-                            "content": {
-                                key: value
-                                for key, value in vars(class_instance).items()
-                                if not key.startswith("_")
-                            },
-                        }
-                    )
+                state_log = state_logger.record(involved_instances)
                 if len(state_log) > 0:
                     all_inference_log.append(state_log)
 
@@ -685,53 +730,88 @@ class BaseHandler:
     def inference_single_turn_FC(
         self, test_entry: dict, include_input_log: bool
     ) -> tuple[any, dict]:
-        inference_data: dict = {}
-        inference_data = self._pre_query_processing_FC(inference_data, test_entry)
-        inference_data = self._compile_tools(inference_data, test_entry)
-        inference_data = self.add_first_turn_message_FC(
-            inference_data, test_entry["question"][0]
-        )
+        inference_data = self._prepare_single_turn_FC(test_entry)
 
-        api_response, query_latency = self._query_FC(inference_data)
+        api_response, query_latency = self._query("FC", inference_data)
 
         # Try parsing the model response
         model_response_data = self._parse_query_response_FC(api_response)
 
-        # Process the metadata
-        metadata = {}
-        if include_input_log:
-            metadata["inference_log"] = [
-                {
-                    "role": "inference_input",
-                    "content": inference_data.get("inference_input_log", ""),
-                }
-            ]
-        metadata["input_token_count"] = model_response_data["input_token"]
-        metadata["output_token_count"] = model_response_data["output_token"]
-        metadata["latency"] = query_latency
+        return self._collect_single_turn_result(
+            inference_data, model_response_data, query_latency, include_input_log
+        )
 
-        if (
-            "reasoning_content" in model_response_data
-            and model_response_data["reasoning_content"] != ""
-        ):
-            metadata["reasoning_content"] = model_response_data["reasoning_content"]
+    @final
+    async def inference_single_turn_FC_async(
+        self, test_entry: dict, include_input_log: bool
+    ) -> tuple[any, dict]:
+        inference_data = self._prepare_single_turn_FC(test_entry)
 
-        return model_response_data["model_responses"], metadata
+        api_response, query_latency = await self._query_async("FC", inference_data)
+
+        # Try parsing the model response
+        model_response_data = self._parse_query_response_FC(api_response)
+
+        return self._collect_single_turn_result(
+            inference_data, model_response_data, query_latency, include_input_log
+        )
 
     @final
     def inference_single_turn_prompting(
         self, test_entry: dict, include_input_log: bool
     ) -> tuple[any, dict]:
-        inference_data: dict = self._pre_query_processing_prompting(test_entry)
-        inference_data = self.add_first_turn_message_prompting(
-            inference_data, test_entry["question"][0]
+        inference_data = self._prepare_single_turn_prompting(test_entry)
+
+        api_response, query_latency = self._query("prompting", inference_data)
+
+        # Try parsing the model response
+        model_response_data = self._parse_query_response_prompting(api_response)
+
+        return self._collect_single_turn_result(
+            inference_data, model_response_data, query_latency, include_input_log
         )
 
-        api_response, query_latency = self._query_prompting(inference_data)
+    @final
+    async def inference_single_turn_prompting_async(
+        self, test_entry: dict, include_input_log: bool
+    ) -> tuple[any, dict]:
+        inference_data = self._prepare_single_turn_prompting(test_entry)
+
+        api_response, query_latency = await self._query_async("prompting", inference_data)
 
         # Try parsing the model response
         model_response_data = self._parse_query_response_prompting(api_response)
 
+        return self._collect_single_turn_result(
+            inference_data, model_response_data, query_latency, include_input_log
+        )
+
+    @final
+    def _prepare_single_turn_FC(self, test_entry: dict) -> dict:
+        inference_data: dict = {}
+        inference_data = self._pre_query_processing_FC(inference_data, test_entry)
+        inference_data = self._compile_tools(inference_data, test_entry)
+        inference_data = self.add_first_turn_message_FC(
+            inference_data, test_entry["question"][0]
+        )
+        return inference_data
+
+    @final
+    def _prepare_single_turn_prompting(self, test_entry: dict) -> dict:
+        inference_data: dict = self._pre_query_processing_prompting(test_entry)
+        inference_data = self.add_first_turn_message_prompting(
+            inference_data, test_entry["question"][0]
+        )
+        return inference_data
+
+    @final
+    def _collect_single_turn_result(
+        self,
+        inference_data: dict,
+        model_response_data: dict,
+        query_latency: float,
+        include_input_log: bool,
+    ) -> tuple[any, dict]:
         # Process the metadata
         metadata = {}
         if include_input_log:
@@ -766,7 +846,12 @@ class BaseHandler:
         raise NotImplementedError
 
     @final
-    def write(self, result, result_dir, update_mode=False):
+    def write(self, result, result_dir, update_mode=False, file_handles=None):
+        """
+        Write one result entry (or a batch of them) to the per-category result files.
+
+        `file_handles` is an optional path -> open file mapping owned by the caller (see `BatchedResultWriter`). When given, result files are kept open across calls instead of being reopened for every batch; the caller is responsible for closing them.
+        """
         # Use the internal registry name to decide the result directory to avoid
         # collisions between different variants that share the same API model name.
         model_result_dir = result_dir / self.registry_dir_name
@@ -774,51 +859,196 @@ class BaseHandler:
         if isinstance(result, dict):
             result = [result]
 
-        # Collect and format each entry for JSON compatibility
-        entries_to_write = [make_json_serializable(entry) for entry in result]
-
         # Group entries by their `test_category` for efficient file handling
         file_entries = {}
-        for entry in entries_to_write:
+        for entry in result:
             test_category = extract_test_category_from_id(entry["id"])
             # Determine the high-level grouping folder (non_live, live, etc.)
             group_dir_name = get_directory_structure_by_id(entry["id"])
-            group_dir_path = model_result_dir / group_dir_name
-            group_dir_path.mkdir(parents=True, exist_ok=True)
-
-            file_path = group_dir_path / f"{VERSION_PREFIX}_{test_category}_result.json"
+            file_path = (
+                model_result_dir
+                / group_dir_name
+                / f"{VERSION_PREFIX}_{test_category}_result.json"
+            )
             file_entries.setdefault(file_path, []).append(entry)
 
         for file_path, entries in file_entries.items():
-            if update_mode:
-                # Load existing entries from the file
-                existing_entries = {}
-                if file_path.exists():
-                    existing_entries = {
-                        entry["id"]: entry for entry in load_file(file_path)
-                    }
+            if file_handles is None or file_path not in file_handles:
+                file_path.parent.mkdir(parents=True, exist_ok=True)
 
-                # Update existing entries with new data
-                for entry in entries:
-                    existing_entries[entry["id"]] = entry
+            # Format each entry for JSON compatibility
+            serialized_entries = [
+                (entry["id"], serialize_result_entry(entry)) for entry in entries
+            ]
 
-                # Sort entries by `id` and write them back to ensure order consistency
-                sorted_entries = sorted(existing_entries.values(), key=sort_key)
-                with open(file_path, "w") as f:
-                    for entry in sorted_entries:
-                        content = json.dumps(entry) + "\n"
-                        f.write(content)
-                        f.flush()
+            if update_mode:
+                # Append to the journal next to the result file; later records for the same id supersede earlier ones
+                # Note: The journal is merged into the sorted result file once, by `compact_result_journals` at the end of the generation pipeline
+                ResultJournal(file_path).append_serialized(serialized_entries)
 
             else:
                 # Normal mode: Append to the end of the file
                 # Note: We will sort all the entries at the end of the generation pipeline to ensure the order is consistent
-                entries.sort(key=sort_key)
-                with open(file_path, "a") as f:
-                    for entry in entries:
-                        content = json.dumps(entry) + "\n"
+                serialized_entries.sort(key=lambda item: sort_key({"id": item[0]}))
+                content = "".join(line for _, line in serialized_entries)
+                if file_handles is None:
+                    with open(file_path, "a") as f:
                         f.write(content)
                         f.flush()
+                else:
+                    f = file_handles.get(file_path)
+                    if f is None:
+                        f = open(file_path, "a")
+                        file_handles[file_path] = f
+                    f.write(content)
+                    f.flush()
+
+    #### Query boundary ####
+
+    @final
+    def _query(self, query_mode: str, inference_data: dict):
+        """
+        Single entry point through which every inference flow calls `_query_FC` or `_query_prompting`.
+        Concerns that apply to every model request (eg, the response cache, rate limiting, deadlines and hedging) are handled here, so that individual handlers don't need to know about them.
+        """
+        cache_key, cached_response = self._lookup_response_cache(query_mode, inference_data)
+        if cached_response is not None:
+            return cached_response
+
+        inference_data_before = dict(inference_data)
+        query = self._query_FC if query_mode == "FC" else self._query_prompting
+        if self.rate_limiter is not None:
+            query = self._rate_limited(query)
+        if self.hedging_policy is not None and self.hedging_policy.is_active:
+            api_response, query_latency = self.hedging_policy.call(query, inference_data)
+        else:
+            api_response, query_latency = query(inference_data)
+
+        self._store_response_cache(
+            cache_key, inference_data_before, inference_data, api_response, query_latency
+        )
+        return api_response, query_latency
+
+    @final
+    async def _query_async(self, query_mode: str, inference_data: dict):
+        """
+        Asyncio counterpart of `_query`.
+        """
+        cache_key, cached_response = self._lookup_response_cache(query_mode, inference_data)
+        if cached_response is not None:
+            return cached_response
+
+        inference_data_before = dict(inference_data)
+        query = self._query_FC_async if query_mode == "FC" else self._query_prompting_async
+        if self.rate_limiter is not None:
+            query = self._rate_limited_async(query)
+        if self.hedging_policy is not None and self.hedging_policy.is_active:
+            api_response, query_latency = await self.hedging_policy.call_async(
+                query, inference_data
+            )
+        else:
+            api_response, query_latency = await query(inference_data)
+
+        self._store_response_cache(
+            cache_key, inference_data_before, inference_data, api_response, query_latency
+        )
+        return api_response, query_latency
+
+    @final
+    def _rate_limited(self, query):
+        """
+        Wrap `query` so that every attempt (hedges included) waits for the rate limiter, and corrects the token estimate with the reported usage.
+        """
+
+        def _query_within_rate_limit(inference_data: dict):
+            estimated_token_count = estimate_request_tokens(inference_data)
+            try:
+                self.rate_limiter.acquire(estimated_token_count)
+            except BaseException:
+                # Interrupted while waiting for quota; the request was never sent
+                self.rate_limiter.cancel(estimated_token_count)
+                raise
+
+            actual_token_count = None
+            try:
+                api_response, query_latency = query(inference_data)
+                actual_token_count = response_token_usage(api_response)
+                return api_response, query_latency
+            finally:
+                # A failed attempt may still have been billed, so without a reported usage it keeps its estimate
+                self.rate_limiter.reconcile(estimated_token_count, actual_token_count)
+
+        return _query_within_rate_limit
+
+    @final
+    def _rate_limited_async(self, query):
+        """
+        Asyncio counterpart of `_rate_limited`.
+        """
+
+        async def _query_within_rate_limit(inference_data: dict):
+            estimated_token_count = estimate_request_tokens(inference_data)
+            try:
+                await self.rate_limiter.acquire_async(estimated_token_count)
+            except BaseException:
+                # Cancelled while waiting for quota (eg, a hedge that lost); the request was never sent
+                self.rate_limiter.cancel(estimated_token_count)
+                raise
+
+            actual_token_count = None
+            try:
+                api_response, query_latency = await query(inference_data)
+                actual_token_count = response_token_usage(api_response)
+                return api_response, query_latency
+            finally:
+                # A failed or cancelled attempt may still have been billed, so without a reported usage it keeps its estimate
+                self.rate_limiter.reconcile(estimated_token_count, actual_token_count)
+
+        return _query_within_rate_limit
+
+    @final
+    def _lookup_response_cache(self, query_mode: str, inference_data: dict):
+        """
+        Return `(cache_key, cached_response)`. `cache_key` is None when the cache is off; `cached_response` is None on a miss.
+        On a hit, the `inference_data` fields that the query method would have set (eg, `inference_input_log`) are restored.
+        """
+        if self.response_cache is None:
+            return None, None
+
+        cache_key = self.response_cache.make_key(self, query_mode, inference_data)
+        if not self.response_cache.readable:
+            return cache_key, None
+
+        cached = self.response_cache.get(cache_key)
+        if cached is None:
+            return cache_key, None
+
+        api_response, query_latency, inference_data_updates = cached
+        inference_data.update(inference_data_updates)
+        return cache_key, (api_response, query_latency)
+
+    @final
+    def _store_response_cache(
+        self,
+        cache_key,
+        inference_data_before: dict,
+        inference_data_after: dict,
+        api_response,
+        query_latency: float,
+    ) -> None:
+        if cache_key is None or not self.response_cache.writable:
+            return
+
+        # Top-level fields that the query method added or replaced as a side effect; private bookkeeping keys (eg, per-conversation caches) are not part of the response
+        inference_data_updates = {
+            key: value
+            for key, value in inference_data_after.items()
+            if not key.startswith("_")
+            and (key not in inference_data_before or inference_data_before[key] is not value)
+        }
+        self.response_cache.put(
+            cache_key, api_response, query_latency, inference_data_updates
+        )
 
     #### FC methods ####
 
@@ -829,6 +1059,14 @@ class BaseHandler:
         """
         raise NotImplementedError
 
+    async def _query_FC_async(self, inference_data: dict):
+        """
+        Asyncio counterpart of `_query_FC`, used by the `async` execution mode.
+        Handlers built on an async client (eg, `AsyncOpenAI` or `httpx.AsyncClient`) can override this to keep many requests in flight without one OS thread per request.
+        By default, the sync `_query_FC` is run through the thread bridge.
+        """
+        return await asyncio.to_thread(self._query_FC, inference_data)
+
     def _pre_query_processing_FC(self, inference_data: dict, test_entry: dict) -> dict:
         """
         Preprocess the testset entry before sending it to the model.
@@ -919,6 +1157,14 @@ class BaseHandler:
         """
         raise NotImplementedError
 
+    async def _query_prompting_async(self, inference_data: dict):
+        """
+        Asyncio counterpart of `_query_prompting`, used by the `async` execution mode.
+        Handlers built on an async client (eg, `AsyncOpenAI` or `httpx.AsyncClient`) can override this to keep many requests in flight without one OS thread per request.
+        By default, the sync `_query_prompting` is run through the thread bridge.
+        """
+        return await asyncio.to_thread(self._query_prompting, inference_data)
+
     def _pre_query_processing_prompting(self, test_entry: dict) -> dict:
         """
         Preprocess the testset entry before sending it to the model.
@@ -0,0 +1,271 @@
+import threading
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+import httpx
+import requests
+from bfcl_eval.model_handler.async_client_pool import AsyncClientPool
+from openai import AsyncOpenAI, OpenAI
+
+
+class Replica:
+    """
+    One OpenAI-compatible endpoint of an `EndpointPool`, with its clients, load and statistics.
+    """
+
+    def __init__(self, base_url: str, api_key: str) -> None:
+        self.base_url = base_url
+        self.api_key = api_key
+        self.client = OpenAI(base_url=base_url, api_key=api_key)
+        # Clients are created lazily inside the event loop of the `async` execution mode
+        self.async_client_pool = AsyncClientPool(
+            lambda http_client: AsyncOpenAI(
+                base_url=base_url, api_key=api_key, http_client=http_client
+            )
+        )
+
+        self.outstanding_requests = 0
+        self.outstanding_tokens = 0
+        self.consecutive_failures = 0
+        # While ejected, the replica only receives traffic if every other replica is ejected as well
+        self.ejected_until = 0.0
+
+        self.completed_requests = 0
+        self.failed_requests = 0
+        self.ejections = 0
+        self.prompt_tokens = 0
+        self.busy_time = 0.0
+        self.first_request_time = None
+        self.last_completion_time = None
+
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        return self.async_client_pool.get()
+
+    def is_ejected(self, now: float) -> bool:
+        return now < self.ejected_until
+
+    def stats(self) -> dict:
+        elapsed = (
+            self.last_completion_time - self.first_request_time
+            if self.first_request_time is not None and self.last_completion_time is not None
+            else 0.0
+        )
+        return {
+            "endpoint": self.base_url,
+            "completed": self.completed_requests,
+            "failed": self.failed_requests,
+            "ejections": self.ejections,
+            "prompt tokens": self.prompt_tokens,
+            "req/s": round(self.completed_requests / elapsed, 2) if elapsed > 0 else None,
+            "prompt tok/s": round(self.prompt_tokens / elapsed, 1) if elapsed > 0 else None,
+            "avg latency (s)": (
+                round(self.busy_time / self.completed_requests, 3)
+                if self.completed_requests
+                else None
+            ),
+        }
+
+
+class EndpointPool:
+    """
+    Client-side load balancer over several replicas of the same model (eg, independent vLLM servers with no load balancer in front of them).
+
+    Every request goes to the healthy replica with the fewest outstanding prompt tokens, ties broken by the fewest outstanding requests, so that a replica stuck on a few long prompts does not keep receiving work. A replica is ejected for `ejection_seconds` after `max_consecutive_failures` server-side failures (connection errors, timeouts, 5xx responses) in a row, and a request that failed for such a reason is retried on another replica. Client errors (eg, a prompt that exceeds the context window) are raised as is, since every replica would reject them.
+
+    With more than one replica, a background thread polls `<base_url>/models` every `health_check_interval` seconds: unreachable replicas are ejected, and ejected replicas are re-admitted once their ejection period is over and they answer again.
+
+    A pool with a single replica behaves exactly like calling its client directly.
+    """
+
+    def __init__(
+        self,
+        base_urls: list[str],
+        api_key: str,
+        max_consecutive_failures: int = 3,
+        ejection_seconds: float = 30.0,
+        health_check_interval: float = 10.0,
+    ) -> None:
+        if not base_urls:
+            raise ValueError("At least one endpoint is required.")
+        self.replicas = [Replica(base_url, api_key) for base_url in base_urls]
+        self.max_consecutive_failures = max_consecutive_failures
+        self.ejection_seconds = ejection_seconds
+        self.health_check_interval = health_check_interval
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._health_thread = None
+
+    def __len__(self) -> int:
+        return len(self.replicas)
+
+    def check_health(self, replica: Replica) -> bool:
+        try:
+            return requests.get(f"{replica.base_url}/models", timeout=5).status_code == 200
+        except requests.exceptions.RequestException:
+            return False
+
+    def wait_until_ready(self) -> None:
+        """
+        Block until at least one replica answers its health check. Replicas that are not up yet start out ejected.
+        """
+        while True:
+            healthy = [self.check_health(replica) for replica in self.replicas]
+            if any(healthy):
+                now = time.monotonic()
+                for replica, is_healthy in zip(self.replicas, healthy):
+                    if not is_healthy:
+                        print(f"Endpoint {replica.base_url} is not ready yet; ejecting it for now.")
+                        self._eject(replica, now)
+                return
+            time.sleep(1)
+
+    def start_health_checks(self) -> None:
+        if len(self.replicas) > 1 and self._health_thread is None:
+            self._health_thread = threading.Thread(target=self._run_health_checks, daemon=True)
+            self._health_thread.start()
+
+    def stop_health_checks(self) -> None:
+        self._stop_event.set()
+        if self._health_thread is not None:
+            self._health_thread.join(timeout=self.health_check_interval + 5)
+            self._health_thread = None
+
+    def _run_health_checks(self) -> None:
+        while not self._stop_event.wait(self.health_check_interval):
+            for replica in self.replicas:
+                is_healthy = self.check_health(replica)
+                with self._lock:
+                    now = time.monotonic()
+                    if not is_healthy and not replica.is_ejected(now):
+                        print(f"Endpoint {replica.base_url} failed its health check; ejecting it.")
+                        self._eject(replica, now)
+                    elif is_healthy and replica.ejected_until and not replica.is_ejected(now):
+                        replica.ejected_until = 0.0
+                        replica.consecutive_failures = 0
+
+    def _eject(self, replica: Replica, now: float) -> None:
+        replica.ejected_until = now + self.ejection_seconds
+        replica.ejections += 1
+
+    def acquire(self, token_count: int, exclude: tuple = ()) -> Replica:
+        """
+        Pick the least loaded replica, skipping ejected ones and those in `exclude` (eg, replicas that already failed this request) whenever possible.
+        """
+        with self._lock:
+            now = time.monotonic()
+            candidates = [
+                replica
+                for replica in self.replicas
+                if not replica.is_ejected(now) and replica not in exclude
+            ] or [replica for replica in self.replicas if not replica.is_ejected(now)]
+            if candidates:
+                replica = min(
+                    candidates,
+                    key=lambda replica: (replica.outstanding_tokens, replica.outstanding_requests),
+                )
+            else:
+                # Everything is ejected; the replica that comes back first is the best bet
+                replica = min(self.replicas, key=lambda replica: replica.ejected_until)
+            replica.outstanding_requests += 1
+            replica.outstanding_tokens += token_count
+            if replica.first_request_time is None:
+                replica.first_request_time = now
+            return replica
+
+    def release(
+        self,
+        replica: Replica,
+        token_count: int,
+        start_time: float,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        with self._lock:
+            now = time.monotonic()
+            replica.outstanding_requests -= 1
+            replica.outstanding_tokens -= token_count
+            if error is None:
+                replica.consecutive_failures = 0
+                replica.completed_requests += 1
+                replica.prompt_tokens += token_count
+                replica.busy_time += now - start_time
+                replica.last_completion_time = now
+            elif self.is_replica_failure(error):
+                replica.failed_requests += 1
+                replica.consecutive_failures += 1
+                if (
+                    replica.consecutive_failures >= self.max_consecutive_failures
+                    and not replica.is_ejected(now)
+                    and len(self.replicas) > 1
+                ):
+                    print(
+                        f"Endpoint {replica.base_url} failed {replica.consecutive_failures} requests in a row; ejecting it for {self.ejection_seconds:.0f}s."
+                    )
+                    self._eject(replica, now)
+
+    @staticmethod
+    def is_replica_failure(error: BaseException) -> bool:
+        """
+        Whether the error points at the replica rather than at the request itself.
+        """
+        status_code = getattr(error, "status_code", None)
+        if status_code is not None:
+            return status_code >= 500
+        return isinstance(error, (ConnectionError, TimeoutError, httpx.HTTPError)) or (
+            "connection" in type(error).__name__.lower()
+            or "timeout" in type(error).__name__.lower()
+        )
+
+    def call(self, request: Callable[[Replica], Any], token_count: int) -> Any:
+        """
+        Run `request(replica)` on the least loaded replica, moving on to another replica if it fails for a server-side reason.
+        """
+        tried = []
+        for attempt in range(len(self.replicas)):
+            replica = self.acquire(token_count, exclude=tuple(tried))
+            tried.append(replica)
+            start_time = time.monotonic()
+            try:
+                response = request(replica)
+            except BaseException as e:
+                # Also give back the load of attempts that were interrupted (eg, KeyboardInterrupt), which are never retried
+                self.release(replica, token_count, start_time, error=e)
+                if (
+                    not isinstance(e, Exception)
+                    or attempt == len(self.replicas) - 1
+                    or not self.is_replica_failure(e)
+                ):
+                    raise
+                continue
+            self.release(replica, token_count, start_time)
+            return response
+
+    async def call_async(
+        self, request: Callable[[Replica], Awaitable[Any]], token_count: int
+    ) -> Any:
+        """
+        Asyncio counterpart of `call`.
+        """
+        tried = []
+        for attempt in range(len(self.replicas)):
+            replica = self.acquire(token_count, exclude=tuple(tried))
+            tried.append(replica)
+            start_time = time.monotonic()
+            try:
+                response = await request(replica)
+            except BaseException as e:
+                # Also give back the load of cancelled attempts (eg, the loser of a hedged request, or a request past its deadline), which are never retried
+                self.release(replica, token_count, start_time, error=e)
+                if (
+                    not isinstance(e, Exception)
+                    or attempt == len(self.replicas) - 1
+                    or not self.is_replica_failure(e)
+                ):
+                    raise
+                continue
+            self.release(replica, token_count, start_time)
+            return response
+
+    def stats(self) -> list[dict]:
+        with self._lock:
+            return [replica.stats() for replica in self.replicas]
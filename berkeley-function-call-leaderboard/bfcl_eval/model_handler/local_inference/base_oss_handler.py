@@ -1,22 +1,50 @@
+import asyncio
+import contextvars
+import hashlib
+import json
 import os
 import subprocess
 import threading
 import time
+from copy import deepcopy
 from pathlib import Path
 from typing import Any, Optional
 
 import requests
 from bfcl_eval.constants.enums import ModelStyle
-from bfcl_eval.constants.eval_config import LOCAL_SERVER_PORT
+from bfcl_eval.constants.eval_config import LOCAL_SERVER_PORT, LOCAL_SERVER_REQUEST_TIMEOUT
 from bfcl_eval.model_handler.base_handler import BaseHandler
+from bfcl_eval.model_handler.endpoint_pool import EndpointPool
+from bfcl_eval.model_handler.prompt_batcher import PromptBatcher
 from bfcl_eval.model_handler.utils import (
     default_decode_ast_prompting,
     default_decode_execute_prompting,
     system_prompt_pre_processing_chat_model,
 )
 from bfcl_eval.utils import contain_multi_turn_interaction
-from openai import OpenAI
+from openai import AsyncOpenAI
 from overrides import EnforceOverrides, final, override
+from tabulate import tabulate
+
+# Prometheus counters (in tokens) exposed on `/metrics`, in order of preference:
+# vLLM >= 0.9, vLLM 0.8 (V1 engine), SGLang (requires `--enable-metrics`)
+PREFIX_CACHE_HIT_METRICS = (
+    "vllm:prefix_cache_hits_total",
+    "vllm:gpu_prefix_cache_hits_total",
+    "sglang:cached_tokens_total",
+)
+PREFIX_CACHE_QUERY_METRICS = (
+    "vllm:prefix_cache_queries_total",
+    "vllm:gpu_prefix_cache_queries_total",
+    "sglang:prompt_tokens_total",
+)
+
+# Incremental token counts are only trusted while the prompt is at least this many tokens away from needing a smaller `max_tokens`
+PROMPT_TOKEN_COUNT_MARGIN = 256
+
+# Set while a single-turn entry is being queried. Only those queries go through the prompt batcher;
+# a multi-turn step depends on the previous response, so waiting for a batch to fill would only add latency
+_SINGLE_TURN_QUERY = contextvars.ContextVar("single_turn_query", default=False)
 
 
 class OSSHandler(BaseHandler, EnforceOverrides):
@@ -46,7 +74,15 @@ class OSSHandler(BaseHandler, EnforceOverrides):
         # Use REMOTE_OPENAI_* variables to avoid conflicts with main OPENAI_* variables
         self.base_url = os.getenv("REMOTE_OPENAI_BASE_URL", f"http://{self.local_server_endpoint}:{self.local_server_port}/v1")
         self.api_key = os.getenv("REMOTE_OPENAI_API_KEY", "EMPTY")
-        self.client = OpenAI(base_url=self.base_url, api_key=self.api_key)
+        # A comma-separated list of base URLs (replicas of the same model) is load-balanced on the client side
+        self.endpoint_pool = EndpointPool(
+            [base_url.strip() for base_url in self.base_url.split(",") if base_url.strip()],
+            api_key=self.api_key,
+        )
+        self.base_url = self.endpoint_pool.replicas[0].base_url
+        self.client = self.endpoint_pool.replicas[0].client
+        # Set by `enable_prompt_batching`
+        self.prompt_batcher = None
 
     @override
     def inference(
@@ -61,7 +97,69 @@ class OSSHandler(BaseHandler, EnforceOverrides):
                 test_entry, include_input_log, exclude_state_log
             )
         else:
-            return self.inference_single_turn_prompting(test_entry, include_input_log)
+            token = _SINGLE_TURN_QUERY.set(True)
+            try:
+                return self.inference_single_turn_prompting(test_entry, include_input_log)
+            finally:
+                _SINGLE_TURN_QUERY.reset(token)
+
+    @override
+    async def inference_async(
+        self,
+        test_entry: dict,
+        include_input_log: bool,
+        exclude_state_log: bool,
+    ):
+        if contain_multi_turn_interaction(test_entry["id"]):
+            return await asyncio.to_thread(
+                self.inference_multi_turn_prompting,
+                test_entry,
+                include_input_log,
+                exclude_state_log,
+            )
+        else:
+            token = _SINGLE_TURN_QUERY.set(True)
+            try:
+                return await self.inference_single_turn_prompting_async(
+                    test_entry, include_input_log
+                )
+            finally:
+                _SINGLE_TURN_QUERY.reset(token)
+
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        return self.endpoint_pool.replicas[0].async_client
+
+    @override
+    def configure_async_clients(self, max_concurrency: int) -> None:
+        # Least-loaded routing can send every request to one replica when the others are ejected
+        for replica in self.endpoint_pool.replicas:
+            replica.async_client_pool.max_concurrency = max_concurrency
+
+    @override
+    async def close_async_clients(self) -> None:
+        for replica in self.endpoint_pool.replicas:
+            await replica.async_client_pool.aclose()
+
+    def enable_prompt_batching(
+        self, max_batch_size: int, max_batch_delay_ms: float, max_concurrent_batches: int
+    ) -> None:
+        """
+        Coalesce the queries of single-turn entries into multi-prompt Completions calls. Must be called after `spin_up_local_server`, as the batcher needs the tokenizer.
+        """
+        self.prompt_batcher = PromptBatcher(
+            self._create_completion,
+            count_tokens=lambda text: len(self.tokenizer.tokenize(text)),
+            max_batch_size=max_batch_size,
+            max_batch_delay_ms=max_batch_delay_ms,
+            max_concurrent_batches=max_concurrent_batches,
+        ).start()
+
+    def disable_prompt_batching(self) -> None:
+        if self.prompt_batcher is not None:
+            self.prompt_batcher.close()
+            print(self.prompt_batcher.summary())
+            self.prompt_batcher = None
 
     @override
     def decode_ast(self, result, language, has_tool_call_tag):
@@ -119,6 +217,10 @@ class OSSHandler(BaseHandler, EnforceOverrides):
 
         # For remote OpenAI-compatible endpoints, use specified tokenizer path if provided
         is_remote_endpoint = bool(os.getenv("REMOTE_OPENAI_BASE_URL"))
+        if len(self.endpoint_pool) > 1 and not skip_server_setup:
+            raise ValueError(
+                "Multiple endpoints in REMOTE_OPENAI_BASE_URL require `--skip-server-setup`; only one local server can be launched."
+            )
         tokenizer_path = os.getenv("REMOTE_OPENAI_TOKENIZER_PATH", self.model_path_or_id)
 
         if is_remote_endpoint and os.getenv("REMOTE_OPENAI_TOKENIZER_PATH"):
@@ -174,6 +276,7 @@ class OSSHandler(BaseHandler, EnforceOverrides):
                             "--gpu-memory-utilization",
                             str(gpu_memory_utilization),
                             "--trust-remote-code",
+                            "--enable-prefix-caching",
                         ]
                         + (["--enable-lora"] if enable_lora else [])
                         + (
@@ -211,6 +314,8 @@ class OSSHandler(BaseHandler, EnforceOverrides):
                             "--mem-fraction-static",
                             str(gpu_memory_utilization),
                             "--trust-remote-code",
+                            # Exposes the prefix cache counters on /metrics
+                            "--enable-metrics",
                         ],
                         stdout=subprocess.PIPE,  # Capture stdout
                         stderr=subprocess.PIPE,  # Capture stderr
@@ -244,6 +349,11 @@ class OSSHandler(BaseHandler, EnforceOverrides):
 
             # Wait for the server to be ready
             server_ready = False
+            if len(self.endpoint_pool) > 1:
+                # Start with the replicas that are already up; the others join once their health checks pass
+                self.endpoint_pool.wait_until_ready()
+                server_ready = True
+                print("server is ready!")
             while not server_ready:
                 # Check if the process has terminated unexpectedly
                 if not skip_server_setup and process.poll() is not None:
@@ -266,6 +376,7 @@ class OSSHandler(BaseHandler, EnforceOverrides):
 
             # Signal threads to stop reading output
             self._stop_event.set()
+            self.endpoint_pool.start_health_checks()
 
         except Exception as e:
             # Clean-up everything we already started, then re-raise
@@ -281,6 +392,10 @@ class OSSHandler(BaseHandler, EnforceOverrides):
 
     def shutdown_local_server(self):
         """Terminate the locally launched OSS model server if it is still running."""
+        self.endpoint_pool.stop_health_checks()
+        if len(self.endpoint_pool) > 1:
+            print(tabulate(self.endpoint_pool.stats(), headers="keys", tablefmt="github"))
+
         # Ensure the server process is terminated properly
         process = getattr(self, "_server_process", None)
         if process and process.poll() is None:
@@ -302,6 +417,58 @@ class OSSHandler(BaseHandler, EnforceOverrides):
         if getattr(self, "_stderr_thread", None):
             self._stderr_thread.join(timeout=2)
 
+    def get_prefix_key(self, test_entry: dict) -> str:
+        """
+        Hash of the prompt prefix that the test entry shares with other entries: its system prompt and tool block, rendered with the model's own chat template.
+        Used by the prefix-affinity scheduling policy to dispatch entries that hit the same server-side prefix cache back-to-back.
+        """
+        test_entry = deepcopy(test_entry)
+        inference_data = self._pre_query_processing_prompting(test_entry)
+        system_messages = [
+            message for message in test_entry["question"][0] if message["role"] == "system"
+        ]
+        try:
+            prefix = self._format_prompt(system_messages, inference_data["function"])
+        except Exception:
+            # Some chat templates expect at least one user message; the raw content identifies the prefix just as well
+            prefix = json.dumps(
+                [system_messages, inference_data["function"]], sort_keys=True, default=repr
+            )
+        return hashlib.sha256(prefix.encode("utf-8")).hexdigest()
+
+    def get_prefix_cache_metrics(self) -> Optional[dict]:
+        """
+        Read the cumulative prompt-token and prefix-cache-hit counters from the server's Prometheus endpoint.
+        Returns None if the server is unreachable or does not expose them.
+        """
+        counters = {}
+        for replica in self.endpoint_pool.replicas:
+            metrics_url = replica.base_url.rstrip("/").removesuffix("/v1") + "/metrics"
+            try:
+                response = requests.get(metrics_url, timeout=10)
+                response.raise_for_status()
+            except requests.exceptions.RequestException:
+                continue
+
+            for line in response.text.splitlines():
+                if not line or line.startswith("#"):
+                    continue
+                name = line.split("{", 1)[0].split(" ", 1)[0]
+                if name in PREFIX_CACHE_HIT_METRICS or name in PREFIX_CACHE_QUERY_METRICS:
+                    try:
+                        # Summed over all label sets (eg, one per engine or data-parallel rank) and all replicas
+                        counters[name] = counters.get(name, 0.0) + float(line.rsplit(" ", 1)[1])
+                    except ValueError:
+                        continue
+
+        hit_metric = next((name for name in PREFIX_CACHE_HIT_METRICS if name in counters), None)
+        query_metric = next(
+            (name for name in PREFIX_CACHE_QUERY_METRICS if name in counters), None
+        )
+        if hit_metric is None or query_metric is None:
+            return None
+        return {"prompt_tokens": counters[query_metric], "cached_tokens": counters[hit_metric]}
+
     #### Prompting methods ####
 
     def _format_prompt(self, messages, function):
@@ -316,14 +483,54 @@ class OSSHandler(BaseHandler, EnforceOverrides):
     @override
     def _query_prompting(self, inference_data: dict):
         # We use the OpenAI Completions API
+        request_kwargs, input_token_count = self._build_completion_request(inference_data)
+        if self.prompt_batcher is not None and _SINGLE_TURN_QUERY.get():
+            return self.prompt_batcher.submit(request_kwargs, input_token_count).result()
+
+        start_time = time.time()
+        api_response = self._create_completion(request_kwargs, input_token_count)
+        end_time = time.time()
+
+        return api_response, end_time - start_time
+
+    @override
+    async def _query_prompting_async(self, inference_data: dict):
+        request_kwargs, input_token_count = self._build_completion_request(inference_data)
+        if self.prompt_batcher is not None and _SINGLE_TURN_QUERY.get():
+            return await asyncio.wrap_future(
+                self.prompt_batcher.submit(request_kwargs, input_token_count)
+            )
+
+        start_time = time.time()
+        api_response = await self.endpoint_pool.call_async(
+            lambda replica: replica.async_client.completions.create(**request_kwargs),
+            input_token_count,
+        )
+        end_time = time.time()
+
+        return api_response, end_time - start_time
+
+    def _create_completion(self, request_kwargs: dict, prompt_token_count: int):
+        """
+        Send one Completions call to the least loaded endpoint. `prompt_token_count` is the load it puts on that endpoint.
+        """
+        return self.endpoint_pool.call(
+            lambda replica: replica.client.completions.create(**request_kwargs),
+            prompt_token_count,
+        )
+
+    def _build_completion_request(self, inference_data: dict) -> tuple[dict, int]:
+        """
+        Format the prompt and assemble the keyword arguments for the OpenAI Completions API call.
+        Shared by the sync and async query paths. Returns the keyword arguments and the prompt token count.
+        """
         function: list[dict] = inference_data["function"]
         message: list[dict] = inference_data["message"]
 
         formatted_prompt: str = self._format_prompt(message, function)
         inference_data["inference_input_log"] = {"formatted_prompt": formatted_prompt}
 
-        # Tokenize the formatted prompt to get token count
-        input_token_count = len(self.tokenizer.tokenize(formatted_prompt))
+        input_token_count = self._count_prompt_tokens(inference_data, formatted_prompt)
 
         # Determine the number of tokens to request. Cap it at 4096 if the model has a larger limit.
         if self.max_context_length < input_token_count + 2:
@@ -341,27 +548,48 @@ class OSSHandler(BaseHandler, EnforceOverrides):
         if hasattr(self, "skip_special_tokens"):
             extra_body["skip_special_tokens"] = self.skip_special_tokens
 
-        start_time = time.time()
+        request_kwargs = {
+            "model": self.model_path_or_id,
+            "temperature": self.temperature,
+            "prompt": formatted_prompt,
+            "max_tokens": leftover_tokens_count,
+            "timeout": self._request_timeout(),
+        }
         if len(extra_body) > 0:
-            api_response = self.client.completions.create(
-                model=self.model_path_or_id,
-                temperature=self.temperature,
-                prompt=formatted_prompt,
-                max_tokens=leftover_tokens_count,
-                extra_body=extra_body,
-                timeout=72000,  # Avoid timeout errors
-            )
+            request_kwargs["extra_body"] = extra_body
+
+        return request_kwargs, input_token_count
+
+    def _request_timeout(self) -> float:
+        """
+        Client-side timeout of one Completions call: the request deadline if one is set, so that an abandoned call does not linger, and a very long one otherwise (long generations should not fail on the client side).
+        """
+        if self.hedging_policy is not None and self.hedging_policy.deadline_seconds is not None:
+            return self.hedging_policy.deadline_seconds
+        return LOCAL_SERVER_REQUEST_TIMEOUT
+
+    def _count_prompt_tokens(self, inference_data: dict, formatted_prompt: str) -> int:
+        """
+        Count the tokens of the formatted prompt, incrementally across the steps of a multi-turn conversation.
+
+        Re-tokenizing the whole ever-growing conversation at every step makes long entries quadratic in CPU time. Instead, the formatted prompt and token count of the previous step are kept in `inference_data["_prompt_token_cache"]`. If the chat template is prefix-stable (the new prompt starts with the previous one), only the appended text is tokenized; otherwise (eg, templates that strip the reasoning of earlier turns), the whole prompt is tokenized again.
+
+        Tokenizing the appended text on its own can be off by a token at the seam, and the error adds up over the steps. The count only matters for `max_tokens` when the prompt gets close to the context window, so in that range it is always recomputed from scratch.
+        """
+        cache = inference_data.get("_prompt_token_cache")
+        if cache is not None and formatted_prompt.startswith(cache["formatted_prompt"]):
+            appended_text = formatted_prompt[len(cache["formatted_prompt"]) :]
+            token_count = cache["token_count"] + len(self.tokenizer.tokenize(appended_text))
+            if self.max_context_length - token_count < 4096 + 2 + PROMPT_TOKEN_COUNT_MARGIN:
+                token_count = len(self.tokenizer.tokenize(formatted_prompt))
         else:
-            api_response = self.client.completions.create(
-                model=self.model_path_or_id,
-                temperature=self.temperature,
-                prompt=formatted_prompt,
-                max_tokens=leftover_tokens_count,
-                timeout=72000,  # Avoid timeout errors
-            )
-        end_time = time.time()
+            token_count = len(self.tokenizer.tokenize(formatted_prompt))
 
-        return api_response, end_time - start_time
+        inference_data["_prompt_token_cache"] = {
+            "formatted_prompt": formatted_prompt,
+            "token_count": token_count,
+        }
+        return token_count
 
     @override
     def _pre_query_processing_prompting(self, test_entry: dict) -> dict:
@@ -0,0 +1,165 @@
+import json
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+from openai.types import CompletionUsage
+
+
+class PromptBatcher:
+    """
+    Micro-batcher that coalesces concurrent single-prompt OpenAI Completions calls into multi-prompt calls.
+
+    Calls are sent with `create_completion(request_kwargs, prompt_token_count)`, which should behave like `client.completions.create(**request_kwargs)`. `submit` enqueues the keyword arguments of one `completions.create` call and returns a future. A background thread blocks for the first request of a batch, then keeps collecting until it has `max_batch_size` requests or `max_batch_delay_ms` milliseconds have passed. Requests that only differ in their `prompt` are sent together as a single call with a list of prompts, and the response is split back into one single-choice response per request, so the caller cannot tell it apart from an individual call.
+
+    The Completions API only reports the token usage of the whole batch, so the per-request usage is rebuilt: the prompt token count is the one the caller already computed (to derive `max_tokens`), and the completion token count comes from tokenizing the returned text with `count_tokens`. The latency of each request runs from `submit` to the arrival of the batch response, so it includes the time spent waiting for the batch to fill up.
+
+    If a multi-prompt call fails (eg, one of the prompts exceeds the context window), its requests are retried one by one, so that a single bad prompt does not fail the whole batch.
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        create_completion: Callable[[dict, int], Any],
+        count_tokens: Callable[[str], int],
+        max_batch_size: int = 32,
+        max_batch_delay_ms: float = 10,
+        max_concurrent_batches: int = 100,
+    ) -> None:
+        self.create_completion = create_completion
+        self.count_tokens = count_tokens
+        self.max_batch_size = max_batch_size
+        self.max_batch_delay = max_batch_delay_ms / 1000
+        self.requests_sent = 0
+        self.batches_sent = 0
+        self._queue = queue.Queue()
+        self._pool = ThreadPoolExecutor(max_workers=max_concurrent_batches)
+        self._stats_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> "PromptBatcher":
+        self._thread.start()
+        return self
+
+    def submit(self, request_kwargs: dict, prompt_token_count: int) -> Future:
+        """
+        Enqueue one `completions.create` call. The future resolves to `(api_response, latency)`.
+        """
+        future = Future()
+        self._queue.put((request_kwargs, prompt_token_count, time.time(), future))
+        return future
+
+    def close(self) -> None:
+        """
+        Send the pending requests, wait for all batches in flight and stop the background thread.
+        """
+        if self._thread.is_alive():
+            self._queue.put(self._STOP)
+            self._thread.join()
+        self._pool.shutdown(wait=True)
+
+    def summary(self) -> str:
+        average = self.requests_sent / self.batches_sent if self.batches_sent else 0
+        return f"Prompt batching: {self.requests_sent} requests answered by {self.batches_sent} calls ({average:.1f} prompts per call)."
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is self._STOP:
+                break
+            batch = [item]
+            deadline = time.monotonic() + self.max_batch_delay
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if item is self._STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            # Only requests with identical parameters (model, temperature, max_tokens, ...) can share a call
+            groups = {}
+            for item in batch:
+                request_kwargs = item[0]
+                group_key = json.dumps(
+                    {key: value for key, value in request_kwargs.items() if key != "prompt"},
+                    sort_keys=True,
+                    default=repr,
+                )
+                groups.setdefault(group_key, []).append(item)
+            for group in groups.values():
+                self._pool.submit(self._send, group)
+
+    def _record_batch(self, batch_size: int) -> None:
+        with self._stats_lock:
+            self.requests_sent += batch_size
+            self.batches_sent += 1
+
+    def _send(self, group: list) -> None:
+        if len(group) == 1:
+            request_kwargs, prompt_token_count, submit_time, future = group[0]
+            try:
+                api_response = self.create_completion(request_kwargs, prompt_token_count)
+            except Exception as e:
+                future.set_exception(e)
+            else:
+                self._record_batch(1)
+                future.set_result((api_response, time.time() - submit_time))
+            return
+
+        request_kwargs = dict(group[0][0])
+        request_kwargs["prompt"] = [item[0]["prompt"] for item in group]
+        try:
+            api_response = self.create_completion(
+                request_kwargs, sum(item[1] for item in group)
+            )
+        except Exception:
+            for item in group:
+                try:
+                    self._pool.submit(self._send, [item])
+                except RuntimeError:
+                    # `close` is shutting the pool down; retry in this thread, so that the future still resolves
+                    self._send([item])
+            return
+        end_time = time.time()
+        self._record_batch(len(group))
+
+        choices = {choice.index: choice for choice in api_response.choices}
+        for index, (_, prompt_token_count, submit_time, future) in enumerate(group):
+            choice = choices.get(index)
+            if choice is None:
+                future.set_exception(
+                    RuntimeError(f"The batched response has no choice for prompt {index}.")
+                )
+                continue
+            try:
+                future.set_result(
+                    (
+                        self._split_response(api_response, choice, prompt_token_count),
+                        end_time - submit_time,
+                    )
+                )
+            except Exception as e:
+                future.set_exception(e)
+
+    def _split_response(self, api_response: Any, choice: Any, prompt_token_count: int) -> Any:
+        completion_token_count = self.count_tokens(choice.text)
+        return api_response.model_copy(
+            update={
+                "choices": [choice.model_copy(update={"index": 0})],
+                "usage": CompletionUsage(
+                    prompt_tokens=prompt_token_count,
+                    completion_tokens=completion_token_count,
+                    total_tokens=prompt_token_count + completion_token_count,
+                ),
+            }
+        )
@@ -0,0 +1,202 @@
+import asyncio
+import hashlib
+import json
+import threading
+import time
+from typing import Any, Optional
+
+# Rough characters-per-token ratio of English text and JSON, used to estimate the prompt size before the request is sent
+_CHARS_PER_TOKEN = 4
+# Fields of `inference_data` that end up in the prompt
+_PROMPT_FIELDS = ("message", "tools", "function", "system_prompt")
+
+
+class RateLimiter:
+    """
+    Token-bucket rate limiter with a requests-per-minute and a tokens-per-minute budget, shared by every request to the same provider account.
+
+    Both buckets refill continuously at `utilization` times the budget, and hold at most `burst_seconds` worth of refill, so that a run never goes over the quota in any one-minute window, even right after it starts. `acquire` reserves one request and the estimated token count right away, even if the buckets go into debt, and returns how long the caller has to wait for the reservation to be covered. Reservations are served in order, so N workers queue up behind the limiter instead of all hitting the provider at once and all backing off together after a 429.
+
+    The token estimate is corrected with `reconcile` once the response reports its actual usage, and `cancel` gives back the reservation of a request that was abandoned before it was sent. When a request still gets rate-limited (eg, another client uses the same key), `record_rate_limit` empties both buckets, so that every worker pauses rather than only the one that got the 429.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        utilization: float = 0.95,
+        burst_seconds: float = 3.0,
+    ) -> None:
+        self.name = name
+        self.request_rate = (
+            requests_per_minute * utilization / 60 if requests_per_minute else None
+        )
+        self.token_rate = tokens_per_minute * utilization / 60 if tokens_per_minute else None
+        self.request_capacity = (
+            max(1.0, self.request_rate * burst_seconds) if self.request_rate else None
+        )
+        self.token_capacity = self.token_rate * burst_seconds if self.token_rate else None
+        self.request_level = self.request_capacity or 0.0
+        self.token_level = self.token_capacity or 0.0
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+        self.requests = 0
+        self.tokens = 0
+        self.rate_limited = 0
+        self.total_wait = 0.0
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        if self.request_rate:
+            self.request_level = min(
+                self.request_capacity, self.request_level + elapsed * self.request_rate
+            )
+        if self.token_rate:
+            self.token_level = min(
+                self.token_capacity, self.token_level + elapsed * self.token_rate
+            )
+
+    def _reserve(self, token_count: int) -> float:
+        with self._lock:
+            self._refill(time.monotonic())
+            self.requests += 1
+            self.tokens += token_count
+            wait_time = 0.0
+            if self.request_rate:
+                self.request_level -= 1
+                wait_time = max(wait_time, -self.request_level / self.request_rate)
+            if self.token_rate:
+                self.token_level -= token_count
+                wait_time = max(wait_time, -self.token_level / self.token_rate)
+            self.total_wait += wait_time
+            return wait_time
+
+    def acquire(self, token_count: int) -> None:
+        """
+        Block until one request of `token_count` tokens fits in the budget.
+        """
+        wait_time = self._reserve(token_count)
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+    async def acquire_async(self, token_count: int) -> None:
+        """
+        Asyncio counterpart of `acquire`.
+        """
+        wait_time = self._reserve(token_count)
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+
+    def reconcile(self, estimated_token_count: int, actual_token_count: Optional[int]) -> None:
+        """
+        Replace the token estimate of a completed request by its actual usage.
+        """
+        if actual_token_count is None or not self.token_rate:
+            return
+        with self._lock:
+            self._refill(time.monotonic())
+            self.tokens += actual_token_count - estimated_token_count
+            self.token_level = min(
+                self.token_capacity,
+                self.token_level + estimated_token_count - actual_token_count,
+            )
+
+    def cancel(self, token_count: int) -> None:
+        """
+        Give back the reservation of a request that was never sent (eg, cancelled while waiting in `acquire_async`).
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self.requests -= 1
+            self.tokens -= token_count
+            if self.request_rate:
+                self.request_level = min(self.request_capacity, self.request_level + 1)
+            if self.token_rate:
+                self.token_level = min(self.token_capacity, self.token_level + token_count)
+
+    def record_rate_limit(self) -> None:
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate_limited += 1
+            self.request_level = min(self.request_level, 0.0)
+            self.token_level = min(self.token_level, 0.0)
+
+    def summary(self) -> str:
+        return (
+            f"Rate limiter ({self.name}): {self.requests} requests, {self.tokens} tokens, "
+            f"{self.total_wait:.1f}s spent waiting for quota, {self.rate_limited} rate-limit backoffs."
+        )
+
+
+_rate_limiters: dict[str, RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(
+    key: str,
+    requests_per_minute: Optional[float],
+    tokens_per_minute: Optional[float],
+    utilization: float = 0.95,
+    burst_seconds: float = 3.0,
+) -> RateLimiter:
+    """
+    Return the process-wide limiter for `key`, creating it on first use. Models that share a provider account share its limiter.
+    """
+    with _rate_limiters_lock:
+        if key not in _rate_limiters:
+            _rate_limiters[key] = RateLimiter(
+                key.split("|", 1)[0],
+                requests_per_minute,
+                tokens_per_minute,
+                utilization=utilization,
+                burst_seconds=burst_seconds,
+            )
+        return _rate_limiters[key]
+
+
+def rate_limit_key(handler) -> str:
+    """
+    Identify the provider account of a handler: its client's endpoint and API key when it has an OpenAI-style client, the handler class otherwise.
+    The API key is hashed, so that it never shows up in logs.
+    """
+    client = getattr(handler, "client", None)
+    base_url = getattr(client, "base_url", None)
+    api_key = getattr(client, "api_key", None)
+    provider = str(base_url) if base_url else type(handler).__name__
+    key_digest = (
+        hashlib.sha256(str(api_key).encode("utf-8")).hexdigest()[:12] if api_key else ""
+    )
+    return f"{provider}|{key_digest}"
+
+
+def estimate_request_tokens(inference_data: dict) -> int:
+    """
+    Estimate the prompt tokens of a request from the messages and tools in `inference_data`.
+    """
+    prompt = {field: inference_data[field] for field in _PROMPT_FIELDS if field in inference_data}
+    return max(1, len(json.dumps(prompt, ensure_ascii=False, default=repr)) // _CHARS_PER_TOKEN)
+
+
+def response_token_usage(api_response: Any) -> Optional[int]:
+    """
+    Total (prompt and completion) tokens reported by an API response, for the response formats of the supported SDKs, or None if the response does not report its usage.
+    """
+    usage = getattr(api_response, "usage", None) or getattr(
+        api_response, "usage_metadata", None
+    )
+    if usage is None:
+        return None
+    total = getattr(usage, "total_tokens", None) or getattr(usage, "total_token_count", None)
+    if total is not None:
+        return int(total)
+    # Eg, Anthropic reports the input and output tokens only
+    input_tokens = getattr(usage, "input_tokens", None) or getattr(usage, "prompt_tokens", None)
+    output_tokens = getattr(usage, "output_tokens", None) or getattr(
+        usage, "completion_tokens", None
+    )
+    if input_tokens is None and output_tokens is None:
+        return None
+    return int(input_tokens or 0) + int(output_tokens or 0)
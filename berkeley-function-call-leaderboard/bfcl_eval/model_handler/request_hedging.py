@@ -0,0 +1,336 @@
+import asyncio
+import contextvars
+import copy
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Optional
+
+from bfcl_eval.utils import extract_test_category_from_id
+
+_QUERY_STATS = contextvars.ContextVar("query_stats", default=None)
+
+
+class DeadlineExceededError(TimeoutError):
+    """
+    Raised when no attempt of a model request answered within the request deadline.
+    """
+
+
+class QueryStats:
+    """
+    Hedges and timeouts of the model requests of one test entry, added to its result metadata.
+    """
+
+    def __init__(self, test_entry_id: str) -> None:
+        self.category = extract_test_category_from_id(test_entry_id, remove_prereq=True)
+        self.hedged_requests = 0
+        self.hedge_wins = 0
+        self.timed_out_requests = 0
+
+    def to_metadata(self) -> dict:
+        # Only present when something happened, so that regular result entries are unchanged
+        metadata = {}
+        if self.hedged_requests:
+            metadata["hedged_requests"] = self.hedged_requests
+            metadata["hedge_wins"] = self.hedge_wins
+        if self.timed_out_requests:
+            metadata["timed_out_requests"] = self.timed_out_requests
+        return metadata
+
+
+@contextmanager
+def track_query_stats(test_entry_id: str):
+    """
+    Collect the `QueryStats` of the model requests made inside the block for one test entry.
+    The stats follow the context into `asyncio.to_thread` and the attempt threads, so every execution mode is covered.
+    """
+    stats = QueryStats(test_entry_id)
+    token = _QUERY_STATS.set(stats)
+    try:
+        yield stats
+    finally:
+        _QUERY_STATS.reset(token)
+
+
+class HedgingPolicy:
+    """
+    Per-request deadline and request hedging, applied to every model request at the `_query` boundary of the handler.
+
+    With `deadline_seconds`, a request that has not answered after that long is abandoned and `DeadlineExceededError` is raised, instead of pinning a worker until the client gives up. With `hedge` on, a request that is still running after the `quantile` latency observed so far for its test category gets a duplicate, and whichever attempt answers first wins. The latency quantile is only trusted after `min_samples` requests of the category have completed. At most `max_hedge_rate` of all requests are hedged, so a provider that is slow across the board does not see its load doubled.
+
+    The first attempt works on `inference_data` itself. Since handlers modify the message payload in place (eg, Claude's `cache_control` flags) and concurrent attempts must not share it, a hedge gets a deep copy of `inference_data` as it is when the hedge starts. Handlers only modify the payload while building the request, which the first attempt has sent by then. If the hedge wins, its fields (eg, the updated `message` list and `inference_input_log`) are copied back. Sync attempts cannot be cancelled, so the losing attempt finishes in the background and its response is dropped; async attempts are cancelled.
+    """
+
+    def __init__(
+        self,
+        deadline_seconds: Optional[float] = None,
+        hedge: bool = False,
+        max_hedge_rate: float = 0.05,
+        quantile: float = 0.95,
+        min_samples: int = 20,
+        window_size: int = 1000,
+    ) -> None:
+        self.deadline_seconds = deadline_seconds
+        self.hedge = hedge
+        self.max_hedge_rate = max_hedge_rate
+        self.quantile = quantile
+        self.min_samples = min_samples
+        self.window_size = window_size
+
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.timeouts = 0
+        self._latencies: dict[str, deque] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def is_active(self) -> bool:
+        return self.deadline_seconds is not None or self.hedge
+
+    def hedge_delay(self, category: str) -> Optional[float]:
+        """
+        How long to wait before hedging a request of `category`, or None if it should not be hedged.
+        """
+        if not self.hedge:
+            return None
+        with self._lock:
+            latencies = self._latencies.get(category)
+            if latencies is None or len(latencies) < self.min_samples:
+                return None
+            ordered = sorted(latencies)
+        return ordered[min(len(ordered) - 1, int(self.quantile * len(ordered)))]
+
+    def record_latency(self, category: str, latency: float) -> None:
+        with self._lock:
+            self._latencies.setdefault(category, deque(maxlen=self.window_size)).append(latency)
+
+    def _count_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def _take_hedge(self, stats: Optional[QueryStats]) -> bool:
+        with self._lock:
+            if self.hedges + 1 > self.max_hedge_rate * self.requests:
+                return False
+            self.hedges += 1
+        if stats is not None:
+            stats.hedged_requests += 1
+        return True
+
+    def _record_outcome(
+        self, stats: Optional[QueryStats], category: str, latency: float, hedge_won: bool
+    ) -> None:
+        self.record_latency(category, latency)
+        if hedge_won:
+            with self._lock:
+                self.hedge_wins += 1
+            if stats is not None:
+                stats.hedge_wins += 1
+
+    def _record_timeout(self, stats: Optional[QueryStats]) -> DeadlineExceededError:
+        with self._lock:
+            self.timeouts += 1
+        if stats is not None:
+            stats.timed_out_requests += 1
+        return DeadlineExceededError(
+            f"The model request did not complete within the {self.deadline_seconds}s deadline."
+        )
+
+    def _next_timeout(self, start_time: float, hedge_delay: Optional[float]) -> Optional[float]:
+        elapsed = time.monotonic() - start_time
+        timeouts = []
+        if hedge_delay is not None:
+            timeouts.append(hedge_delay - elapsed)
+        if self.deadline_seconds is not None:
+            timeouts.append(self.deadline_seconds - elapsed)
+        return max(0.0, min(timeouts)) if timeouts else None
+
+    def call(self, query: Callable[[dict], Any], inference_data: dict) -> Any:
+        """
+        Run `query(inference_data)` (eg, `handler._query_FC`) under the deadline and hedging rules. Returns what `query` returns.
+        """
+        stats = _QUERY_STATS.get()
+        category = stats.category if stats is not None else ""
+        self._count_request()
+        hedge_delay = self.hedge_delay(category)
+        start_time = time.monotonic()
+
+        if hedge_delay is None and self.deadline_seconds is None:
+            api_response, query_latency = query(inference_data)
+            self._record_outcome(stats, category, time.monotonic() - start_time, False)
+            return api_response, query_latency
+
+        attempts: dict[Future, dict] = {}
+        first_error = None
+        while True:
+            # Check every finished attempt, including one that finished right after it was started
+            for future in attempts:
+                if not future.done():
+                    continue
+                error = future.exception()
+                if error is not None:
+                    first_error = first_error or error
+                    continue
+                if attempts[future] is not inference_data:
+                    inference_data.update(attempts[future])
+                api_response, query_latency = future.result()
+                hedge_won = future is not next(iter(attempts))
+                elapsed = time.monotonic() - start_time
+                self._record_outcome(stats, category, elapsed, hedge_won)
+                # With a hedge, the entry waited from the start of the first attempt
+                return api_response, elapsed if len(attempts) > 1 else query_latency
+
+            if not attempts or (
+                hedge_delay is not None
+                and len(attempts) == 1
+                and time.monotonic() - start_time >= hedge_delay
+            ):
+                if attempts and not self._take_hedge(stats):
+                    hedge_delay = None
+                else:
+                    attempt_data = copy.deepcopy(inference_data) if attempts else inference_data
+                    attempts[_attempt_threads.submit(query, attempt_data)] = attempt_data
+                    if len(attempts) > 1:
+                        hedge_delay = None
+                    continue
+
+            pending = [future for future in attempts if not future.done()]
+            if not pending:
+                # Every attempt failed
+                raise first_error
+            if (
+                self.deadline_seconds is not None
+                and time.monotonic() - start_time >= self.deadline_seconds
+            ):
+                raise self._record_timeout(stats)
+
+            wait(
+                pending,
+                timeout=self._next_timeout(start_time, hedge_delay if len(attempts) == 1 else None),
+                return_when=FIRST_COMPLETED,
+            )
+
+    async def call_async(
+        self, query: Callable[[dict], Awaitable[Any]], inference_data: dict
+    ) -> Any:
+        """
+        Asyncio counterpart of `call`.
+        """
+        stats = _QUERY_STATS.get()
+        category = stats.category if stats is not None else ""
+        self._count_request()
+        hedge_delay = self.hedge_delay(category)
+        start_time = time.monotonic()
+
+        if hedge_delay is None and self.deadline_seconds is None:
+            api_response, query_latency = await query(inference_data)
+            self._record_outcome(stats, category, time.monotonic() - start_time, False)
+            return api_response, query_latency
+
+        attempts: dict[asyncio.Task, dict] = {}
+        first_error = None
+        try:
+            while True:
+                for task in attempts:
+                    if not task.done():
+                        continue
+                    error = task.exception()
+                    if error is not None:
+                        first_error = first_error or error
+                        continue
+                    if attempts[task] is not inference_data:
+                        inference_data.update(attempts[task])
+                    api_response, query_latency = task.result()
+                    hedge_won = task is not next(iter(attempts))
+                    elapsed = time.monotonic() - start_time
+                    self._record_outcome(stats, category, elapsed, hedge_won)
+                    return api_response, elapsed if len(attempts) > 1 else query_latency
+
+                if not attempts or (
+                    hedge_delay is not None
+                    and len(attempts) == 1
+                    and time.monotonic() - start_time >= hedge_delay
+                ):
+                    if attempts and not self._take_hedge(stats):
+                        hedge_delay = None
+                    else:
+                        attempt_data = copy.deepcopy(inference_data) if attempts else inference_data
+                        attempts[asyncio.ensure_future(query(attempt_data))] = attempt_data
+                        if len(attempts) > 1:
+                            hedge_delay = None
+                        continue
+
+                pending = [task for task in attempts if not task.done()]
+                if not pending:
+                    raise first_error
+                if (
+                    self.deadline_seconds is not None
+                    and time.monotonic() - start_time >= self.deadline_seconds
+                ):
+                    raise self._record_timeout(stats)
+
+                await asyncio.wait(
+                    pending,
+                    timeout=self._next_timeout(
+                        start_time, hedge_delay if len(attempts) == 1 else None
+                    ),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+        finally:
+            for task in attempts:
+                if not task.done():
+                    task.cancel()
+
+    def summary(self) -> str:
+        return (
+            f"Request hedging: {self.hedges} of {self.requests} requests hedged "
+            f"({self.hedge_wins} answered first by the hedge), {self.timeouts} exceeded the deadline."
+        )
+
+
+class _AttemptThreads:
+    """
+    Daemon threads that run the sync attempts of `HedgingPolicy.call`, so that the caller can give up on an attempt at the deadline.
+
+    An attempt hung past the deadline must never hold up another attempt or the interpreter exit, so every attempt gets a thread of its own: an idle one if there is any, a new one otherwise. Idle threads are kept for the next attempts, so a request does not pay for starting a thread.
+    """
+
+    def __init__(self) -> None:
+        self._attempts = queue.SimpleQueue()
+        self._idle_threads = 0
+        self._lock = threading.Lock()
+
+    def submit(self, query: Callable[[dict], Any], attempt_data: dict) -> Future:
+        future = Future()
+        with self._lock:
+            if self._idle_threads:
+                self._idle_threads -= 1
+            else:
+                threading.Thread(target=self._run, daemon=True).start()
+        self._attempts.put((future, contextvars.copy_context(), query, attempt_data))
+        return future
+
+    def _run(self) -> None:
+        while True:
+            future, context, query, attempt_data = self._attempts.get()
+            try:
+                result, error = context.run(query, attempt_data), None
+            except BaseException as e:
+                result, error = None, e
+            # Idle before the caller hears back, so that the caller's next attempt reuses this thread
+            with self._lock:
+                self._idle_threads += 1
+            if error is None:
+                future.set_result(result)
+            else:
+                future.set_exception(error)
+            # Don't keep the attempt alive while idling
+            del future, context, query, attempt_data, result, error
+
+
+_attempt_threads = _AttemptThreads()
@@ -0,0 +1,170 @@
+import hashlib
+import json
+import pickle
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from bfcl_eval.constants.eval_config import CACHE_MODES
+
+# Keys of `inference_data` that do not affect the request sent to the model
+_CACHE_KEY_EXCLUDED_FIELDS = {"inference_input_log"}
+
+
+class ResponseCache:
+    """
+    Content-addressed cache of model responses, stored in an embedded SQLite database.
+
+    Entries are keyed by a hash of everything that determines the request: the handler class, model name, temperature, query mode (FC or prompting) and the fully compiled `inference_data` (messages, tools, extra body, ...). Private bookkeeping keys (those starting with `_`) and the `inference_input_log` are not part of the key.
+
+    The cached value is the `(api_response, query_latency)` tuple returned by `_query_FC`/`_query_prompting`, together with the top-level `inference_data` fields that the query method set as a side effect (eg, `inference_input_log`), so that a cache hit is indistinguishable from a real query for the rest of the pipeline.
+
+    The database is bounded by `max_size_bytes`; when it grows past that, the least recently used entries are evicted.
+    """
+
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        mode: str = "readwrite",
+        max_size_bytes: int = 10 * 1024**3,
+    ) -> None:
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Invalid cache mode '{mode}'. Expected one of {CACHE_MODES}.")
+
+        self.db_path = Path(db_path)
+        self.mode = mode
+        self.max_size_bytes = max_size_bytes
+        self.hits = 0
+        self.misses = 0
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # One connection shared by all worker threads, serialized by the lock below
+        self._conn = sqlite3.connect(
+            str(self.db_path), check_same_thread=False, timeout=60
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_last_access ON responses (last_access)"
+        )
+        self._conn.commit()
+        self._total_size = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+        self._lock = threading.Lock()
+
+    @property
+    def readable(self) -> bool:
+        return self.mode in ("read", "readwrite")
+
+    @property
+    def writable(self) -> bool:
+        return self.mode in ("write", "readwrite")
+
+    @staticmethod
+    def make_key(handler, query_mode: str, inference_data: dict) -> str:
+        request = {
+            key: value
+            for key, value in inference_data.items()
+            if not key.startswith("_") and key not in _CACHE_KEY_EXCLUDED_FIELDS
+        }
+        payload = json.dumps(
+            {
+                "handler": type(handler).__qualname__,
+                "model_name": handler.model_name,
+                "registry_name": handler.registry_name,
+                "temperature": handler.temperature,
+                "query_mode": query_mode,
+                "request": request,
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+            # Some handlers keep SDK objects in the messages; their repr is good enough to tell requests apart
+            default=repr,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[tuple[Any, float, dict]]:
+        """
+        Return `(api_response, query_latency, inference_data_updates)` for `key`, or None on a miss.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                try:
+                    cached = pickle.loads(row[0])
+                except Exception:
+                    # Written by an incompatible SDK version; treat as a miss
+                    row = None
+            if row is None:
+                self.misses += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE responses SET last_access = ? WHERE key = ?", (time.time(), key)
+            )
+            self._conn.commit()
+            self.hits += 1
+            return cached
+
+    def put(
+        self, key: str, api_response: Any, query_latency: float, inference_data_updates: dict
+    ) -> None:
+        try:
+            value = pickle.dumps(
+                (api_response, query_latency, inference_data_updates),
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        except Exception:
+            # Some SDK response objects cannot be pickled; those responses are simply not cached
+            return
+
+        with self._lock:
+            previous = self._conn.execute(
+                "SELECT size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, size, last_access) VALUES (?, ?, ?, ?)",
+                (key, value, len(value), time.time()),
+            )
+            self._total_size += len(value) - (previous[0] if previous else 0)
+            if self._total_size > self.max_size_bytes:
+                self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        # Other processes may share the database, so re-read the actual size before evicting
+        self._total_size = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+        if self._total_size <= self.max_size_bytes:
+            return
+
+        excess = self._total_size - self.max_size_bytes
+        evicted_keys = []
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY last_access"
+        ):
+            if excess <= 0:
+                break
+            evicted_keys.append((key,))
+            excess -= size
+            self._total_size -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", evicted_keys)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
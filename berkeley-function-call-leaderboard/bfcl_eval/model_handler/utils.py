@@ -1,6 +1,7 @@
 import ast
 import builtins
 import copy
+import inspect
 import json
 import operator
 import re
@@ -540,6 +541,22 @@ def decoded_output_to_execution_list(decoded_output: list[dict]) -> list[str]:
     return execution_list
 
 
+_backoff_listeners: list[Callable] = []
+
+
+def add_backoff_listener(listener: Callable) -> None:
+    """
+    Register a callback that is invoked as `listener(handler, exception)` every time a function decorated with `retry_with_backoff` is about to back off.
+    This lets the generation scheduler react to rate limiting (e.g. by lowering its concurrency) instead of only sleeping inside each worker.
+    """
+    _backoff_listeners.append(listener)
+
+
+def remove_backoff_listener(listener: Callable) -> None:
+    if listener in _backoff_listeners:
+        _backoff_listeners.remove(listener)
+
+
 def retry_with_backoff(
     error_type: Optional[Union[Type[Exception], List[Type[Exception]]]] = None,
     error_message_pattern: Optional[str] = None,
@@ -586,18 +603,40 @@ def retry_with_backoff(
         # Combine all conditions using logical OR
         retry_policy = reduce(operator.or_, conditions)
 
-        @retry(
-            wait=wait_random_exponential(min=min_wait, max=max_wait),
-            retry=retry_policy,
-            before_sleep=lambda retry_state: print(
+        def before_sleep(retry_state):
+            print(
                 f"Attempt {retry_state.attempt_number} failed. "
                 f"Sleeping for {retry_state.next_action.sleep:.2f} seconds before retrying... "
                 f"Error: {retry_state.outcome.exception()}"
-            ),
+            )
+            # The decorated functions are handler methods, so the first positional argument is the handler
+            handler = retry_state.args[0] if retry_state.args else None
+            rate_limiter = getattr(handler, "rate_limiter", None)
+            if rate_limiter is not None:
+                # Pause every worker that shares the provider account, not only this one
+                rate_limiter.record_rate_limit()
+            for listener in list(_backoff_listeners):
+                listener(handler, retry_state.outcome.exception())
+
+        retry_decorator = retry(
+            wait=wait_random_exponential(min=min_wait, max=max_wait),
+            retry=retry_policy,
+            before_sleep=before_sleep,
             **kwargs,
         )
-        def wrapped(*args, **inner_kwargs):
-            return func(*args, **inner_kwargs)
+
+        # Coroutine functions need an async wrapper, so that tenacity retries on the awaited result instead of on the coroutine object
+        if inspect.iscoroutinefunction(func):
+
+            @retry_decorator
+            async def wrapped(*args, **inner_kwargs):
+                return await func(*args, **inner_kwargs)
+
+        else:
+
+            @retry_decorator
+            def wrapped(*args, **inner_kwargs):
+                return func(*args, **inner_kwargs)
 
         return wrapped
 
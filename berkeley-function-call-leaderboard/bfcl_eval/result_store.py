@@ -0,0 +1,514 @@
+import hashlib
+import json
+import os
+import queue
+import statistics
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Optional, Union
+
+from bfcl_eval.constants.eval_config import RESULT_FILE_PATTERN
+from bfcl_eval.utils import (
+    _get_file_lock,
+    extract_test_category_from_id,
+    load_file,
+    make_json_serializable,
+    sort_key,
+)
+
+if TYPE_CHECKING:
+    from bfcl_eval.model_handler.base_handler import BaseHandler
+
+JOURNAL_SUFFIX = ".journal"
+JOURNAL_INDEX_SUFFIX = ".journal.idx"
+COMPLETION_MANIFEST_FILE_NAME = ".completion_manifest.json"
+COMPLETION_MANIFEST_VERSION = 1
+LATENCY_HISTORY_FILE_NAME = ".latency_history.json"
+LATENCY_HISTORY_VERSION = 1
+# Used when nothing at all is known about a test case
+DEFAULT_EXPECTED_LATENCY = 1.0
+
+
+def serialize_result_entry(entry: dict) -> str:
+    """
+    Serialize a result entry as one JSONL line. Used for every write to a result file or journal, so that a result reads the same whichever path wrote it.
+    """
+    try:
+        # Fast path: most entries are already JSON serializable, and `make_json_serializable` would return them unchanged
+        content = json.dumps(entry)
+    except (TypeError, ValueError):
+        content = json.dumps(make_json_serializable(entry))
+    return content + "\n"
+
+
+class ResultJournal:
+    """
+    Append-only journal that sits next to a result file and collects updated entries for it.
+
+    Rewriting the whole (sorted) result file for every single updated entry makes a targeted re-run of N entries O(N^2) in I/O. Instead, each entry is appended to `<result_file>.journal`, and its byte offset is appended to `<result_file>.journal.idx` as a `<id>\\t<offset>` line. If the same id is journaled more than once, the latest record wins.
+
+    `compact` merges the journal into the result file in one pass, producing the same sorted JSONL layout that `load_file` expects, and then removes the journal. Both files are plain text, so a journal left behind by an interrupted run can still be compacted later.
+    """
+
+    def __init__(self, result_file_path: Union[str, Path]) -> None:
+        self.result_file_path = Path(result_file_path)
+        self.journal_path = self.result_file_path.with_name(
+            self.result_file_path.name + JOURNAL_SUFFIX
+        )
+        self.index_path = self.result_file_path.with_name(
+            self.result_file_path.name + JOURNAL_INDEX_SUFFIX
+        )
+
+    def append(self, entries: list[dict]) -> None:
+        """
+        Append entries to the journal.
+        """
+        self.append_serialized(
+            [(entry["id"], serialize_result_entry(entry)) for entry in entries]
+        )
+
+    def append_serialized(self, serialized_entries: list[tuple[str, str]]) -> None:
+        """
+        Append `(id, json_line)` pairs to the journal, with a single write per file.
+        """
+        if not serialized_entries:
+            return
+
+        with _get_file_lock(self.journal_path):
+            with open(self.journal_path, "ab") as journal_file, open(
+                self.index_path, "a", encoding="utf-8"
+            ) as index_file:
+                offset = journal_file.tell()
+                records, index_lines = [], []
+                for entry_id, line in serialized_entries:
+                    record = line.encode("utf-8")
+                    records.append(record)
+                    index_lines.append(f"{entry_id}\t{offset}\n")
+                    offset += len(record)
+                journal_file.write(b"".join(records))
+                journal_file.flush()
+                # The index is only written after the records it points to
+                index_file.write("".join(index_lines))
+                index_file.flush()
+
+    def load_index(self) -> dict[str, int]:
+        """
+        Return the id -> offset mapping of the latest journaled record for each id.
+        """
+        index = {}
+        if not self.index_path.exists():
+            return index
+        with open(self.index_path, encoding="utf-8") as f:
+            for line in f:
+                entry_id, sep, offset = line.rstrip("\n").rpartition("\t")
+                # Skip a partially written trailing line from an interrupted run
+                if not sep or not offset.isdigit():
+                    continue
+                index[entry_id] = int(offset)
+        return index
+
+    def compact(self) -> bool:
+        """
+        Merge the journal into the result file and remove the journal. Returns False if there was nothing to compact.
+        """
+        with _get_file_lock(self.journal_path):
+            index = self.load_index()
+            if not index:
+                self._remove_journal()
+                return False
+
+            updated_entries = {}
+            with open(self.journal_path, "rb") as journal_file:
+                # Read in file order, so that the disk access is sequential
+                for entry_id, offset in sorted(index.items(), key=lambda item: item[1]):
+                    journal_file.seek(offset)
+                    updated_entries[entry_id] = json.loads(journal_file.readline())
+
+            with _get_file_lock(self.result_file_path):
+                existing_entries = {}
+                if self.result_file_path.exists():
+                    existing_entries = {
+                        entry["id"]: entry
+                        for entry in load_file(self.result_file_path, use_lock=False)
+                    }
+                existing_entries.update(updated_entries)
+
+                sorted_entries = sorted(existing_entries.values(), key=sort_key)
+                # Write to a temporary file first, so that an interruption never leaves a truncated result file behind
+                tmp_path = self.result_file_path.with_name(
+                    self.result_file_path.name + ".tmp"
+                )
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    f.write("".join(serialize_result_entry(entry) for entry in sorted_entries))
+                os.replace(tmp_path, self.result_file_path)
+
+            self._remove_journal()
+            return True
+
+    def _remove_journal(self) -> None:
+        self.journal_path.unlink(missing_ok=True)
+        self.index_path.unlink(missing_ok=True)
+
+
+def compact_result_journals(model_result_dir: Union[str, Path]) -> int:
+    """
+    Compact every result journal found under `model_result_dir`. Returns the number of result files that were updated.
+    """
+    model_result_dir = Path(model_result_dir)
+    if not model_result_dir.exists():
+        return 0
+
+    compacted = 0
+    for journal_path in model_result_dir.rglob(f"*{JOURNAL_SUFFIX}"):
+        result_file_path = journal_path.with_name(
+            journal_path.name[: -len(JOURNAL_SUFFIX)]
+        )
+        if ResultJournal(result_file_path).compact():
+            compacted += 1
+    return compacted
+
+
+class BatchedResultWriter:
+    """
+    Group-commit writer for generated results.
+
+    Results are put on a bounded queue and written by a single background thread. The thread blocks for the first result of a batch, then keeps draining until it has `max_batch_size` results or `max_batch_delay_ms` milliseconds have passed, and hands the whole batch to `handler.write`. Result files are kept open across batches, so each batch costs one write and one flush per touched category instead of an open/write/flush/close per result.
+
+    The queue is bounded, so when the disk cannot keep up (eg, an NFS-mounted result directory), `put` blocks and the workers slow down instead of buffering an unbounded number of results in memory.
+
+    `on_written(batch)`, if given, is called from the writer thread after each batch has been written and flushed.
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        handler: "BaseHandler",
+        result_dir: Path,
+        update_mode: bool = False,
+        max_batch_size: int = 64,
+        max_batch_delay_ms: float = 50,
+        max_queue_size: int = 1024,
+        on_written: Optional[Callable[[list[dict]], None]] = None,
+    ) -> None:
+        self.handler = handler
+        self.result_dir = result_dir
+        self.update_mode = update_mode
+        self.on_written = on_written
+        self.max_batch_size = max_batch_size
+        self.max_batch_delay = max_batch_delay_ms / 1000
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._file_handles = {}
+        self._error = None
+        self._error_raised = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> "BatchedResultWriter":
+        self._thread.start()
+        return self
+
+    def put(self, result: dict) -> None:
+        """
+        Enqueue a result for writing; blocks while the queue is full.
+        Raises the write error as soon as a batch could not be written, so that the run stops instead of generating results that are never saved.
+        """
+        self._raise_error()
+        self._queue.put(result)
+
+    def try_put(self, result: dict) -> bool:
+        """
+        Enqueue a result without blocking. Returns False if the queue is full.
+        """
+        self._raise_error()
+        try:
+            self._queue.put_nowait(result)
+        except queue.Full:
+            return False
+        return True
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            self._error_raised = True
+            raise self._error
+
+    def close(self) -> None:
+        """
+        Flush all pending results, stop the writer thread and close the result files. Re-raises the first write error, if `put` has not raised it already.
+        """
+        if self._thread.is_alive():
+            self._queue.put(self._STOP)
+            self._thread.join()
+        if self._error is not None and not self._error_raised:
+            raise self._error
+
+    def _run(self) -> None:
+        try:
+            stopping = False
+            while not stopping:
+                item = self._queue.get()
+                if item is self._STOP:
+                    break
+                batch = [item]
+                deadline = time.monotonic() + self.max_batch_delay
+                while len(batch) < self.max_batch_size:
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    try:
+                        item = self._queue.get(timeout=timeout)
+                    except queue.Empty:
+                        break
+                    if item is self._STOP:
+                        stopping = True
+                        break
+                    batch.append(item)
+
+                if self._error is not None:
+                    # The next `put` raises; keep draining, so that producers blocked on the full queue are not stuck forever
+                    continue
+                try:
+                    self.handler.write(
+                        batch,
+                        result_dir=self.result_dir,
+                        update_mode=self.update_mode,
+                        file_handles=self._file_handles,
+                    )
+                    if self.on_written is not None:
+                        self.on_written(batch)
+                except Exception as e:
+                    self._error = e
+        finally:
+            for f in self._file_handles.values():
+                f.close()
+            self._file_handles.clear()
+
+    def __enter__(self) -> "BatchedResultWriter":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+class CompletionManifest:
+    """
+    Compact record of which test ids are already present in each result file of a model result directory.
+
+    For every result file, `<model_result_dir>/.completion_manifest.json` stores its size, modification time and SHA-256 checksum together with the sorted list of ids it contains. On resume, the ids can then be answered from the manifest without decoding the (possibly multi-megabyte) result files:
+    - if size and modification time match, the entry is trusted as is;
+    - otherwise the file is re-hashed, and if the checksum still matches (eg, the file was only touched or copied), only the recorded stat is refreshed;
+    - only when the checksum differs is the file fully parsed again.
+    """
+
+    def __init__(self, model_result_dir: Union[str, Path]) -> None:
+        self.model_result_dir = Path(model_result_dir)
+        self.manifest_path = self.model_result_dir / COMPLETION_MANIFEST_FILE_NAME
+        self._files = self._load()
+        self._dirty = False
+
+    def _load(self) -> dict:
+        if not self.manifest_path.exists():
+            return {}
+        try:
+            with open(self.manifest_path, encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            # A corrupted manifest is simply rebuilt from the result files
+            return {}
+        if manifest.get("version") != COMPLETION_MANIFEST_VERSION:
+            return {}
+        return manifest.get("files", {})
+
+    @staticmethod
+    def _checksum(file_path: Path) -> str:
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def get_ids(self, result_file_path: Union[str, Path]) -> set[str]:
+        """
+        Return the set of ids in `result_file_path`, using the manifest whenever it is still valid.
+        """
+        result_file_path = Path(result_file_path)
+        key = result_file_path.relative_to(self.model_result_dir).as_posix()
+
+        if not result_file_path.exists():
+            if self._files.pop(key, None) is not None:
+                self._dirty = True
+            return set()
+
+        stat = result_file_path.stat()
+        record = self._files.get(key)
+        if record is not None:
+            if record["size"] == stat.st_size and record["mtime_ns"] == stat.st_mtime_ns:
+                return set(record["ids"])
+
+            checksum = self._checksum(result_file_path)
+            if record["sha256"] == checksum:
+                record["size"], record["mtime_ns"] = stat.st_size, stat.st_mtime_ns
+                self._dirty = True
+                return set(record["ids"])
+        else:
+            checksum = self._checksum(result_file_path)
+
+        # Fall back to a full scan of the result file
+        ids = {entry["id"] for entry in load_file(result_file_path)}
+        self._files[key] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": checksum,
+            "ids": sorted(ids),
+        }
+        self._dirty = True
+        return ids
+
+    def refresh(self, result_file_paths) -> None:
+        """
+        Bring the manifest up to date for the given result files (eg, right after a generation run).
+        """
+        for result_file_path in result_file_paths:
+            self.get_ids(result_file_path)
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        self.model_result_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_path.with_name(self.manifest_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"version": COMPLETION_MANIFEST_VERSION, "files": self._files},
+                f,
+                separators=(",", ":"),
+            )
+        os.replace(tmp_path, self.manifest_path)
+        self._dirty = False
+
+
+def total_latency(latency) -> Optional[float]:
+    """
+    Sum the `latency` field of a result entry: a float for single-turn entries, a list of per-turn lists of per-step latencies for multi-turn ones.
+    """
+    if isinstance(latency, (int, float)) and not isinstance(latency, bool):
+        return float(latency)
+    if isinstance(latency, list):
+        parts = [total_latency(item) for item in latency]
+        parts = [part for part in parts if part is not None]
+        return sum(parts) if parts else None
+    return None
+
+
+class LatencyHistory:
+    """
+    Generation latency (in seconds) of every test id seen in previous runs of a model, stored in `<model_result_dir>/.latency_history.json`.
+
+    The history is updated with the results of every run. With `bootstrap`, a history that does not cover the existing results yet (eg, the first time the latencies are needed for a model that already has results) is completed from the `latency` field of the existing result files. Without it, nothing but the history file is read, and a history saved without ever being bootstrapped is flagged as such, so that the next run that needs the latencies still bootstraps it.
+    """
+
+    def __init__(self, model_result_dir: Union[str, Path], bootstrap: bool = True) -> None:
+        self.model_result_dir = Path(model_result_dir)
+        self.history_path = self.model_result_dir / LATENCY_HISTORY_FILE_NAME
+        self.latencies: dict[str, float] = {}
+        # Whether the history covers every result in the result files
+        self.bootstrapped = False
+        self._load()
+        self._dirty = False
+        if bootstrap and not self.bootstrapped:
+            self._bootstrap_from_result_files()
+
+    def _load(self) -> None:
+        if not self.history_path.exists():
+            return
+        try:
+            with open(self.history_path, encoding="utf-8") as f:
+                history = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+        if history.get("version") != LATENCY_HISTORY_VERSION:
+            return
+        self.latencies = history.get("latency", {})
+        self.bootstrapped = history.get("bootstrapped", True)
+
+    def _bootstrap_from_result_files(self) -> None:
+        if self.model_result_dir.exists():
+            for result_file_path in self.model_result_dir.rglob(RESULT_FILE_PATTERN):
+                for entry in load_file(result_file_path):
+                    self.record(entry["id"], entry.get("latency"))
+        self.bootstrapped = True
+        self._dirty = True
+
+    def record(self, test_case_id: str, latency) -> None:
+        latency = total_latency(latency)
+        if latency is not None:
+            self.latencies[test_case_id] = latency
+            self._dirty = True
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        self.model_result_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.history_path.with_name(self.history_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": LATENCY_HISTORY_VERSION,
+                    "bootstrapped": self.bootstrapped,
+                    "latency": self.latencies,
+                },
+                f,
+                separators=(",", ":"),
+            )
+        os.replace(tmp_path, self.history_path)
+        self._dirty = False
+
+    def estimator(
+        self, fallback_histories: list["LatencyHistory"] = ()
+    ) -> Callable[[dict], float]:
+        """
+        Build a `test_case -> expected latency` function. In order of preference, it uses:
+        1. the latency of the same id in this history;
+        2. the median latency of the same id across `fallback_histories` (eg, other models);
+        3. the median latency of the test category in this history, then across the fallback histories;
+        4. the median of all latencies in this history, then `DEFAULT_EXPECTED_LATENCY`.
+        """
+        fallback_by_id = {}
+        for history in fallback_histories:
+            for test_case_id, latency in history.latencies.items():
+                fallback_by_id.setdefault(test_case_id, []).append(latency)
+        fallback_by_id = {
+            test_case_id: statistics.median(latencies)
+            for test_case_id, latencies in fallback_by_id.items()
+        }
+
+        def _medians_by_category(latencies_by_id: dict[str, float]) -> dict[str, float]:
+            by_category = {}
+            for test_case_id, latency in latencies_by_id.items():
+                by_category.setdefault(
+                    extract_test_category_from_id(test_case_id), []
+                ).append(latency)
+            return {
+                category: statistics.median(latencies)
+                for category, latencies in by_category.items()
+            }
+
+        own_by_category = _medians_by_category(self.latencies)
+        fallback_by_category = _medians_by_category(fallback_by_id)
+        overall = (
+            statistics.median(self.latencies.values())
+            if self.latencies
+            else DEFAULT_EXPECTED_LATENCY
+        )
+
+        def expected_latency(test_case: dict) -> float:
+            test_case_id = test_case["id"]
+            if test_case_id in self.latencies:
+                return self.latencies[test_case_id]
+            if test_case_id in fallback_by_id:
+                return fallback_by_id[test_case_id]
+            test_category = extract_test_category_from_id(test_case_id)
+            if test_category in own_by_category:
+                return own_by_category[test_category]
+            return fallback_by_category.get(test_category, overall)
+
+        return expected_latency
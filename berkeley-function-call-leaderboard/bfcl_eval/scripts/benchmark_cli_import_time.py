@@ -0,0 +1,146 @@
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+from tabulate import tabulate
+
+"""
+This script guards the cold-start time of the `bfcl` CLI.
+
+Every command is run several times in a fresh interpreter with `python -X importtime`. The script reports the median wall time and the modules with the largest cumulative import time. It fails (exit code 1) if the median wall time goes over `--max-seconds`, or if any vendor SDK or generation-only module was imported: model handlers are only imported when a model is actually generated or evaluated, so commands like `bfcl --help` and `bfcl models` should never load them.
+
+To run this script, use the following command:
+```
+cd berkeley-function-call-leaderboard
+python -m bfcl_eval.scripts.benchmark_cli_import_time --command "--help" "models" --max-seconds 2
+```
+"""
+
+# Modules that must not be imported by the commands measured here
+FORBIDDEN_MODULES = [
+    "anthropic",
+    "boto3",
+    "cohere",
+    "google.genai",
+    "mistralai",
+    "openai",
+    "qwen_agent",
+    "writerai",
+    "bfcl_eval._llm_response_generation",
+    "bfcl_eval.eval_checker.eval_runner",
+    "bfcl_eval.model_handler.base_handler",
+]
+
+# Format of the `-X importtime` lines: "import time: <self us> | <cumulative us> | <indented module name>"
+_IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def run_once(command: list[str]) -> tuple[float, dict[str, int], int]:
+    """
+    Run `python -X importtime -m bfcl_eval <command>` once. Returns the wall time, the cumulative import time (us) of every module, and the exit code.
+    """
+    start_time = time.perf_counter()
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "bfcl_eval", *command],
+        capture_output=True,
+        text=True,
+    )
+    wall_time = time.perf_counter() - start_time
+
+    cumulative_times = {}
+    for line in process.stderr.splitlines():
+        match = _IMPORT_TIME_LINE.match(line)
+        if match:
+            cumulative_times[match.group(4)] = int(match.group(2))
+    return wall_time, cumulative_times, process.returncode
+
+
+def benchmark_command(command: list[str], runs: int) -> dict:
+    wall_times = []
+    for _ in range(runs):
+        wall_time, cumulative_times, return_code = run_once(command)
+        wall_times.append(wall_time)
+    return {
+        "wall_times": wall_times,
+        "cumulative_times": cumulative_times,
+        "return_code": return_code,
+        "forbidden_modules": [
+            module for module in FORBIDDEN_MODULES if module in cumulative_times
+        ],
+    }
+
+
+def get_args():
+    parser = argparse.ArgumentParser(description="Benchmark the cold-start time of the bfcl CLI.")
+    parser.add_argument(
+        "--command",
+        default=["--help", "models"],
+        type=str,
+        nargs="+",
+        help="The bfcl commands to measure, each given as one (quoted) string.",
+    )
+    parser.add_argument("--runs", default=5, type=int)
+    parser.add_argument("--max-seconds", default=2.0, type=float)
+    parser.add_argument(
+        "--top", default=10, type=int, help="Number of slowest imports to show per command."
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = get_args()
+
+    rows = []
+    failures = []
+    for command_string in args.command:
+        result = benchmark_command(command_string.split(), args.runs)
+        median_time = statistics.median(result["wall_times"])
+        rows.append(
+            {
+                "command": f"bfcl {command_string}",
+                "median (s)": round(median_time, 3),
+                "min (s)": round(min(result["wall_times"]), 3),
+                "modules imported": len(result["cumulative_times"]),
+                "forbidden imports": ", ".join(result["forbidden_modules"]) or "-",
+            }
+        )
+
+        print(f"\nSlowest imports of `bfcl {command_string}` (cumulative):")
+        top_modules = sorted(
+            result["cumulative_times"].items(), key=lambda item: item[1], reverse=True
+        )[: args.top]
+        print(
+            tabulate(
+                [(module, round(us / 1000, 1)) for module, us in top_modules],
+                headers=["module", "ms"],
+                tablefmt="github",
+            )
+        )
+
+        if result["return_code"] != 0:
+            failures.append(f"`bfcl {command_string}` exited with code {result['return_code']}.")
+        if median_time > args.max_seconds:
+            failures.append(
+                f"`bfcl {command_string}` took {median_time:.2f}s, over the {args.max_seconds:.2f}s budget."
+            )
+        if result["forbidden_modules"]:
+            failures.append(
+                f"`bfcl {command_string}` imported {', '.join(result['forbidden_modules'])}."
+            )
+
+    print()
+    print(tabulate(rows, headers="keys", tablefmt="github"))
+
+    if failures:
+        print()
+        for failure in failures:
+            print(f"❌ {failure}")
+        sys.exit(1)
+    print("\n✅ All commands are within the cold-start budget.")
+
+
+if __name__ == "__main__":
+    main()
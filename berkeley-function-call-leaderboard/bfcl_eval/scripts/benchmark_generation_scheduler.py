@@ -0,0 +1,195 @@
+import argparse
+import json
+import math
+import os
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+from types import SimpleNamespace
+
+from bfcl_eval._generation_scheduler import DependencyScheduler
+from bfcl_eval._llm_response_generation import ModelRun, generate_results_for_models
+from bfcl_eval.model_handler.api_inference.openai_completion import (
+    OpenAICompletionsHandler,
+)
+from bfcl_eval.utils import load_dataset_entry
+from tabulate import tabulate
+
+"""
+This script measures how the generation pipeline (scheduler, handler and result writer) scales with concurrency, using the local mock server instead of a real provider.
+
+For every concurrency level, a batch of single-turn requests is sent through `generate_results_for_models` against a mock server with a constant latency. Since the latency is fixed, the ideal wall time is `ceil(N / concurrency) * latency`; everything above that is overhead from the client side of the pipeline. The mock server runs in its own process, so that it does not compete with the pipeline for the GIL.
+
+To run this script, use the following command:
+```
+cd berkeley-function-call-leaderboard
+python -m bfcl_eval.scripts.benchmark_generation_scheduler --concurrency 1 10 100 1000 --latency-ms 50
+```
+"""
+
+
+def build_benchmark_entries(test_category: str, num_entries: int) -> list[dict]:
+    """
+    Repeat the entries of `test_category` under fresh ids until there are `num_entries` of them.
+    """
+    source_entries = load_dataset_entry(test_category, include_prereq=False)
+    entries = []
+    for index in range(num_entries):
+        entry = dict(source_entries[index % len(source_entries)])
+        entry["id"] = f"{test_category}_{index}"
+        entries.append(entry)
+    return entries
+
+
+def run_level(args, base_url: str, concurrency: int, execution_mode: str) -> dict:
+    num_requests = args.requests_per_level or max(args.min_requests, 4 * concurrency)
+    entries = build_benchmark_entries(args.test_category, num_requests)
+
+    os.environ["OPENAI_BASE_URL"] = base_url
+    os.environ["OPENAI_API_KEY"] = "mock"
+    handler = OpenAICompletionsHandler(
+        model_name="mock-model",
+        temperature=0.001,
+        registry_name=f"mock-model-{execution_mode}-{concurrency}",
+        is_fc_model=args.model_style == "FC",
+    )
+
+    result_dir = Path(tempfile.mkdtemp(prefix="bfcl_benchmark_"))
+    run_args = SimpleNamespace(
+        result_dir=result_dir,
+        run_ids=False,
+        execution_mode=execution_mode,
+        include_input_log=False,
+        exclude_state_log=True,
+    )
+    run = ModelRun(
+        model_name=handler.registry_name,
+        handler=handler,
+        scheduler=DependencyScheduler(entries),
+        max_concurrency=concurrency,
+    )
+
+    try:
+        start_time = time.perf_counter()
+        generate_results_for_models(run_args, [run])
+        wall_time = time.perf_counter() - start_time
+    finally:
+        shutil.rmtree(result_dir, ignore_errors=True)
+
+    ideal_time = math.ceil(num_requests / concurrency) * args.latency_ms / 1000
+    return {
+        "mode": execution_mode,
+        "concurrency": concurrency,
+        "requests": num_requests,
+        "wall time (s)": round(wall_time, 3),
+        "ideal time (s)": round(ideal_time, 3),
+        "requests/s": round(num_requests / wall_time, 1),
+        "ideal requests/s": round(num_requests / ideal_time, 1) if ideal_time else None,
+        "overhead (%)": round(100 * (1 - ideal_time / wall_time), 1),
+        "overhead per request (ms)": round(
+            1000 * (wall_time - ideal_time) * concurrency / num_requests, 3
+        ),
+    }
+
+
+def start_mock_server(latency_ms: float) -> tuple[subprocess.Popen, str]:
+    """
+    Start the mock server in a subprocess on a free port, and wait until it answers.
+    """
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "bfcl_eval.scripts.mock_openai_server",
+            "--port",
+            str(port),
+            "--latency-distribution",
+            "constant",
+            "--latency-mean-ms",
+            str(latency_ms),
+            "--seed",
+            "0",
+        ],
+        cwd=Path(__file__).resolve().parents[2],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    base_url = f"http://127.0.0.1:{port}/v1"
+    deadline = time.monotonic() + 30
+    while True:
+        try:
+            urllib.request.urlopen(f"{base_url}/models", timeout=1).close()
+            return process, base_url
+        except OSError:
+            if process.poll() is not None or time.monotonic() > deadline:
+                process.kill()
+                raise RuntimeError("The mock server did not start.")
+            time.sleep(0.1)
+
+
+def stop_mock_server(process: subprocess.Popen) -> dict:
+    """
+    Stop the mock server subprocess and return the stats it prints on exit.
+    """
+    process.send_signal(signal.SIGINT)
+    try:
+        output, _ = process.communicate(timeout=10)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        output, _ = process.communicate()
+    for line in reversed(output.splitlines()):
+        if line.startswith("Served "):
+            return json.loads(line[len("Served ") :])
+    return {}
+
+
+def get_args():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the generation scheduler against the local mock server."
+    )
+    parser.add_argument("--concurrency", default=[1, 10, 100, 1000], type=int, nargs="+")
+    parser.add_argument(
+        "--execution-mode", default=["thread", "async"], choices=["thread", "async"], nargs="+"
+    )
+    parser.add_argument("--latency-ms", default=50.0, type=float)
+    parser.add_argument(
+        "--requests-per-level",
+        default=None,
+        type=int,
+        help="Number of requests per concurrency level. Defaults to max(--min-requests, 4 * concurrency).",
+    )
+    parser.add_argument("--min-requests", default=200, type=int)
+    parser.add_argument("--test-category", default="simple_python", type=str)
+    parser.add_argument("--model-style", default="FC", choices=["FC", "prompting"])
+    return parser.parse_args()
+
+
+def main():
+    args = get_args()
+
+    server_process, base_url = start_mock_server(args.latency_ms)
+
+    rows = []
+    try:
+        for execution_mode in args.execution_mode:
+            for concurrency in args.concurrency:
+                rows.append(run_level(args, base_url, concurrency, execution_mode))
+    finally:
+        server_stats = stop_mock_server(server_process)
+
+    print()
+    print(tabulate(rows, headers="keys", tablefmt="github"))
+    print(f"\nMock server stats: {server_stats}")
+
+
+if __name__ == "__main__":
+    main()
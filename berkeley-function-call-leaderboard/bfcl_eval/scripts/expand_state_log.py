@@ -0,0 +1,56 @@
+import argparse
+from pathlib import Path
+
+from bfcl_eval.state_log import expand_state_log
+from bfcl_eval.utils import load_file, write_list_of_dicts_to_file
+
+"""
+This script turns the inference logs of result files generated with `--state-log-format delta` back into the `full` format, where every `state_info` entry holds the complete backend state at that point of the conversation. Use it before reading the state log with tools that expect the full format.
+
+Result files are rewritten in place, unless `--output-dir` is given. Entries without an inference log, or whose log is already in full format, are left unchanged.
+
+To run this script, use the following command:
+```
+cd berkeley-function-call-leaderboard
+python -m bfcl_eval.scripts.expand_state_log result/MODEL_NAME/multi_turn/*.json --output-dir expanded_result
+```
+"""
+
+
+def expand_result_file(file_path: Path, output_dir: Path = None) -> int:
+    """
+    Expand the state logs of one result file. Returns the number of entries that had a delta-encoded log.
+    """
+    entries = load_file(file_path)
+    expanded_count = 0
+    for entry in entries:
+        inference_log = entry.get("inference_log")
+        if not isinstance(inference_log, list):
+            continue
+        expanded_log = expand_state_log(inference_log)
+        if expanded_log != inference_log:
+            expanded_count += 1
+        entry["inference_log"] = expanded_log
+
+    output_path = (output_dir or file_path.parent) / file_path.name
+    write_list_of_dicts_to_file(output_path, entries)
+    return expanded_count
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Rebuild full state logs from result files generated with `--state-log-format delta`."
+    )
+    parser.add_argument("result_files", nargs="+", type=Path)
+    parser.add_argument("--output-dir", default=None, type=Path)
+    args = parser.parse_args()
+
+    if args.output_dir is not None:
+        args.output_dir.mkdir(parents=True, exist_ok=True)
+    for file_path in args.result_files:
+        expanded_count = expand_result_file(file_path, args.output_dir)
+        print(f"{file_path}: expanded the state log of {expanded_count} entries.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,449 @@
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import random
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from bfcl_eval.constants.eval_config import LOCAL_SERVER_PORT
+
+"""
+A local stand-in for an OpenAI-compatible inference server, used to load-test the generation pipeline (scheduler, handlers, result writer) without paying a provider or booting vLLM/SGLang.
+
+It speaks `/v1/models`, `/v1/chat/completions` and `/v1/completions`, with configurable latency distributions, token counts, 429/500 injection and scripted responses. Only the Python standard library is used.
+
+To run the server, use the following command:
+```
+cd berkeley-function-call-leaderboard
+python -m bfcl_eval.scripts.mock_openai_server --port 1053 --latency-distribution lognormal --latency-mean-ms 800 --latency-std-ms 300 --rate-limit-rate 0.02
+```
+
+Then point the handlers at it through the existing hooks, for example:
+- API models built on the OpenAI SDK: `OPENAI_BASE_URL=http://localhost:1053/v1 OPENAI_API_KEY=mock`
+- Locally-hosted models: `REMOTE_OPENAI_BASE_URL=http://localhost:1053/v1` together with `--skip-server-setup`
+
+Scripted responses are read from a JSONL file (`--script`). Each line is an object with the optional fields
+- `match`: substring that must appear in the last message (chat) or in the prompt (completions);
+- `content`: the text content of the response;
+- `tool_calls`: list of `{"name": ..., "arguments": {...}}` (chat only);
+- `status`: HTTP status to return instead (eg, 429 or 500);
+- `latency_ms`: fixed latency for this response.
+The first line whose `match` is found wins; lines without `match` are used in turn when nothing matches.
+"""
+
+LATENCY_DISTRIBUTIONS = ["constant", "uniform", "normal", "lognormal", "exponential"]
+
+_HTTP_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    429: "Too Many Requests",
+    500: "Internal Server Error",
+}
+
+
+@dataclass
+class MockServerConfig:
+    served_models: list = field(default_factory=lambda: ["mock-model"])
+    latency_distribution: str = "constant"
+    latency_mean_ms: float = 0.0
+    latency_std_ms: float = 0.0
+    # None means estimate from the request/response text (~4 characters per token)
+    prompt_tokens: Optional[int] = None
+    completion_tokens: Optional[int] = None
+    rate_limit_rate: float = 0.0
+    server_error_rate: float = 0.0
+    default_content: str = "[]"
+    scripted_responses: list = field(default_factory=list)
+    seed: Optional[int] = None
+
+
+@dataclass
+class MockServerStats:
+    requests: int = 0
+    status_counts: dict = field(default_factory=dict)
+    in_flight: int = 0
+    max_in_flight: int = 0
+
+    def as_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "status_counts": dict(self.status_counts),
+            "max_in_flight": self.max_in_flight,
+        }
+
+
+class MockOpenAIServer:
+    """
+    Minimal asyncio HTTP/1.1 server (with keep-alive) that emulates the OpenAI API.
+    Use `serve_forever` from an event loop, or `start_in_background`/`stop` to run it in a daemon thread (eg, from a benchmark).
+    """
+
+    def __init__(self, config: MockServerConfig, host: str = "127.0.0.1", port: int = 0):
+        self.config = config
+        self.host = host
+        self.port = port
+        self.stats = MockServerStats()
+        self._random = random.Random(config.seed)
+        self._unmatched_scripts = itertools.cycle(
+            [script for script in config.scripted_responses if "match" not in script]
+            or [None]
+        )
+        self._server = None
+        self._loop = None
+        self._thread = None
+        self._started = threading.Event()
+        # Tasks of the open (keep-alive) connections, closed on shutdown
+        self._connection_tasks = set()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}/v1"
+
+    #### Server lifecycle ####
+
+    async def serve_forever(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port, limit=2**24, backlog=4096
+        )
+        # Resolve the actual port when port 0 was requested
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._started.set()
+        try:
+            await self._server.serve_forever()
+        except asyncio.CancelledError:
+            pass
+        finally:
+            await self._close_connections()
+
+    async def _close_connections(self) -> None:
+        # Closing the server only stops accepting; keep-alive connections stay open until their handler returns
+        self._server.close()
+        for task in list(self._connection_tasks):
+            task.cancel()
+        await asyncio.gather(*self._connection_tasks, return_exceptions=True)
+        await self._server.wait_closed()
+
+    def start_in_background(self) -> "MockOpenAIServer":
+        self._thread = threading.Thread(
+            target=lambda: asyncio.run(self.serve_forever()), daemon=True
+        )
+        self._thread.start()
+        self._started.wait()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stop accepting connections, close the open ones and wait for the server thread to finish.
+        """
+        if self._server is not None and self._loop is not None:
+            # Makes `serve_forever` return, which then closes the open connections
+            self._loop.call_soon_threadsafe(self._server.close)
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    #### HTTP handling ####
+
+    async def _handle_connection(self, reader, writer) -> None:
+        task = asyncio.current_task()
+        self._connection_tasks.add(task)
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+                status, payload = await self._dispatch(method, path, body)
+
+                response_body = json.dumps(payload).encode("utf-8")
+                response_headers = [
+                    f"HTTP/1.1 {status} {_HTTP_REASONS.get(status, 'Unknown')}",
+                    "Content-Type: application/json",
+                    f"Content-Length: {len(response_body)}",
+                    f"x-request-id: {uuid.uuid4().hex}",
+                ]
+                if status == 429:
+                    response_headers.append("retry-after-ms: 0")
+                writer.write(
+                    ("\r\n".join(response_headers) + "\r\n\r\n").encode("latin-1")
+                    + response_body
+                )
+                await writer.drain()
+
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        except asyncio.CancelledError:
+            # The server is shutting down
+            pass
+        finally:
+            self._connection_tasks.discard(task)
+            writer.close()
+
+    async def _dispatch(self, method: str, path: str, body: bytes) -> tuple[int, dict]:
+        path = path.split("?", 1)[0].rstrip("/")
+        if method == "GET" and path == "/v1/models":
+            return 200, self._list_models()
+        if method != "POST" or path not in ("/v1/chat/completions", "/v1/completions"):
+            return 404, _error_payload(f"Unknown endpoint {method} {path}", "not_found")
+
+        try:
+            request = json.loads(body or b"{}")
+        except json.JSONDecodeError:
+            return 400, _error_payload("Request body is not valid JSON", "invalid_request")
+        if request.get("stream"):
+            return 400, _error_payload("Streaming is not supported", "invalid_request")
+
+        self.stats.requests += 1
+        self.stats.in_flight += 1
+        self.stats.max_in_flight = max(self.stats.max_in_flight, self.stats.in_flight)
+        try:
+            is_chat = path == "/v1/chat/completions"
+            if is_chat:
+                request_text = _last_message_text(request)
+            elif isinstance(request.get("prompt"), list):
+                request_text = "\n".join(str(prompt) for prompt in request["prompt"])
+            else:
+                request_text = str(request.get("prompt", ""))
+            script = self._select_script(request_text)
+
+            await asyncio.sleep(self._sample_latency(script) / 1000)
+
+            status = self._select_status(script)
+            if status != 200:
+                payload = _error_payload(
+                    "Rate limit reached" if status == 429 else "Injected server error",
+                    "rate_limit_exceeded" if status == 429 else "server_error",
+                )
+            elif is_chat:
+                payload = self._chat_completion(request, request_text, script)
+            else:
+                payload = self._text_completion(request, request_text, script)
+        finally:
+            self.stats.in_flight -= 1
+
+        self.stats.status_counts[status] = self.stats.status_counts.get(status, 0) + 1
+        return status, payload
+
+    #### Response generation ####
+
+    def _select_script(self, request_text: str) -> Optional[dict]:
+        for script in self.config.scripted_responses:
+            if "match" in script and script["match"] in request_text:
+                return script
+        return next(self._unmatched_scripts)
+
+    def _select_status(self, script: Optional[dict]) -> int:
+        if script is not None and "status" in script:
+            return script["status"]
+        roll = self._random.random()
+        if roll < self.config.rate_limit_rate:
+            return 429
+        if roll < self.config.rate_limit_rate + self.config.server_error_rate:
+            return 500
+        return 200
+
+    def _sample_latency(self, script: Optional[dict]) -> float:
+        if script is not None and "latency_ms" in script:
+            return script["latency_ms"]
+
+        mean, std = self.config.latency_mean_ms, self.config.latency_std_ms
+        distribution = self.config.latency_distribution
+        if distribution == "constant" or mean <= 0:
+            return max(mean, 0.0)
+        if distribution == "uniform":
+            return self._random.uniform(max(mean - std, 0.0), mean + std)
+        if distribution == "normal":
+            return max(self._random.gauss(mean, std), 0.0)
+        if distribution == "lognormal":
+            # Parameterized so that the resulting distribution has the requested mean and standard deviation
+            sigma_squared = math.log1p((std / mean) ** 2)
+            mu = math.log(mean) - sigma_squared / 2
+            return self._random.lognormvariate(mu, sigma_squared**0.5)
+        if distribution == "exponential":
+            return self._random.expovariate(1 / mean)
+        raise ValueError(f"Unknown latency distribution: {distribution}")
+
+    def _usage(self, request_text: str, completion_text: str) -> dict:
+        prompt_tokens = (
+            self.config.prompt_tokens
+            if self.config.prompt_tokens is not None
+            else max(len(request_text) // 4, 1)
+        )
+        completion_tokens = (
+            self.config.completion_tokens
+            if self.config.completion_tokens is not None
+            else max(len(completion_text) // 4, 1)
+        )
+        return {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+
+    def _chat_completion(self, request: dict, request_text: str, script: Optional[dict]) -> dict:
+        content = self.config.default_content
+        tool_calls = None
+        if script is not None:
+            content = script.get("content", content if "tool_calls" not in script else None)
+            tool_calls = script.get("tool_calls")
+        elif request.get("tools"):
+            # Without a script, call the first available tool with no arguments
+            first_tool = request["tools"][0].get("function", request["tools"][0])
+            tool_calls = [{"name": first_tool.get("name", "unknown"), "arguments": {}}]
+            content = None
+
+        message = {"role": "assistant", "content": content}
+        if tool_calls:
+            message["tool_calls"] = [
+                {
+                    "id": f"call_{uuid.uuid4().hex[:24]}",
+                    "type": "function",
+                    "function": {
+                        "name": tool_call["name"],
+                        "arguments": json.dumps(tool_call.get("arguments", {})),
+                    },
+                }
+                for tool_call in tool_calls
+            ]
+
+        completion_text = (content or "") + json.dumps(tool_calls or "")
+        return {
+            "id": f"chatcmpl-{uuid.uuid4().hex}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model", self.config.served_models[0]),
+            "choices": [
+                {
+                    "index": 0,
+                    "message": message,
+                    "finish_reason": "tool_calls" if tool_calls else "stop",
+                    "logprobs": None,
+                }
+            ],
+            "usage": self._usage(request_text, completion_text),
+        }
+
+    def _text_completion(self, request: dict, request_text: str, script: Optional[dict]) -> dict:
+        # A list of prompts gets one choice per prompt, and the usage of the whole batch
+        prompts = request.get("prompt", "")
+        prompts = prompts if isinstance(prompts, list) else [request_text]
+        choices, usage = [], {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+        for index, prompt in enumerate(prompts):
+            prompt_script = script if len(prompts) == 1 else self._select_script(str(prompt))
+            content = self.config.default_content
+            if prompt_script is not None:
+                content = prompt_script.get("content", content)
+            choices.append(
+                {"index": index, "text": content, "finish_reason": "stop", "logprobs": None}
+            )
+            for key, value in self._usage(str(prompt), content).items():
+                usage[key] += value
+        return {
+            "id": f"cmpl-{uuid.uuid4().hex}",
+            "object": "text_completion",
+            "created": int(time.time()),
+            "model": request.get("model", self.config.served_models[0]),
+            "choices": choices,
+            "usage": usage,
+        }
+
+    def _list_models(self) -> dict:
+        return {
+            "object": "list",
+            "data": [
+                {"id": model, "object": "model", "created": 0, "owned_by": "bfcl-mock"}
+                for model in self.config.served_models
+            ],
+        }
+
+
+def _error_payload(message: str, error_type: str) -> dict:
+    return {"error": {"message": message, "type": error_type, "param": None, "code": error_type}}
+
+
+def _last_message_text(request: dict) -> str:
+    messages = request.get("messages") or []
+    if not messages:
+        return ""
+    content = messages[-1].get("content")
+    if isinstance(content, list):
+        return " ".join(
+            part.get("text", "") for part in content if isinstance(part, dict)
+        )
+    return str(content or "")
+
+
+def load_scripted_responses(script_path: Path) -> list[dict]:
+    with open(script_path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def get_args():
+    parser = argparse.ArgumentParser(description="OpenAI-compatible mock server for load-testing BFCL.")
+    parser.add_argument("--host", default="127.0.0.1", type=str)
+    parser.add_argument("--port", default=LOCAL_SERVER_PORT, type=int)
+    parser.add_argument("--served-models", default=["mock-model"], type=str, nargs="+")
+    parser.add_argument(
+        "--latency-distribution", default="constant", choices=LATENCY_DISTRIBUTIONS
+    )
+    parser.add_argument("--latency-mean-ms", default=0.0, type=float)
+    parser.add_argument("--latency-std-ms", default=0.0, type=float)
+    parser.add_argument("--prompt-tokens", default=None, type=int)
+    parser.add_argument("--completion-tokens", default=None, type=int)
+    parser.add_argument(
+        "--rate-limit-rate", default=0.0, type=float, help="Fraction of requests answered with 429."
+    )
+    parser.add_argument(
+        "--server-error-rate", default=0.0, type=float, help="Fraction of requests answered with 500."
+    )
+    parser.add_argument("--default-content", default="[]", type=str)
+    parser.add_argument("--script", default=None, type=Path, help="JSONL file of scripted responses.")
+    parser.add_argument("--seed", default=None, type=int)
+    return parser.parse_args()
+
+
+def main():
+    args = get_args()
+    config = MockServerConfig(
+        served_models=args.served_models,
+        latency_distribution=args.latency_distribution,
+        latency_mean_ms=args.latency_mean_ms,
+        latency_std_ms=args.latency_std_ms,
+        prompt_tokens=args.prompt_tokens,
+        completion_tokens=args.completion_tokens,
+        rate_limit_rate=args.rate_limit_rate,
+        server_error_rate=args.server_error_rate,
+        default_content=args.default_content,
+        scripted_responses=load_scripted_responses(args.script) if args.script else [],
+        seed=args.seed,
+    )
+    server = MockOpenAIServer(config, host=args.host, port=args.port)
+    print(f"Mock OpenAI server listening on http://{args.host}:{args.port}/v1")
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    print(f"Served {json.dumps(server.stats.as_dict())}")
+
+
+if __name__ == "__main__":
+    main()
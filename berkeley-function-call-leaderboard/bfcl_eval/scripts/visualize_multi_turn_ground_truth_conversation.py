@@ -1,5 +1,4 @@
 import json
-from copy import deepcopy
 
 from bfcl_eval._llm_response_generation import parse_test_category_argument
 from bfcl_eval.constants.eval_config import UTILS_PATH
@@ -12,6 +11,7 @@ from bfcl_eval.eval_checker.multi_turn_eval.multi_turn_utils import (
     STATELESS_CLASSES,
     execute_multi_turn_func_call,
 )
+from bfcl_eval.state_log import StateLogger
 
 test_categories_total = parse_test_category_argument(["multi_turn"])
 
@@ -39,23 +39,8 @@ for test_category in test_categories_total:
             is_evaL_run=False,
         )
 
-        state_log = []
-        for class_name, class_instance in involved_instances.items():
-            if class_name in STATELESS_CLASSES:
-                continue
-            class_instance = deepcopy(class_instance)  # Avoid modification in future turns
-            state_log.append(
-                {
-                    "role": "state_info",
-                    "class_name": class_name,
-                    "content": {
-                        key: value
-                        for key, value in vars(class_instance).items()
-                        if not key.startswith("_")
-                    },
-                }
-            )
-        all_inference_log.append(state_log)
+        state_logger = StateLogger("full", skipped_classes=STATELESS_CLASSES)
+        all_inference_log.append(state_logger.record(involved_instances))
 
         for single_turn_query, single_turn_ground_truth in zip(
             test_entry["question"], ground_truth_entry["ground_truth"]
@@ -111,25 +96,7 @@ for test_category in test_categories_total:
 
             all_inference_log.append(current_turn_inference_log)
 
-            state_log = []
-            for class_name, class_instance in involved_instances.items():
-                if class_name in STATELESS_CLASSES:
-                    continue
-                class_instance = deepcopy(
-                    class_instance
-                )  # Avoid modification in future turns
-                state_log.append(
-                    {
-                        "role": "state_info",
-                        "class_name": class_name,
-                        "content": {
-                            key: value
-                            for key, value in vars(class_instance).items()
-                            if not key.startswith("_")
-                        },
-                    }
-                )
-            all_inference_log.append(state_log)
+            all_inference_log.append(state_logger.record(involved_instances))
 
     write_list_of_dicts_to_file(
         f"{test_category}_conversation.json",
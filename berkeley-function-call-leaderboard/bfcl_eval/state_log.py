@@ -0,0 +1,166 @@
+import json
+from copy import deepcopy
+from typing import Any, Iterable
+
+from bfcl_eval.constants.eval_config import STATE_LOG_FORMATS
+from bfcl_eval.utils import make_json_serializable
+
+
+def snapshot_state(class_instance: Any) -> dict:
+    """
+    JSON view of the public attributes of a backend instance, exactly as it would appear in the result file.
+    Serializing right away is much cheaper than a `deepcopy` of the instance, and the snapshot does not share any mutable object with it.
+    """
+    content = {
+        key: value for key, value in vars(class_instance).items() if not key.startswith("_")
+    }
+    return json.loads(json.dumps(make_json_serializable(content), ensure_ascii=False))
+
+
+def _escape_pointer_token(token: Any) -> str:
+    # RFC 6901 escaping
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape_pointer_token(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def diff_states(old: Any, new: Any, path: str = "") -> list[dict]:
+    """
+    JSON Patch (RFC 6902) operations that turn `old` into `new`.
+
+    Dicts are compared key by key, and lists element by element when their length did not change. A list that only grew at the end gets `add` operations for the new elements; any other change of a list's length replaces the whole list.
+    """
+    if type(old) is not type(new):
+        return [{"op": "replace", "path": path, "value": new}]
+
+    if isinstance(old, dict):
+        operations = []
+        for key, old_value in old.items():
+            key_path = f"{path}/{_escape_pointer_token(key)}"
+            if key not in new:
+                operations.append({"op": "remove", "path": key_path})
+            else:
+                operations.extend(diff_states(old_value, new[key], key_path))
+        for key, new_value in new.items():
+            if key not in old:
+                operations.append(
+                    {"op": "add", "path": f"{path}/{_escape_pointer_token(key)}", "value": new_value}
+                )
+        return operations
+
+    if isinstance(old, list):
+        if len(old) == len(new):
+            operations = []
+            for index, (old_item, new_item) in enumerate(zip(old, new)):
+                operations.extend(diff_states(old_item, new_item, f"{path}/{index}"))
+            return operations
+        if len(new) > len(old) and new[: len(old)] == old:
+            return [{"op": "add", "path": f"{path}/-", "value": item} for item in new[len(old) :]]
+        return [{"op": "replace", "path": path, "value": new}]
+
+    if old != new:
+        return [{"op": "replace", "path": path, "value": new}]
+    return []
+
+
+def apply_patch(state: Any, operations: Iterable[dict]) -> Any:
+    """
+    Apply the operations produced by `diff_states` to a copy of `state`, and return it.
+    """
+    state = deepcopy(state)
+    for operation in operations:
+        if operation["path"] == "":
+            state = deepcopy(operation.get("value"))
+            continue
+
+        tokens = [_unescape_pointer_token(token) for token in operation["path"].split("/")[1:]]
+        parent = state
+        for token in tokens[:-1]:
+            parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+        last = tokens[-1]
+
+        if operation["op"] == "remove":
+            if isinstance(parent, list):
+                del parent[int(last)]
+            else:
+                del parent[last]
+        elif isinstance(parent, list):
+            value = deepcopy(operation["value"])
+            if last == "-":
+                parent.append(value)
+            elif operation["op"] == "add":
+                parent.insert(int(last), value)
+            else:
+                parent[int(last)] = value
+        else:
+            parent[last] = deepcopy(operation["value"])
+    return state
+
+
+class StateLogger:
+    """
+    Record the state of the backend instances of a multi-turn entry for the inference log: once at the start, and at the end of every turn.
+
+    In `full` format, every record is a `state_info` entry with the complete state of each instance. In `delta` format, only the first record is complete; the later ones are `state_diff` entries holding the JSON Patch from the previous record of the same instance (an empty patch if the instance did not change). `expand_state_log` turns a `delta` log back into the `full` one.
+    """
+
+    def __init__(self, log_format: str = "full", skipped_classes: Iterable[str] = ()) -> None:
+        if log_format not in STATE_LOG_FORMATS:
+            raise ValueError(
+                f"Unknown state log format: {log_format}. Expected one of {STATE_LOG_FORMATS}."
+            )
+        self.log_format = log_format
+        self.skipped_classes = set(skipped_classes)
+        self._previous_states: dict[str, Any] = {}
+
+    def record(self, involved_instances: dict) -> list[dict]:
+        state_log = []
+        for class_name, class_instance in involved_instances.items():
+            if class_name in self.skipped_classes:
+                continue
+            state = snapshot_state(class_instance)
+            if self.log_format == "delta" and class_name in self._previous_states:
+                state_log.append(
+                    {
+                        "role": "state_diff",
+                        "class_name": class_name,
+                        "patch": diff_states(self._previous_states[class_name], state),
+                    }
+                )
+            else:
+                state_log.append(
+                    {"role": "state_info", "class_name": class_name, "content": state}
+                )
+            self._previous_states[class_name] = state
+        return state_log
+
+
+def expand_state_log(inference_log: list) -> list:
+    """
+    Rebuild the `full` format of a multi-turn inference log that was recorded in `delta` format: every `state_diff` entry is replaced by the `state_info` entry it encodes. Logs in `full` format are returned unchanged.
+    """
+    states: dict[str, Any] = {}
+    expanded_log = []
+    for group in inference_log:
+        if not isinstance(group, list):
+            expanded_log.append(group)
+            continue
+        expanded_group = []
+        for entry in group:
+            role = entry.get("role") if isinstance(entry, dict) else None
+            if role == "state_info":
+                states[entry["class_name"]] = entry["content"]
+            elif role == "state_diff":
+                states[entry["class_name"]] = apply_patch(
+                    states[entry["class_name"]], entry["patch"]
+                )
+                entry = {
+                    "role": "state_info",
+                    "class_name": entry["class_name"],
+                    "content": states[entry["class_name"]],
+                }
+            expanded_group.append(entry)
+        expanded_log.append(expanded_group)
+    return expanded_log
@@ -1,6 +1,8 @@
+import gc
 import json
 import os
 import hashlib
+import pickle
 import re
 from copy import deepcopy
 from pathlib import Path
@@ -403,13 +405,40 @@ def load_dataset_entry(
     test_category: str,
     include_prereq: bool = True,
     include_language_specific_hint: bool = True,
+    use_cache: bool = True,
 ) -> list[dict]:
     """
     This function retrieves the dataset entry for a given test category.
     The input should not be a test category goup, but a specific test category.
     If `contain_prereq` is True, it will include the pre-requisite entries for the memory test categories.
     If `include_language_specific_hint` is True, it will include the language-specific hint for the function description (for Java, JavaScript, and Python).
+    If `use_cache` is True, the fully processed entries are served from the precompiled dataset cache (see `_load_dataset_cache`) when it is still valid.
     """
+    if not use_cache:
+        return _load_dataset_entry_from_source(
+            test_category, include_prereq, include_language_specific_hint
+        )
+
+    cache_path = _get_dataset_cache_path(
+        test_category, include_prereq, include_language_specific_hint
+    )
+    source_files = _get_dataset_source_files(test_category)
+
+    all_entries = _load_dataset_cache(cache_path, source_files)
+    if all_entries is None:
+        all_entries = _load_dataset_entry_from_source(
+            test_category, include_prereq, include_language_specific_hint
+        )
+        _write_dataset_cache(cache_path, source_files, all_entries)
+
+    return all_entries
+
+
+def _load_dataset_entry_from_source(
+    test_category: str,
+    include_prereq: bool = True,
+    include_language_specific_hint: bool = True,
+) -> list[dict]:
     if is_format_sensitivity(test_category):
         # Format sensitivity categories
         all_entries = load_format_sensitivity_test_cases()
@@ -442,6 +471,130 @@ def load_dataset_entry(
     return all_entries
 
 
+#### Precompiled dataset cache ####
+
+
+def _get_dataset_cache_path(
+    test_category: str, include_prereq: bool, include_language_specific_hint: bool
+) -> Path:
+    flags = f"prereq={int(include_prereq)}-hint={int(include_language_specific_hint)}"
+    return DATASET_CACHE_DIR / f"{VERSION_PREFIX}_{test_category}-{flags}.pkl"
+
+
+def _get_dataset_source_files(test_category: str) -> list[Path]:
+    """
+    All files whose content affects the processed entries of `test_category`: the dataset file itself, the auxiliary data it pulls in, and the code that processes it.
+    """
+    source_files = _get_dataset_data_files(test_category)
+
+    # The processing code and the constants it relies on (eg, the language-specific hints)
+    source_files.append(Path(__file__))
+    source_files += sorted((PACKAGE_ROOT / "constants").glob("*.py"))
+
+    return source_files
+
+
+def _get_dataset_data_files(test_category: str) -> list[Path]:
+    if is_format_sensitivity(test_category):
+        # Format sensitivity entries are assembled from the entries of other categories, listed in the id file
+        with open(FORMAT_SENSITIVITY_IDS_PATH) as f:
+            involved_categories = [
+                category for category, test_ids in json.load(f).items() if test_ids
+            ]
+        source_files = [FORMAT_SENSITIVITY_IDS_PATH]
+        for category in involved_categories:
+            for path in _get_dataset_data_files(category):
+                if path not in source_files:
+                    source_files.append(path)
+        return source_files
+
+    if is_web_search(test_category):
+        source_files = [PROMPT_PATH / f"{VERSION_PREFIX}_web_search.json"]
+    elif is_memory(test_category):
+        source_files = [PROMPT_PATH / f"{VERSION_PREFIX}_memory.json"]
+        source_files += [
+            MEMORY_PREREQ_CONVERSATION_PATH / f"memory_{scenario}.json"
+            for scenario in MEMORY_SCENARIO_NAME
+        ]
+    else:
+        source_files = [PROMPT_PATH / f"{VERSION_PREFIX}_{test_category}.json"]
+
+    if contain_multi_turn_interaction(test_category) or is_agentic(test_category):
+        source_files += sorted(MULTI_TURN_FUNC_DOC_PATH.glob("*.json"))
+
+    return source_files
+
+
+def _get_file_checksum(file_path: Path) -> str:
+    with open(file_path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _load_dataset_cache(cache_path: Path, source_files: list[Path]):
+    """
+    Return the cached entries, or None if there is no cache or it is stale.
+    The cache stores the size, mtime and checksum of every source file; a source whose size and mtime both match is trusted, otherwise its checksum decides.
+    """
+    if not cache_path.exists():
+        return None
+
+    try:
+        with open(cache_path, "rb") as f:
+            # The header is pickled separately, so that a stale cache is rejected without decoding the entries
+            header = pickle.load(f)
+            if header.get("version") != DATASET_CACHE_VERSION:
+                return None
+
+            cached_sources = header["sources"]
+            if set(cached_sources) != {str(path) for path in source_files}:
+                return None
+            for path in source_files:
+                size, mtime_ns, checksum = cached_sources[str(path)]
+                stat = path.stat()
+                if (stat.st_size, stat.st_mtime_ns) == (size, mtime_ns):
+                    continue
+                if stat.st_size != size or _get_file_checksum(path) != checksum:
+                    return None
+
+            # Unpickling creates a large number of small containers; pausing the cyclic GC avoids repeated full collections while doing so
+            gc_was_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                return pickle.load(f)
+            finally:
+                if gc_was_enabled:
+                    gc.enable()
+
+    except (OSError, EOFError, pickle.UnpicklingError, KeyError, ValueError, TypeError):
+        # Missing source file, or a cache written by an incompatible version; rebuild it
+        return None
+
+
+def _write_dataset_cache(cache_path: Path, source_files: list[Path], all_entries: list[dict]) -> None:
+    try:
+        header = {
+            "version": DATASET_CACHE_VERSION,
+            "sources": {
+                str(path): (
+                    path.stat().st_size,
+                    path.stat().st_mtime_ns,
+                    _get_file_checksum(path),
+                )
+                for path in source_files
+            },
+        }
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first, so that concurrent readers never see a partial cache
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(all_entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # The cache is only an optimization; a read-only project root should not break loading
+        pass
+
+
 def load_ground_truth_entry(test_category: str) -> list[dict]:
     """
     This function retrieves the ground truth entry for a given test category.
@@ -691,12 +844,27 @@ def add_language_specific_hint_to_function_doc(test_cases: list[dict]) -> list[d
     """
     This function adds language-specific hints to the function description and processes the parameters accordingly.
     """
+    # The multi-turn function docs are shared between entries, so they are processed once per (doc, category) into new objects instead of in place
+    processed_shared_docs = {}
     for entry in test_cases:
         assert "function" in entry
         test_category = extract_test_category_from_id(entry["id"])
-        entry["function"] = _func_doc_language_specific_pre_processing(
-            entry["function"], test_category
-        )
+        if is_multi_turn(entry["id"]) or is_agentic(entry["id"]):
+            processed_function = []
+            for func_doc in entry["function"]:
+                cache_key = (id(func_doc), test_category)
+                if cache_key not in processed_shared_docs:
+                    processed_shared_docs[cache_key] = (
+                        _func_doc_language_specific_pre_processing(
+                            [deepcopy(func_doc)], test_category
+                        )[0]
+                    )
+                processed_function.append(processed_shared_docs[cache_key])
+            entry["function"] = processed_function
+        else:
+            entry["function"] = _func_doc_language_specific_pre_processing(
+                entry["function"], test_category
+            )
 
     return test_cases
 
@@ -769,6 +937,30 @@ def process_agentic_test_case(test_cases: list[dict]) -> list[dict]:
     return test_cases
 
 
+_MULTI_TURN_FUNC_DOC_REGISTRY: dict[str, tuple[dict, ...]] = {}
+_MULTI_TURN_FUNC_DOC_REGISTRY_LOCK = Lock()
+
+
+def get_multi_turn_func_doc(func_collection: str) -> tuple[dict, ...]:
+    """
+    Return the function docs of a multi-turn backend class, parsed once per process.
+    The returned doc objects are shared by every entry that involves the class, so they must be treated as read-only; copy a doc before modifying it.
+    """
+    func_doc = _MULTI_TURN_FUNC_DOC_REGISTRY.get(func_collection)
+    if func_doc is None:
+        with _MULTI_TURN_FUNC_DOC_REGISTRY_LOCK:
+            func_doc = _MULTI_TURN_FUNC_DOC_REGISTRY.get(func_collection)
+            if func_doc is None:
+                func_doc = tuple(
+                    load_file(
+                        MULTI_TURN_FUNC_DOC_PATH
+                        / MULTI_TURN_FUNC_DOC_FILE_MAPPING[func_collection]
+                    )
+                )
+                _MULTI_TURN_FUNC_DOC_REGISTRY[func_collection] = func_doc
+    return func_doc
+
+
 def populate_test_cases_with_predefined_functions(test_cases: list[dict]) -> list[dict]:
     """
     Multi-turn and Agentic test cases don't have the function doc in the prompt. We need to add them here.
@@ -777,13 +969,10 @@ def populate_test_cases_with_predefined_functions(test_cases: list[dict]) -> lis
         if not is_multi_turn(entry["id"]) and not is_agentic(entry["id"]):
             continue
         involved_classes = entry["involved_classes"]
+        # The list is per entry, but the function docs in it are shared with every other entry (see `get_multi_turn_func_doc`)
         entry["function"] = []
         for func_collection in involved_classes:
-            # func_doc is a list of dict
-            func_doc = load_file(
-                MULTI_TURN_FUNC_DOC_PATH / MULTI_TURN_FUNC_DOC_FILE_MAPPING[func_collection]
-            )
-            entry["function"].extend(func_doc)
+            entry["function"].extend(get_multi_turn_func_doc(func_collection))
 
         # Handle Miss Func category; we need to remove the holdout function doc
         if "missed_function" in entry:
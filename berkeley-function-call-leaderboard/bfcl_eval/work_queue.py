@@ -0,0 +1,268 @@
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+from bfcl_eval._generation_scheduler import DependencyScheduler
+
+
+class WorkQueue:
+    """
+    Lease-based work queue shared by several `bfcl generate` processes (possibly on several hosts) that write to the same result directory.
+
+    The queue lives in a SQLite database under `LOCK_DIR`. Every worker registers the test cases it would generate (`INSERT OR IGNORE`, so the first worker to register an id decides its priority) together with their `depends_on` edges. Workers then claim one test case at a time in a single `BEGIN IMMEDIATE` transaction. Only test cases whose dependencies are all done (or were never registered, ie already generated in an earlier run) can be claimed. A test case is only marked as done once its result has been written.
+
+    A claim is a lease that expires after `lease_seconds`. A background thread renews the leases of the test cases this worker still has in flight, so long multi-turn entries keep their lease; if the worker dies, its leases stop being renewed and the test cases are handed to the next worker that asks for work.
+
+    The default rollback journal is used instead of WAL, as WAL does not work across hosts on a shared (eg, NFS) file system.
+    """
+
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        model_name: str,
+        lease_seconds: float = 120.0,
+    ) -> None:
+        self.db_path = Path(db_path)
+        self.model_name = model_name
+        self.lease_seconds = lease_seconds
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.claimed = 0
+        self.taken_over = 0
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Transactions are managed explicitly; the lock serializes the scheduler loop and the heartbeat thread
+        self._conn = sqlite3.connect(
+            str(self.db_path), check_same_thread=False, timeout=60, isolation_level=None
+        )
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS tasks (
+                model TEXT NOT NULL,
+                id TEXT NOT NULL,
+                priority INTEGER NOT NULL,
+                state TEXT NOT NULL DEFAULT 'pending',
+                owner TEXT,
+                lease_expires REAL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (model, id)
+            );
+            CREATE TABLE IF NOT EXISTS dependencies (
+                model TEXT NOT NULL,
+                id TEXT NOT NULL,
+                depends_on TEXT NOT NULL,
+                PRIMARY KEY (model, id, depends_on)
+            );
+            CREATE INDEX IF NOT EXISTS tasks_claim ON tasks (model, state, priority);
+            CREATE TEMP TABLE IF NOT EXISTS claimable (id TEXT PRIMARY KEY);
+            """
+        )
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._heartbeat_thread = threading.Thread(target=self._run_heartbeat, daemon=True)
+        self._heartbeat_thread.start()
+
+    def register(self, test_cases: list[dict], reset_done: bool = False) -> None:
+        """
+        Add the test cases to the queue, in priority order. Test cases that are already in the queue keep their state, unless `reset_done` is set: test cases marked as done are then pending again (eg, a later run with the same queue name, for the test cases whose result is missing from the result files).
+        Only the registered test cases are claimed by this worker.
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO tasks (model, id, priority) VALUES (?, ?, ?)",
+                    [
+                        (self.model_name, test_case["id"], priority)
+                        for priority, test_case in enumerate(test_cases)
+                    ],
+                )
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO dependencies (model, id, depends_on) VALUES (?, ?, ?)",
+                    [
+                        (self.model_name, test_case["id"], dependency_id)
+                        for test_case in test_cases
+                        for dependency_id in test_case.get("depends_on", [])
+                    ],
+                )
+                # Workers are expected to run with the same arguments, but never claim ids that this one cannot generate
+                self._conn.execute("DELETE FROM claimable")
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO claimable (id) VALUES (?)",
+                    [(test_case["id"],) for test_case in test_cases],
+                )
+                if reset_done:
+                    self._conn.execute(
+                        """
+                        UPDATE tasks SET state = 'pending', owner = NULL, lease_expires = NULL
+                        WHERE model = ? AND state = 'done' AND id IN (SELECT id FROM claimable)
+                        """,
+                        (self.model_name,),
+                    )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def claim(self) -> Optional[str]:
+        """
+        Lease the highest-priority ready test case among the registered ones, or return None if there is none right now.
+        """
+        with self._lock:
+            now = time.time()
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                claimed = self._conn.execute(
+                    """
+                    SELECT t.id, t.state FROM tasks t
+                    WHERE t.model = ?
+                    AND t.id IN (SELECT id FROM claimable)
+                    AND (t.state = 'pending' OR (t.state = 'leased' AND t.lease_expires < ?))
+                    AND NOT EXISTS (
+                        SELECT 1 FROM dependencies d
+                        JOIN tasks p ON p.model = d.model AND p.id = d.depends_on
+                        WHERE d.model = t.model AND d.id = t.id AND p.state != 'done'
+                    )
+                    ORDER BY t.priority
+                    LIMIT 1
+                    """,
+                    (self.model_name, now),
+                ).fetchone()
+                if claimed is not None:
+                    self._conn.execute(
+                        """
+                        UPDATE tasks SET state = 'leased', owner = ?, lease_expires = ?, attempts = attempts + 1
+                        WHERE model = ? AND id = ?
+                        """,
+                        (self.worker_id, now + self.lease_seconds, self.model_name, claimed[0]),
+                    )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        if claimed is None:
+            return None
+        self.claimed += 1
+        if claimed[1] == "leased":
+            # The previous owner stopped renewing its lease
+            self.taken_over += 1
+        return claimed[0]
+
+    def complete(self, test_case_ids: Iterable[str]) -> None:
+        """
+        Mark the test cases as done. Only call this once their results are written, as dependents claimed by other workers read them from the result files.
+        """
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE tasks SET state = 'done', lease_expires = NULL WHERE model = ? AND id = ?",
+                [(self.model_name, test_case_id) for test_case_id in test_case_ids],
+            )
+
+    def count_unfinished(self) -> int:
+        """
+        Count the registered test cases, and their transitive dependencies, that are not done yet. Test cases registered only by other workers are left out, as this worker would never claim them.
+        """
+        with self._lock:
+            return self._conn.execute(
+                """
+                WITH RECURSIVE needed (id) AS (
+                    SELECT id FROM claimable
+                    UNION
+                    SELECT d.depends_on FROM dependencies d
+                    JOIN needed n ON d.model = ? AND d.id = n.id
+                )
+                SELECT COUNT(*) FROM tasks
+                WHERE model = ? AND state != 'done' AND id IN (SELECT id FROM needed)
+                """,
+                (self.model_name, self.model_name),
+            ).fetchone()[0]
+
+    def _run_heartbeat(self) -> None:
+        while not self._stop_event.wait(self.lease_seconds / 3):
+            try:
+                with self._lock:
+                    self._conn.execute(
+                        "UPDATE tasks SET lease_expires = ? WHERE owner = ? AND state = 'leased'",
+                        (time.time() + self.lease_seconds, self.worker_id),
+                    )
+            except sqlite3.Error:
+                # Most likely a busy database; the next heartbeat comes well before the lease expires
+                continue
+
+    def close(self) -> None:
+        self._stop_event.set()
+        self._heartbeat_thread.join()
+        with self._lock:
+            self._conn.close()
+
+
+class WorkQueueScheduler(DependencyScheduler):
+    """
+    Scheduler that hands out the test cases claimed from a shared `WorkQueue`, instead of deciding locally what to run.
+
+    The priority order of the queue is taken from `order_by` (eg, a `CriticalPathScheduler`), so the policies still apply across workers. Since other workers may be holding the prerequisites of the remaining test cases, the generation loops keep polling while `awaiting_remote_work` is True, even when nothing is in flight locally.
+    """
+
+    def __init__(
+        self,
+        test_cases: list[dict],
+        work_queue: WorkQueue,
+        order_by: Optional[DependencyScheduler] = None,
+        poll_interval: float = 2.0,
+        reset_done: bool = False,
+    ) -> None:
+        super().__init__(test_cases)
+        self.work_queue = work_queue
+        self.poll_interval = poll_interval
+        if order_by is not None:
+            test_cases = sorted(
+                test_cases, key=lambda test_case: order_by._priority(test_case["id"])
+            )
+        self.work_queue.register(test_cases, reset_done=reset_done)
+
+        self.generated = 0
+        self._claimed_id = None
+        self._next_poll = 0.0
+        self._unfinished = True
+        self._next_unfinished_check = 0.0
+
+    def has_ready(self) -> bool:
+        if self._claimed_id is None and time.monotonic() >= self._next_poll:
+            self._claimed_id = self.work_queue.claim()
+            if self._claimed_id is None:
+                self._next_poll = time.monotonic() + self.poll_interval
+        return self._claimed_id is not None
+
+    def pop_ready(self) -> dict:
+        test_case_id, self._claimed_id = self._claimed_id, None
+        return self.id_to_test_case[test_case_id]
+
+    def mark_completed(self, test_case_id: str) -> None:
+        # The queue is only updated by `mark_written`, once the result is on disk
+        self.completed.add(test_case_id)
+        self.generated += 1
+
+    def mark_written(self, test_case_ids: list[str]) -> None:
+        self.work_queue.complete(test_case_ids)
+        # A dependent of these test cases might be claimable now
+        self._next_poll = 0.0
+
+    def awaiting_remote_work(self) -> bool:
+        if time.monotonic() >= self._next_unfinished_check:
+            self._unfinished = self.work_queue.count_unfinished() > 0
+            self._next_unfinished_check = time.monotonic() + self.poll_interval
+        return self._unfinished
+
+    def summary(self) -> Optional[str]:
+        return (
+            f"Work queue: worker {self.work_queue.worker_id} generated {self.generated} test cases "
+            f"({self.work_queue.taken_over} taken over from expired leases)."
+        )
+
+    def close(self) -> None:
+        self.work_queue.close()
@@ -0,0 +1,35 @@
+import asyncio
+
+from bfcl_eval.model_handler.async_client_pool import AsyncClientPool
+
+
+class FakeClient:
+    def __init__(self, http_client) -> None:
+        self.http_client = http_client
+        self.closed = False
+
+    async def close(self) -> None:
+        await self.http_client.aclose()
+        self.closed = True
+
+
+def test_requests_are_spread_over_clients_by_concurrency():
+    async def main():
+        pool = AsyncClientPool(FakeClient, connections_per_client=32)
+        assert pool.get() is pool.get()
+        assert pool.num_clients == 1
+
+        pool.max_concurrency = 100
+        clients = [pool.get() for _ in range(8)]
+        assert pool.num_clients == 4
+        assert clients[:4] == clients[4:]
+        assert len({id(client) for client in clients}) == 4
+        # All clients share one SSL context
+        assert len({id(client.http_client._transport._pool._ssl_context) for client in clients}) == 1
+
+        await pool.aclose()
+        assert all(client.closed for client in clients)
+        assert pool.num_clients == 0
+        assert pool.get() not in clients
+
+    asyncio.run(main())
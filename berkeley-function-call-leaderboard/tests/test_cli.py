@@ -0,0 +1,44 @@
+from unittest import mock
+
+import pytest
+from typer.testing import CliRunner
+
+from bfcl_eval.__main__ import cli
+
+
+def run_generate(*options: str):
+    with mock.patch("bfcl_eval._llm_response_generation.main") as generation_main:
+        result = CliRunner().invoke(cli, ["generate", *options])
+    args = generation_main.call_args[0][0] if generation_main.called else None
+    return result, args
+
+
+@pytest.mark.parametrize(
+    "option, value",
+    [
+        ("--execution-mode", "async"),
+        ("--scheduling-policy", "critical-path"),
+        ("--state-log-format", "delta"),
+        ("--cache-mode", "readwrite"),
+    ],
+)
+def test_choice_options_are_passed_as_strings(option, value):
+    result, args = run_generate(option, value)
+    assert result.exit_code == 0
+    assert getattr(args, option[2:].replace("-", "_")) == value
+    assert type(getattr(args, option[2:].replace("-", "_"))) is str
+
+
+@pytest.mark.parametrize(
+    "option, value",
+    [
+        ("--execution-mode", "asyncio"),
+        ("--scheduling-policy", "critical_path"),
+        ("--state-log-format", "delt"),
+        ("--cache-mode", "rw"),
+    ],
+)
+def test_unknown_choices_are_rejected(option, value):
+    result, args = run_generate(option, value)
+    assert result.exit_code != 0
+    assert args is None
@@ -0,0 +1,114 @@
+import asyncio
+
+import pytest
+
+from bfcl_eval.model_handler.endpoint_pool import EndpointPool
+
+
+class ServerError(Exception):
+    status_code = 503
+
+
+class ClientError(Exception):
+    status_code = 400
+
+
+def make_pool(replica_count=2):
+    return EndpointPool(
+        [f"http://replica-{i}/v1" for i in range(replica_count)],
+        api_key="EMPTY",
+        max_consecutive_failures=2,
+    )
+
+
+def assert_no_outstanding_load(pool):
+    for replica in pool.replicas:
+        assert replica.outstanding_requests == 0
+        assert replica.outstanding_tokens == 0
+
+
+def test_acquire_picks_the_replica_with_the_fewest_outstanding_tokens():
+    pool = make_pool()
+    first = pool.acquire(100)
+    second = pool.acquire(10)
+    assert second is not first
+    # The second replica has less outstanding work, even though both have one request
+    assert pool.acquire(10) is second
+
+
+def test_call_retries_server_failures_on_another_replica():
+    pool = make_pool()
+    tried = []
+
+    def request(replica):
+        tried.append(replica)
+        if len(tried) == 1:
+            raise ServerError()
+        return "ok"
+
+    assert pool.call(request, token_count=5) == "ok"
+    assert tried[0] is not tried[1]
+    assert tried[0].failed_requests == 1
+    assert tried[1].completed_requests == 1
+    assert_no_outstanding_load(pool)
+
+
+def test_call_raises_client_errors_without_retrying():
+    pool = make_pool()
+    tried = []
+
+    def request(replica):
+        tried.append(replica)
+        raise ClientError()
+
+    with pytest.raises(ClientError):
+        pool.call(request, token_count=5)
+    assert len(tried) == 1
+    assert tried[0].failed_requests == 0
+    assert_no_outstanding_load(pool)
+
+
+def test_replica_is_ejected_after_consecutive_failures():
+    pool = make_pool()
+    replica = pool.replicas[0]
+    for _ in range(2):
+        acquired = pool.acquire(1, exclude=(pool.replicas[1],))
+        assert acquired is replica
+        pool.release(replica, 1, start_time=0.0, error=ServerError())
+    assert replica.ejections == 1
+    # Ejected replicas are skipped while a healthy one is available
+    assert pool.acquire(1) is pool.replicas[1]
+
+
+def test_call_async_releases_the_replica_when_cancelled():
+    pool = make_pool()
+    started = asyncio.Event()
+
+    async def request(replica):
+        started.set()
+        await asyncio.sleep(60)
+
+    async def main():
+        task = asyncio.create_task(pool.call_async(request, token_count=50))
+        await started.wait()
+        assert sum(replica.outstanding_requests for replica in pool.replicas) == 1
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+    assert_no_outstanding_load(pool)
+    # A cancellation says nothing about the health of the replica
+    assert all(replica.failed_requests == 0 for replica in pool.replicas)
+    assert all(replica.consecutive_failures == 0 for replica in pool.replicas)
+
+
+def test_call_releases_the_replica_on_keyboard_interrupt():
+    pool = make_pool()
+
+    def request(replica):
+        raise KeyboardInterrupt()
+
+    with pytest.raises(KeyboardInterrupt):
+        pool.call(request, token_count=50)
+    assert_no_outstanding_load(pool)
@@ -0,0 +1,38 @@
+from collections import Counter
+
+from bfcl_eval._generation_scheduler import PrefixAffinityScheduler
+
+
+def test_prefix_affinity_drains_a_group_before_switching():
+    test_cases = [
+        {"id": "simple_python_0", "prefix": "a"},
+        {"id": "simple_python_1", "prefix": "b"},
+        {"id": "simple_python_2", "prefix": "a"},
+        {"id": "simple_python_3", "prefix": "b", "depends_on": ["simple_python_0"]},
+        {"id": "simple_python_4", "prefix": "c"},
+    ]
+    prefix_key_calls = Counter()
+
+    def prefix_key_fn(test_case):
+        prefix_key_calls[test_case["id"]] += 1
+        return test_case["prefix"]
+
+    scheduler = PrefixAffinityScheduler(test_cases, prefix_key_fn)
+    order = []
+    while scheduler.has_ready():
+        test_case_id = scheduler.pop_ready()["id"]
+        order.append(test_case_id)
+        scheduler.mark_completed(test_case_id)
+
+    assert order == [
+        "simple_python_0",
+        "simple_python_2",
+        "simple_python_1",
+        "simple_python_3",
+        "simple_python_4",
+    ]
+    assert scheduler.group_switches == 3
+    assert scheduler.prefix_keys == {"a", "b", "c"}
+    # The prefix key of every test case is computed exactly once
+    assert set(prefix_key_calls.values()) == {1}
+    assert len(prefix_key_calls) == len(test_cases)
@@ -0,0 +1,108 @@
+from unittest import mock
+
+import pytest
+
+from bfcl_eval.eval_checker.multi_turn_eval import multi_turn_utils
+from bfcl_eval.eval_checker.multi_turn_eval.multi_turn_utils import (
+    backend_session,
+    execute_multi_turn_func_call,
+)
+from bfcl_eval.state_log import snapshot_state
+
+TEST_ENTRY_ID = "multi_turn_base_0"
+INVOLVED_CLASSES = ["GorillaFileSystem", "MathAPI"]
+INITIAL_CONFIG = {
+    "GorillaFileSystem": {
+        "root": {
+            "workspace": {
+                "type": "directory",
+                "contents": {
+                    "readme.txt": {"type": "file", "content": "hello\nworld"},
+                    "archive": {"type": "directory", "contents": {}},
+                },
+            }
+        }
+    },
+    "MathAPI": {},
+}
+
+DISPATCHED_CALLS = [
+    "ls()",
+    "ls(a=True)",
+    "mkdir(dir_name='docs')",
+    "cd('docs')",
+    "touch(file_name='notes.txt')",
+    "echo(content='first line\\nsecond line', file_name='notes.txt')",
+    "wc(file_name='notes.txt', mode='l')",
+    "cd(folder='..')",
+    "find(path='.', name='notes')",
+    "cd(folder='missing')",
+    "mean(numbers=[1, 2, 3.5])",
+    "add(1, b=-2.5)",
+    "add(a=mean(numbers=[1, 2]), b=3)",
+]
+
+# Anything but a plain method call with literal arguments is left to `eval`
+REJECTED_CALLS = [
+    "cd(folder='arch' + 'ive')",
+    "cd(**{'folder': 'archive'})",
+    "ls(",
+    "pwd().upper()",
+    "unknown_function(x=1)",
+    "ls(a=unknown_function())",
+    "kill()",
+]
+
+
+def execute(func_calls: list[str], model_name: str, force_eval: bool = False):
+    eval_func_call = mock.Mock(wraps=multi_turn_utils._eval_func_call)
+    with backend_session(model_name, TEST_ENTRY_ID), mock.patch.object(
+        multi_turn_utils, "_eval_func_call", eval_func_call
+    ), mock.patch.object(
+        multi_turn_utils,
+        "_compile_func_call",
+        (lambda func_call: None) if force_eval else multi_turn_utils._compile_func_call,
+    ):
+        results, involved_instances = execute_multi_turn_func_call(
+            func_calls, INITIAL_CONFIG, INVOLVED_CLASSES, model_name, TEST_ENTRY_ID
+        )
+        states = {
+            class_name: snapshot_state(instance)
+            for class_name, instance in involved_instances.items()
+        }
+    return results, states, eval_func_call.call_count
+
+
+def test_direct_dispatch_matches_eval():
+    results, states, eval_count = execute(DISPATCHED_CALLS, "direct_model")
+    eval_results, eval_states, _ = execute(DISPATCHED_CALLS, "eval_model", force_eval=True)
+
+    assert eval_count == 0
+    assert results == eval_results
+    assert states == eval_states
+
+
+@pytest.mark.parametrize("func_call", REJECTED_CALLS)
+def test_calls_rejected_by_the_parser_fall_back_to_eval(func_call):
+    results, states, eval_count = execute([func_call], "direct_model")
+    eval_results, eval_states, _ = execute([func_call], "eval_model", force_eval=True)
+
+    assert eval_count == 1
+    assert results == eval_results
+    assert states == eval_states
+
+
+def test_parsed_calls_are_cached():
+    func_call = "mean(numbers=[4, 5, 6])"
+    multi_turn_utils._compile_func_call.cache_clear()
+    first_results, _, _ = execute([func_call], "direct_model")
+    second_results, _, eval_count = execute([func_call, func_call], "direct_model")
+
+    cache_info = multi_turn_utils._compile_func_call.cache_info()
+    assert (cache_info.misses, cache_info.hits) == (1, 2)
+    assert eval_count == 0
+    assert second_results == first_results * 2
+    # Each call gets its own copy of the cached arguments
+    assert multi_turn_utils._compile_func_call(func_call)[2] == (
+        ("numbers", ("literal", [4, 5, 6])),
+    )
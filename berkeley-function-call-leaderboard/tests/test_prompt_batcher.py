@@ -0,0 +1,47 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from bfcl_eval.model_handler.prompt_batcher import PromptBatcher
+
+
+class FakeCompletions:
+    """
+    Answers every prompt with its own text, and fails every multi-prompt call once the batcher starts shutting down.
+    """
+
+    def __init__(self) -> None:
+        self.batcher = None
+        self.calls = []
+
+    def create(self, request_kwargs: dict, prompt_token_count: int):
+        prompt = request_kwargs["prompt"]
+        self.calls.append(prompt)
+        if isinstance(prompt, list):
+            deadline = time.monotonic() + 5
+            while not self.batcher._pool._shutdown and time.monotonic() < deadline:
+                time.sleep(0.01)
+            raise ValueError("The batched call failed")
+        if prompt == "bad":
+            raise ValueError("Prompt too long")
+        return SimpleNamespace(choices=[SimpleNamespace(index=0, text=prompt)])
+
+
+def test_failed_batch_is_retried_one_by_one_while_closing():
+    completions = FakeCompletions()
+    batcher = PromptBatcher(
+        completions.create, count_tokens=len, max_batch_size=8, max_batch_delay_ms=10_000
+    ).start()
+    completions.batcher = batcher
+    good_future = batcher.submit({"model": "m", "prompt": "good"}, 1)
+    bad_future = batcher.submit({"model": "m", "prompt": "bad"}, 1)
+
+    # Sends the batch, which only fails after the pool has started shutting down
+    batcher.close()
+
+    assert completions.calls == [["good", "bad"], "good", "bad"]
+    api_response, _ = good_future.result(timeout=0)
+    assert api_response.choices[0].text == "good"
+    with pytest.raises(ValueError):
+        bad_future.result(timeout=0)
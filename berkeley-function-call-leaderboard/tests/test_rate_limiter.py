@@ -0,0 +1,75 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from bfcl_eval.model_handler.base_handler import BaseHandler
+from bfcl_eval.model_handler.rate_limiter import RateLimiter
+
+
+def test_requests_queue_up_behind_the_budget():
+    # 60 RPM at full utilization is one request per second, with a one-request burst
+    limiter = RateLimiter("test", requests_per_minute=60, utilization=1.0, burst_seconds=1)
+    assert limiter._reserve(0) == 0
+    assert limiter._reserve(0) == pytest.approx(1, abs=0.05)
+    assert limiter._reserve(0) == pytest.approx(2, abs=0.05)
+
+
+def test_cancel_gives_the_reservation_back():
+    limiter = RateLimiter("test", tokens_per_minute=6000, utilization=1.0, burst_seconds=1)
+    limiter._reserve(300)
+    limiter.cancel(300)
+    assert limiter.requests == 0
+    assert limiter.tokens == 0
+    assert limiter._reserve(100) == 0
+
+
+def test_reconcile_replaces_the_estimate_with_the_actual_usage():
+    limiter = RateLimiter("test", tokens_per_minute=6000, utilization=1.0, burst_seconds=1)
+    limiter._reserve(100)
+    limiter.reconcile(100, 40)
+    assert limiter.tokens == 40
+    # Without a reported usage, the estimate stands
+    limiter.reconcile(100, None)
+    assert limiter.tokens == 40
+
+
+def test_cancelled_attempt_waiting_for_quota_is_not_charged():
+    limiter = RateLimiter("test", requests_per_minute=60, utilization=1.0, burst_seconds=1)
+    handler = SimpleNamespace(rate_limiter=limiter)
+    sent = []
+
+    async def query(inference_data):
+        sent.append(inference_data)
+        return SimpleNamespace(usage=None), 0.0
+
+    rate_limited_query = BaseHandler._rate_limited_async(handler, query)
+
+    async def main():
+        await rate_limited_query({"message": []})
+        # The second request has to wait about a second for quota
+        task = asyncio.create_task(rate_limited_query({"message": []}))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+    assert len(sent) == 1
+    assert limiter.requests == 1
+    assert limiter._reserve(0) == pytest.approx(0.95, abs=0.1)
+
+
+def test_failed_attempt_is_reconciled():
+    limiter = RateLimiter("test", tokens_per_minute=60000, utilization=1.0)
+    handler = SimpleNamespace(rate_limiter=limiter)
+    reconciled = []
+    limiter.reconcile = lambda estimated, actual: reconciled.append((estimated, actual))
+
+    def query(inference_data):
+        raise ConnectionError()
+
+    with pytest.raises(ConnectionError):
+        BaseHandler._rate_limited(handler, query)({"message": [{"role": "user", "content": "hi"}]})
+    assert len(reconciled) == 1
+    assert reconciled[0][1] is None
@@ -0,0 +1,167 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from bfcl_eval.model_handler.request_hedging import (
+    DeadlineExceededError,
+    HedgingPolicy,
+    track_query_stats,
+)
+
+TEST_ENTRY_ID = "simple_python_0"
+
+
+def warmed_up_policy(**kwargs) -> HedgingPolicy:
+    policy = HedgingPolicy(hedge=True, max_hedge_rate=1.0, min_samples=5, **kwargs)
+    for _ in range(5):
+        policy.record_latency("simple_python", 0.05)
+    return policy
+
+
+def test_no_hedge_before_min_samples():
+    policy = HedgingPolicy(hedge=True, min_samples=5)
+    assert policy.hedge_delay("simple_python") is None
+    for _ in range(5):
+        policy.record_latency("simple_python", 0.1)
+    assert policy.hedge_delay("simple_python") == pytest.approx(0.1)
+
+
+def test_call_passes_through_without_deadline_or_hedge():
+    policy = HedgingPolicy(hedge=True)
+    inference_data = {"message": []}
+
+    def query(data):
+        assert data is inference_data
+        return "response", 0.1
+
+    with track_query_stats(TEST_ENTRY_ID) as stats:
+        assert policy.call(query, inference_data) == ("response", 0.1)
+    assert stats.to_metadata() == {}
+
+
+def test_call_raises_when_the_deadline_is_exceeded():
+    policy = HedgingPolicy(deadline_seconds=0.1)
+
+    def query(data):
+        time.sleep(2)
+        return "too late", 2
+
+    start_time = time.monotonic()
+    with track_query_stats(TEST_ENTRY_ID) as stats:
+        with pytest.raises(DeadlineExceededError):
+            policy.call(query, {"message": []})
+    assert time.monotonic() - start_time < 1
+    assert stats.to_metadata() == {"timed_out_requests": 1}
+    assert policy.timeouts == 1
+
+
+def test_call_runs_a_single_attempt_on_the_original_payload():
+    policy = HedgingPolicy(deadline_seconds=5)
+    inference_data = {"message": []}
+    attempt_threads = set()
+
+    def query(data):
+        assert data is inference_data
+        attempt_threads.add(threading.get_ident())
+        return "response", 0.01
+
+    for _ in range(10):
+        assert policy.call(query, inference_data) == ("response", 0.01)
+    # The attempt thread is reused from one request to the next
+    assert len(attempt_threads) == 1
+    assert threading.get_ident() not in attempt_threads
+
+
+def test_slow_request_is_hedged_and_the_hedge_wins():
+    policy = warmed_up_policy()
+    attempt_count = 0
+    lock = threading.Lock()
+    attempt_data = []
+    release_first_attempt = threading.Event()
+
+    def query(data):
+        nonlocal attempt_count
+        with lock:
+            attempt_count += 1
+            attempt = attempt_count
+        attempt_data.append(data)
+        # Handlers modify the message payload in place while building the request
+        data["message"][-1]["cache_control"] = {"type": "ephemeral"}
+        data["inference_input_log"] = attempt
+        if attempt == 1:
+            release_first_attempt.wait(5)
+        return f"response {attempt}", 0.01
+
+    inference_data = {"message": [{"role": "user"}]}
+    with track_query_stats(TEST_ENTRY_ID) as stats:
+        api_response, _ = policy.call(query, inference_data)
+    release_first_attempt.set()
+
+    assert api_response == "response 2"
+    assert stats.to_metadata() == {"hedged_requests": 1, "hedge_wins": 1}
+    # Only the hedge works on a copy, and its fields are copied back
+    assert attempt_data[0] is inference_data and attempt_data[1] is not inference_data
+    assert inference_data["inference_input_log"] == 2
+    assert inference_data["message"] is attempt_data[1]["message"]
+
+
+def test_hedges_are_capped_by_max_hedge_rate():
+    policy = warmed_up_policy()
+    policy.max_hedge_rate = 0.0
+
+    def query(data):
+        time.sleep(0.2)
+        return "response", 0.2
+
+    with track_query_stats(TEST_ENTRY_ID) as stats:
+        assert policy.call(query, {"message": []}) == ("response", 0.2)
+    assert policy.hedges == 0
+    assert stats.to_metadata() == {}
+
+
+def test_call_async_cancels_the_losing_attempt():
+    policy = warmed_up_policy()
+    cancelled = []
+    attempt_count = 0
+    attempt_data = []
+
+    async def query(data):
+        nonlocal attempt_count
+        attempt_count += 1
+        attempt = attempt_count
+        attempt_data.append(data)
+        data["inference_input_log"] = attempt
+        try:
+            await asyncio.sleep(1 if attempt == 1 else 0)
+        except asyncio.CancelledError:
+            cancelled.append(attempt)
+            raise
+        data["message"].append(attempt)
+        return f"response {attempt}", 0.01
+
+    inference_data = {"message": []}
+
+    async def main():
+        with track_query_stats(TEST_ENTRY_ID):
+            result = await policy.call_async(query, inference_data)
+        # Let the cancellation of the loser run
+        await asyncio.sleep(0)
+        return result
+
+    assert asyncio.run(main()) == ("response 2", pytest.approx(0.05, abs=0.1))
+    assert cancelled == [1]
+    assert attempt_data[0] is inference_data and attempt_data[1] is not inference_data
+    assert inference_data == {"message": [2], "inference_input_log": 2}
+    assert policy.hedge_wins == 1
+
+
+def test_call_async_deadline():
+    policy = HedgingPolicy(deadline_seconds=0.1)
+
+    async def query(data):
+        await asyncio.sleep(2)
+
+    with pytest.raises(DeadlineExceededError):
+        asyncio.run(policy.call_async(query, {"message": []}))
@@ -0,0 +1,145 @@
+import threading
+import time
+
+import pytest
+
+from bfcl_eval.constants.category_mapping import VERSION_PREFIX
+from bfcl_eval.result_store import (
+    BatchedResultWriter,
+    LatencyHistory,
+    ResultJournal,
+    serialize_result_entry,
+)
+from bfcl_eval.utils import sort_key
+
+
+class RecordingHandler:
+    def __init__(self, fail_on_id=None) -> None:
+        self.fail_on_id = fail_on_id
+        self.batches = []
+
+    def write(self, result, result_dir, update_mode=False, file_handles=None):
+        if any(entry["id"] == self.fail_on_id for entry in result):
+            raise OSError("No space left on device")
+        self.batches.append([entry["id"] for entry in result])
+
+
+def test_results_are_written_in_batches(tmp_path):
+    handler = RecordingHandler()
+    written = []
+    writer = BatchedResultWriter(
+        handler,
+        result_dir=tmp_path,
+        max_batch_size=4,
+        max_batch_delay_ms=1000,
+        on_written=lambda batch: written.extend(entry["id"] for entry in batch),
+    ).start()
+    for i in range(10):
+        writer.put({"id": f"simple_python_{i}"})
+    writer.close()
+
+    assert [len(batch) for batch in handler.batches] == [4, 4, 2]
+    assert written == [f"simple_python_{i}" for i in range(10)]
+
+
+def test_put_raises_after_a_write_error(tmp_path):
+    writer = BatchedResultWriter(
+        RecordingHandler(fail_on_id="simple_python_0"), result_dir=tmp_path, max_batch_delay_ms=0
+    ).start()
+    writer.put({"id": "simple_python_0"})
+
+    with pytest.raises(OSError):
+        # The writer thread fails in the background; one of the next puts surfaces the error
+        for i in range(1, 1000):
+            writer.put({"id": f"simple_python_{i}"})
+            time.sleep(0.001)
+    # Already surfaced by `put`, so closing does not raise it a second time
+    writer.close()
+
+
+def test_close_raises_a_write_error_not_seen_by_put(tmp_path):
+    written = []
+    writer = BatchedResultWriter(
+        RecordingHandler(fail_on_id="simple_python_1"),
+        result_dir=tmp_path,
+        max_batch_size=1,
+        on_written=lambda batch: written.extend(entry["id"] for entry in batch),
+    ).start()
+    writer.put({"id": "simple_python_0"})
+    writer.put({"id": "simple_python_1"})
+
+    with pytest.raises(OSError):
+        writer.close()
+    # The failed batch is never reported as written
+    assert written == ["simple_python_0"]
+
+
+def test_producers_blocked_on_a_full_queue_are_released_after_a_write_error(tmp_path):
+    writer = BatchedResultWriter(
+        RecordingHandler(fail_on_id="simple_python_0"),
+        result_dir=tmp_path,
+        max_batch_size=1,
+        max_queue_size=1,
+    ).start()
+    errors = []
+
+    def produce():
+        try:
+            for i in range(100):
+                writer.put({"id": f"simple_python_{i}"})
+        except OSError as e:
+            errors.append(e)
+
+    producer = threading.Thread(target=produce)
+    producer.start()
+    producer.join(5)
+    assert not producer.is_alive()
+    assert len(errors) == 1
+    writer.close()
+
+
+def test_compacted_journal_matches_the_normal_write_path(tmp_path):
+    entries = [
+        {"id": "simple_python_1", "result": "Café ☕"},
+        {"id": "simple_python_0", "result": {"value": float("nan"), "set": {1}}},
+    ]
+    appended_path = tmp_path / "appended_result.json"
+    with open(appended_path, "w", encoding="utf-8") as f:
+        f.write("".join(serialize_result_entry(entry) for entry in sorted(entries, key=sort_key)))
+
+    journaled_path = tmp_path / "journaled_result.json"
+    journal = ResultJournal(journaled_path)
+    journal.append(entries[:1])
+    journal.append_serialized([(entries[1]["id"], serialize_result_entry(entries[1]))])
+    assert journal.compact()
+
+    assert journaled_path.read_bytes() == appended_path.read_bytes()
+    assert not journal.journal_path.exists()
+
+
+def test_latency_history_is_only_bootstrapped_when_requested(tmp_path):
+    result_file_path = tmp_path / "non_live" / f"{VERSION_PREFIX}_simple_python_result.json"
+    result_file_path.parent.mkdir()
+    result_file_path.write_text(
+        serialize_result_entry({"id": "simple_python_0", "latency": 2.0})
+        + serialize_result_entry({"id": "simple_python_1", "latency": [[1.0, 0.5], [1.5]]})
+    )
+
+    history = LatencyHistory(tmp_path, bootstrap=False)
+    assert history.latencies == {}
+    history.record("simple_python_2", 4.0)
+    history.save()
+
+    # The saved history does not cover the older results, so the next run that needs the latencies reads them
+    assert LatencyHistory(tmp_path, bootstrap=False).latencies == {"simple_python_2": 4.0}
+    history = LatencyHistory(tmp_path)
+    assert history.latencies == {
+        "simple_python_0": 2.0,
+        "simple_python_1": 3.0,
+        "simple_python_2": 4.0,
+    }
+    history.save()
+
+    # Only the history file is read from now on
+    result_file_path.unlink()
+    assert len(LatencyHistory(tmp_path).latencies) == 3
@@ -0,0 +1,74 @@
+from copy import deepcopy
+
+import pytest
+
+from bfcl_eval.state_log import StateLogger, apply_patch, diff_states, expand_state_log
+
+
+@pytest.mark.parametrize(
+    "old, new",
+    [
+        ({"a": 1, "b": [1, 2]}, {"a": 2, "b": [1, 2]}),
+        ({"a": 1, "b": 2}, {"b": 2, "c": {"d": None}}),
+        ({"a/b": 1, "c~d": 2}, {"a/b": 3, "c~d": 4, "e/~f": 5}),
+        ({"items": [1, 2]}, {"items": [1, 2, 3, {"x": 1}]}),
+        ({"items": [1, 2, 3]}, {"items": [3]}),
+        ({"items": [{"x": 1}, {"x": 2}]}, {"items": [{"x": 1}, {"x": 3, "y": [True]}]}),
+        ({"value": 1}, {"value": "1"}),
+        ({"value": [1]}, {"value": {"0": 1}}),
+        ([1, 2], {"root": "replaced"}),
+        ({"nested": [1, {"deep": "value"}]}, {"nested": [1, {"deep": "value"}]}),
+    ],
+)
+def test_patch_round_trips(old, new):
+    old_copy = deepcopy(old)
+    operations = diff_states(old, new)
+    assert apply_patch(old, operations) == new
+    # The patch is applied to a copy
+    assert old == old_copy
+
+
+class FakeFileSystem:
+    def __init__(self) -> None:
+        self.cwd = "/"
+        self.files = {"a.txt": "a"}
+        self._cache = object()
+
+
+class FakeTicketAPI:
+    def __init__(self) -> None:
+        self.tickets = []
+
+
+def test_delta_log_expands_to_the_full_log():
+    file_system, ticket_api = FakeFileSystem(), FakeTicketAPI()
+    involved_instances = {"FakeFileSystem": file_system, "FakeTicketAPI": ticket_api}
+    full_logger = StateLogger("full")
+    delta_logger = StateLogger("delta")
+
+    def record():
+        return full_logger.record(involved_instances), delta_logger.record(involved_instances)
+
+    full_log, delta_log = [], []
+    for step in range(4):
+        full_records, delta_records = record()
+        full_log.append(full_records)
+        delta_log.append(delta_records)
+        file_system.cwd = f"/dir_{step}"
+        file_system.files[f"file/{step}.txt"] = "x" * step
+        if step == 1:
+            del file_system.files["a.txt"]
+        if step % 2:
+            ticket_api.tickets.append({"id": step, "status": "open"})
+
+    assert all(entry["role"] == "state_diff" for entry in delta_log[1])
+    # The unchanged instance gets an empty patch
+    ticket_api_entry = next(entry for entry in delta_log[3] if entry["class_name"] == "FakeTicketAPI")
+    assert ticket_api_entry["patch"] == []
+    assert expand_state_log(delta_log) == full_log
+    assert expand_state_log(full_log) == full_log
+
+
+def test_unknown_format_is_rejected():
+    with pytest.raises(ValueError):
+        StateLogger("delt")
@@ -0,0 +1,149 @@
+import time
+from typing import Optional
+
+from bfcl_eval.work_queue import WorkQueue, WorkQueueScheduler
+
+
+def make_test_cases(num_test_cases: int, depends_on: Optional[dict] = None) -> list[dict]:
+    depends_on = depends_on or {}
+    return [
+        {"id": f"simple_python_{i}", "depends_on": depends_on.get(f"simple_python_{i}", [])}
+        for i in range(num_test_cases)
+    ]
+
+
+def test_claim_follows_priority_order(tmp_path):
+    work_queue = WorkQueue(tmp_path / "queue.sqlite", model_name="model")
+    work_queue.register(make_test_cases(3))
+
+    assert [work_queue.claim() for _ in range(4)] == [
+        "simple_python_0",
+        "simple_python_1",
+        "simple_python_2",
+        None,
+    ]
+    assert work_queue.count_unfinished() == 3
+    work_queue.complete(["simple_python_0", "simple_python_1", "simple_python_2"])
+    assert work_queue.count_unfinished() == 0
+    work_queue.close()
+
+
+def test_dependents_are_claimable_once_their_dependencies_are_done(tmp_path):
+    work_queue = WorkQueue(tmp_path / "queue.sqlite", model_name="model")
+    work_queue.register(make_test_cases(2, {"simple_python_0": ["simple_python_1"]}))
+
+    assert work_queue.claim() == "simple_python_1"
+    assert work_queue.claim() is None
+    work_queue.complete(["simple_python_1"])
+    assert work_queue.claim() == "simple_python_0"
+    work_queue.close()
+
+
+def test_expired_lease_is_taken_over(tmp_path):
+    first_worker = WorkQueue(tmp_path / "queue.sqlite", model_name="model", lease_seconds=0.3)
+    second_worker = WorkQueue(tmp_path / "queue.sqlite", model_name="model", lease_seconds=0.3)
+    test_cases = make_test_cases(1)
+    first_worker.register(test_cases)
+    second_worker.register(test_cases)
+
+    assert first_worker.claim() == "simple_python_0"
+    assert second_worker.claim() is None
+    # The first worker dies, so its lease is not renewed any more
+    first_worker.close()
+    time.sleep(0.4)
+    assert second_worker.claim() == "simple_python_0"
+    assert second_worker.taken_over == 1
+    second_worker.close()
+
+
+def test_heartbeat_renews_the_leases_in_flight(tmp_path):
+    first_worker = WorkQueue(tmp_path / "queue.sqlite", model_name="model", lease_seconds=0.3)
+    second_worker = WorkQueue(tmp_path / "queue.sqlite", model_name="model", lease_seconds=0.3)
+    test_cases = make_test_cases(1)
+    first_worker.register(test_cases)
+    second_worker.register(test_cases)
+
+    assert first_worker.claim() == "simple_python_0"
+    time.sleep(0.6)
+    assert second_worker.claim() is None
+    first_worker.close()
+    second_worker.close()
+
+
+def test_claim_skips_ids_this_worker_cannot_generate(tmp_path):
+    first_worker = WorkQueue(tmp_path / "queue.sqlite", model_name="model")
+    second_worker = WorkQueue(tmp_path / "queue.sqlite", model_name="model")
+    # More unclaimable test cases ahead of the claimable one than a single batch of candidates
+    first_worker.register(make_test_cases(200))
+    second_worker.register([{"id": "simple_python_150"}])
+
+    assert second_worker.claim() == "simple_python_150"
+    assert second_worker.claim() is None
+    first_worker.close()
+    second_worker.close()
+
+
+def test_reset_done_makes_missing_results_claimable_again(tmp_path):
+    test_cases = make_test_cases(2)
+    work_queue = WorkQueue(tmp_path / "queue.sqlite", model_name="model")
+    work_queue.register(test_cases)
+    work_queue.claim()
+    work_queue.claim()
+    work_queue.complete(["simple_python_0", "simple_python_1"])
+    work_queue.close()
+
+    # Rerun with the same queue name; the result of `simple_python_1` is missing from the result file
+    work_queue = WorkQueue(tmp_path / "queue.sqlite", model_name="model")
+    work_queue.register(test_cases[1:])
+    assert work_queue.claim() is None
+    work_queue.register(test_cases[1:], reset_done=True)
+    assert work_queue.claim() == "simple_python_1"
+    work_queue.close()
+
+
+def test_scheduler_marks_test_cases_done_only_once_written(tmp_path):
+    test_cases = make_test_cases(2, {"simple_python_1": ["simple_python_0"]})
+    scheduler = WorkQueueScheduler(
+        test_cases, WorkQueue(tmp_path / "queue.sqlite", model_name="model")
+    )
+    other_worker = WorkQueue(tmp_path / "queue.sqlite", model_name="model")
+    other_worker.register(test_cases)
+
+    assert scheduler.has_ready()
+    assert scheduler.pop_ready()["id"] == "simple_python_0"
+    scheduler.mark_completed("simple_python_0")
+    # The result is not written yet, so the dependent cannot be claimed by another worker
+    assert other_worker.claim() is None
+    assert scheduler.awaiting_remote_work()
+
+    scheduler.mark_written(["simple_python_0"])
+    assert other_worker.claim() == "simple_python_1"
+    other_worker.close()
+    scheduler.close()
+
+
+def test_unfinished_count_ignores_test_cases_this_worker_cannot_claim(tmp_path):
+    first_worker = WorkQueue(tmp_path / "queue.sqlite", model_name="model")
+    second_worker = WorkQueue(tmp_path / "queue.sqlite", model_name="model")
+    # The first worker registers its test cases and exits without claiming any of them
+    first_worker.register(
+        [
+            {"id": "multi_turn_base_0", "depends_on": []},
+            {"id": "multi_turn_base_1", "depends_on": []},
+            {"id": "simple_python_1", "depends_on": ["simple_python_2"]},
+            {"id": "simple_python_2", "depends_on": []},
+        ]
+    )
+    first_worker.close()
+
+    second_worker.register([{"id": "simple_python_0"}, {"id": "simple_python_1"}])
+    # `simple_python_2` is only registered by the first worker, but `simple_python_1` waits for it
+    assert second_worker.count_unfinished() == 3
+    assert second_worker.claim() == "simple_python_0"
+    second_worker.complete(["simple_python_0"])
+    assert second_worker.count_unfinished() == 2
+    second_worker.complete(["simple_python_2"])
+    assert second_worker.claim() == "simple_python_1"
+    second_worker.complete(["simple_python_1"])
+    assert second_worker.count_unfinished() == 0
+    second_worker.close()